@@ -48,7 +48,7 @@ async def execute_action(
 ):
     """
     Send user text to ZiaBrain.
-    No old action detection. No action engine. Just brain.think().
+    No old action detection. No action engine. Just brain.athink().
     """
     print(f"🧠 ZIA BRAIN ROUTE HIT — input: {request.input_text}")
 
@@ -59,7 +59,7 @@ async def execute_action(
     brain = get_brain()
 
     try:
-        reply = brain.think(input_text)
+        reply = await brain.athink(input_text, user_id=user["id"])
     except Exception as e:
         logger.error("Brain error: %s", e, exc_info=True)
         return BrainResponse(response=f"Sorry, something went wrong: {str(e)}")
@@ -106,6 +106,49 @@ async def get_history(
     return {"items": [], "total": 0, "page": page, "per_page": per_page}
 
 
+@router.get("/fanout/{execution_id}/events")
+async def get_fanout_events(
+    execution_id: str,
+    after: str = "0-0",
+    wait_ms: int = 0,
+    user: dict = Depends(get_current_user),
+):
+    """
+    Per-recipient outcomes of a bulk WhatsApp send, oldest first. Pass the
+    returned cursor as `after` to continue; `wait_ms` long-polls (max 30s).
+    """
+    from app.services.whatsapp_fanout import get_whatsapp_fanout
+
+    page = await get_whatsapp_fanout().read_events(
+        execution_id, user["id"], after=after, block_ms=min(max(wait_ms, 0), 30_000),
+    )
+    if page is None:
+        raise HTTPException(status_code=404, detail="Fan-out not found")
+    return page
+
+
+@router.get("/search/{execution_id}/events")
+async def get_search_events(
+    execution_id: str,
+    after: str = "0-0",
+    wait_ms: int = 0,
+    user: dict = Depends(get_current_user),
+):
+    """
+    Matches of a running or finished content search (filesystem.search,
+    mode=content), oldest first. Pass the returned cursor as `after` to
+    continue; `wait_ms` long-polls (max 30s).
+    """
+    from app.services.content_search import get_content_search
+
+    page = await get_content_search().read_events(
+        execution_id, user["id"], after=after, block_ms=min(max(wait_ms, 0), 30_000),
+    )
+    if page is None:
+        raise HTTPException(status_code=404, detail="Search not found")
+    return page
+
+
 @router.get("/schemas")
 async def get_schemas(user: dict = Depends(get_current_user)):
     schemas = list_action_schemas()
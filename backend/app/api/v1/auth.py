@@ -30,6 +30,7 @@ from app.schemas.auth import (
     TokenResponse,
     UserResponse,
 )
+from app.services.auth_service import AuthService
 from app.services.google_oauth import (
     build_google_auth_url,
     exchange_code_for_tokens,
@@ -192,7 +193,13 @@ async def revoke_service(
         raise HTTPException(status_code=404, detail=f"Service '{service_name}' not found")
 
     service.status = "revoked"
-    await db.flush()
+    await AuthService(db).delete_tokens(uid, service_name)
+    await db.commit()
+
+    # Workers keep decrypted credentials cached — drop them everywhere
+    from app.services.credential_provider import credential_provider
+
+    await credential_provider.invalidate(user["id"], service_name)
 
 
 # ── Google OAuth 2.0 (Stateless) ────────────────────────
@@ -0,0 +1,64 @@
+"""
+Zia AI — Contacts API
+GET /groups, PUT /groups/{name}, DELETE /groups/{name}
+Contact groups are recipient lists for twilio.send_whatsapp_bulk.
+"""
+
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user
+from app.database import get_db
+from app.models.contact_group import ContactGroup
+from app.schemas.contact import ContactGroupRequest, ContactGroupResponse
+
+router = APIRouter()
+
+
+@router.get("/groups")
+async def list_groups(user: dict = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    result = await db.execute(
+        select(ContactGroup).where(ContactGroup.user_id == uuid.UUID(user["id"])).order_by(ContactGroup.name)
+    )
+    groups = [
+        ContactGroupResponse(name=g.name, members=g.members, updated_at=g.updated_at)
+        for g in result.scalars()
+    ]
+    return {"groups": groups, "total": len(groups)}
+
+
+@router.put("/groups/{name}", response_model=ContactGroupResponse)
+async def put_group(
+    name: str,
+    request: ContactGroupRequest,
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Create or replace a contact group."""
+    uid = uuid.UUID(user["id"])
+    result = await db.execute(
+        select(ContactGroup).where(ContactGroup.user_id == uid, ContactGroup.name == name)
+    )
+    group = result.scalar_one_or_none()
+    members = list(dict.fromkeys(request.members))
+    if group is None:
+        group = ContactGroup(user_id=uid, name=name, members=members)
+        db.add(group)
+    else:
+        group.members = members
+    await db.flush()
+    await db.refresh(group)  # updated_at is set by the database
+    return ContactGroupResponse(name=name, members=members, updated_at=group.updated_at)
+
+
+@router.delete("/groups/{name}")
+async def delete_group(name: str, user: dict = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    result = await db.execute(
+        delete(ContactGroup).where(ContactGroup.user_id == uuid.UUID(user["id"]), ContactGroup.name == name)
+    )
+    if not result.rowcount:
+        raise HTTPException(status_code=404, detail="Contact group not found")
+    return {"name": name, "status": "deleted"}
@@ -0,0 +1,48 @@
+"""
+Zia AI — File Downloads
+GET /download — serve a file that filesystem.read_file returned by
+reference because it was too large to inline.
+
+The link's token is the credential: it is signed with a key derived
+from the JWT secret (so it is useless as a bearer token), expires after FILE_DOWNLOAD_TOKEN_TTL seconds and is bound to the user,
+the path and the file's mtime (a file changed since the read answers
+410). The path is checked against the sandbox again before serving.
+
+FileResponse answers Range requests with 206 (single or multipart
+ranges), and hands the file to the server for sendfile where the ASGI
+server supports the pathsend extension; otherwise it streams in chunks.
+"""
+
+import logging
+import os
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+
+from app.core.security import decode_download_token
+from app.executors.filesystem import resolve_sandboxed
+
+logger = logging.getLogger("zia.api.files")
+
+router = APIRouter()
+
+
+@router.api_route("/download", methods=["GET", "HEAD"])
+async def download_file(token: str):
+    """Serve the file a download token was issued for (supports Range)."""
+    payload = decode_download_token(token)
+    if not payload or not payload.get("path"):
+        raise HTTPException(status_code=401, detail="Invalid or expired download link")
+
+    try:
+        resolved = resolve_sandboxed(payload["path"])
+        stat = os.stat(resolved)
+    except PermissionError:
+        raise HTTPException(status_code=403, detail="File is outside the sandbox")
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
+    if stat.st_mtime_ns != payload.get("mtime_ns"):
+        raise HTTPException(status_code=410, detail="File changed since the link was issued")
+
+    logger.info("File download user=%s path=%s", payload.get("sub"), resolved)
+    return FileResponse(resolved, filename=os.path.basename(resolved), stat_result=stat)
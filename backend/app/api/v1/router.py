@@ -9,6 +9,9 @@ from app.api.v1.actions import router as actions_router
 from app.api.v1.auth import router as auth_router
 from app.api.v1.audit import router as audit_router
 from app.api.v1.admin import router as admin_router
+from app.api.v1.contacts import router as contacts_router
+from app.api.v1.files import router as files_router
+from app.api.v1.webhooks import router as webhooks_router
 from app.api.v1.websocket import router as ws_router
 
 api_router = APIRouter()
@@ -17,4 +20,7 @@ api_router.include_router(actions_router, prefix="/actions", tags=["actions"])
 api_router.include_router(auth_router, prefix="/auth", tags=["auth"])
 api_router.include_router(audit_router, prefix="/audit", tags=["audit"])
 api_router.include_router(admin_router, prefix="/admin", tags=["admin"])
+api_router.include_router(contacts_router, prefix="/contacts", tags=["contacts"])
+api_router.include_router(files_router, prefix="/files", tags=["files"])
+api_router.include_router(webhooks_router, prefix="/webhooks", tags=["webhooks"])
 api_router.include_router(ws_router, prefix="/ws", tags=["websocket"])
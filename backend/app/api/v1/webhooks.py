@@ -0,0 +1,61 @@
+"""
+Zia AI — Provider Webhooks
+POST /twilio/status — Twilio call/message status callbacks.
+
+The handler does the minimum on the request path: verify the Twilio
+signature, XADD the callback to a Redis stream, return 204. Without both
+TWILIO_AUTH_TOKEN (an empty key would make any signature forgeable) and
+TWILIO_STATUS_CALLBACK_URL (nothing consumes the stream) it answers 404. Matching the
+callback to its action log happens in batches on the worker
+(app.services.twilio_status).
+"""
+
+import logging
+from urllib.parse import parse_qsl
+
+import redis.asyncio as aioredis
+from fastapi import APIRouter, HTTPException, Request, Response
+from twilio.request_validator import RequestValidator
+
+from app.config import settings
+from app.middleware.metrics import TWILIO_CALLBACKS
+from app.services.twilio_status import parse_callback
+
+logger = logging.getLogger("zia.api.webhooks")
+
+router = APIRouter()
+
+_validator = RequestValidator(settings.TWILIO_AUTH_TOKEN)
+_redis: aioredis.Redis | None = None
+
+
+def _get_redis() -> aioredis.Redis:
+    global _redis
+    if _redis is None:
+        _redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+@router.post("/twilio/status", status_code=204)
+async def twilio_status(request: Request):
+    """Queue a Twilio status callback for the worker."""
+    if not (settings.TWILIO_AUTH_TOKEN and settings.TWILIO_STATUS_CALLBACK_URL):
+        raise HTTPException(status_code=404, detail="Twilio status callbacks are not enabled")
+
+    params = dict(parse_qsl((await request.body()).decode()))
+    # Twilio signs the public URL it called, which differs from request.url behind a proxy
+    url = settings.TWILIO_STATUS_CALLBACK_URL
+    if not _validator.validate(url, params, request.headers.get("X-Twilio-Signature", "")):
+        TWILIO_CALLBACKS.labels(outcome="rejected").inc()
+        raise HTTPException(status_code=403, detail="Invalid Twilio signature")
+
+    entry = parse_callback(params)
+    if entry is None:
+        TWILIO_CALLBACKS.labels(outcome="ignored").inc()
+        return Response(status_code=204)
+
+    await _get_redis().xadd(
+        settings.TWILIO_STATUS_STREAM, entry, maxlen=settings.TWILIO_STATUS_STREAM_MAXLEN, approximate=True,
+    )
+    TWILIO_CALLBACKS.labels(outcome="accepted").inc()
+    return Response(status_code=204)
@@ -55,6 +55,23 @@ class Settings(BaseSettings):
     TWILIO_AUTH_TOKEN: str = ""
     TWILIO_PHONE_NUMBER: str = ""
     TWILIO_WHATSAPP_NUMBER: str = ""
+    TWILIO_HTTP_POOL_LIMIT: int = 100  # open connections to Twilio, per worker process
+    TWILIO_HTTP_LIMIT_PER_HOST: int = 20  # ... of which to any one Twilio host
+    TWILIO_HTTP_KEEPALIVE: int = 60  # seconds an idle connection is kept for reuse
+    TWILIO_HTTP_TIMEOUT: float = 15.0  # seconds per Twilio API request
+    TWILIO_STATUS_CALLBACK_URL: str = ""  # public URL of /api/v1/webhooks/twilio/status; "" = no callbacks
+    TWILIO_STATUS_STREAM: str = "zia:twilio:status"
+    TWILIO_STATUS_STREAM_MAXLEN: int = 100_000  # approximate cap on unconsumed + consumed entries
+    TWILIO_STATUS_BATCH_SIZE: int = 500  # callbacks applied per database round trip
+    TWILIO_STATUS_RETRY_AFTER: int = 30  # seconds before a callback with no matching row is retried
+    TWILIO_STATUS_MAX_DELIVERIES: int = 5  # ... and how often, before it is dropped
+
+    # ── WhatsApp fan-out (twilio.send_whatsapp_bulk) ──
+    WHATSAPP_FANOUT_CONCURRENCY: int = 10  # sends in flight per fan-out
+    WHATSAPP_SEND_RATE: float = 10.0  # sustained messages/s per sender number, per worker
+    WHATSAPP_SEND_BURST: int = 10
+    WHATSAPP_FANOUT_MAX_RECIPIENTS: int = 500
+    WHATSAPP_FANOUT_STATE_TTL: int = 86400  # seconds progress is kept for resume/streaming
 
     # ── Security ──
     RATE_LIMIT_PER_MINUTE: int = 60
@@ -64,11 +81,74 @@ class Settings(BaseSettings):
     # ── Worker ──
     WORKER_MAX_JOBS: int = 10
     WORKER_JOB_TIMEOUT: int = 300
+    WORKER_QUEUE_NAME: str = "zia:tasks:default"  # run one worker per queue (high/default/low)
 
     # ── Groq (Zia Brain) ──
     GROQ_API_KEY: str = ""
     GROQ_MODEL: str = "llama-3.3-70b-versatile"
 
+    # ── Long-term memory recall ──
+    MEMORY_RECALL_BUDGET_MS: int = 150  # recall misses this deadline → skipped
+    MEMORY_RECALL_LIMIT: int = 3
+
+    # ── Tool result cache ──
+    TOOL_CACHE_MAX_ENTRIES: int = 512
+    TOOL_CACHE_SHARED: bool = False  # share cached results across workers via REDIS_URL
+
+    # ── Brain tool execution ──
+    TOOL_EXECUTION_MODE: str = "local"  # local (in the API process) | arq (on workers)
+    TOOL_DISPATCH_TIMEOUT: int = 60  # seconds, queue wait + run, arq mode only
+
+    # ── Browser (Chrome driver pool) ──
+    BROWSER_POOL_SIZE: int = 2
+    BROWSER_HEADLESS: bool = False
+    BROWSER_MAX_USES: int = 50  # leases before a driver is recycled
+    BROWSER_HEALTH_INTERVAL: int = 60  # seconds between idle-driver health checks
+    BROWSER_PREWARM: bool = False  # start every session at API/worker startup
+    BROWSER_STEP_TIMEOUT: int = 10  # seconds per page step (result visible, video ready, ...)
+    BROWSER_HEARTBEAT_INTERVAL: int = 0  # seconds; >0 probes the YouTube session between calls
+
+    # ── Gmail ──
+    GMAIL_PAGE_SIZE: int = 50  # messages per list call + metadata batch (max 100)
+    GMAIL_SERVICE_CACHE_SIZE: int = 128  # per-user Gmail API clients kept in memory
+    GMAIL_REFRESH_MARGIN: int = 300  # refresh access tokens this many seconds before expiry
+    GMAIL_IO_THREADS: int = 8  # threads for blocking Gmail API calls, per process
+    GMAIL_MIRROR_ENABLED: bool = True  # serve inbox reads from the Redis header mirror
+    GMAIL_MIRROR_MAX_MESSAGES: int = 500  # newest messages mirrored per user
+    GMAIL_MIRROR_SYNC_INTERVAL: int = 30  # seconds a mirror is served without asking Gmail
+
+    # ── Outbound mail queue (worker) ──
+    MAIL_BATCH_SIZE: int = 10  # emails per Gmail batch send request
+    MAIL_BATCH_WINDOW_MS: int = 50  # how long a user's queue waits for more mail before sending
+    MAIL_USER_RATE: float = 1.0  # sustained emails/s per user (token bucket refill)
+    MAIL_USER_BURST: int = 10  # emails a user can send back-to-back
+    MAIL_PROVIDER_RATE: float = 20.0  # sustained emails/s per provider, all users of a worker
+    MAIL_PROVIDER_BURST: int = 50
+    MAIL_MAX_RETRIES: int = 3  # re-sends of a rate-limited (429) email, with backoff
+    MAIL_BULK_MAX_MESSAGES: int = 100  # emails accepted by one gmail.send_bulk action
+
+    # ── Filesystem search (file catalog) ──
+    FILE_CATALOG_ENABLED: bool = True  # index the sandbox roots for filesystem.search
+    FILE_CATALOG_PATH: str = "~/.zia/file_catalog.db"  # SQLite file, shared by the workers on a host
+    FILE_CATALOG_RESCAN_INTERVAL: int = 60  # seconds between rescans of changed directories
+    FILE_CATALOG_FULL_RESCAN_INTERVAL: int = 3600  # seconds between rescans that relist every directory
+    FILE_SEARCH_DEADLINE: float = 5.0  # seconds a name search may walk the disk; then partial results + cursor
+    FILE_SEARCH_EXTRA_IGNORED: str = ""  # comma-separated directory names never searched or indexed
+    FILE_SEARCH_PROCESSES: int = 0  # content-search processes per worker; 0 = CPU count (max 8)
+    FILE_CONTENT_MAX_BYTES: int = 10_000_000  # larger files are skipped by content search
+    FILE_CONTENT_SEARCH_DEADLINE: float = 10.0  # seconds; the matches found so far are returned after this
+    FILE_SEARCH_MAX_RESULTS: int = 200  # upper bound on a search's `limit`
+    FILE_SEARCH_EVENTS_TTL: int = 3600  # seconds streamed content matches are kept
+
+    # ── Filesystem reads ──
+    FILE_READ_INLINE_MAX_BYTES: int = 256 * 1024  # larger reads return a download link instead of content
+    FILE_READ_MAX_LINES: int = 2000  # default and maximum line window of one read
+    FILE_DOWNLOAD_TOKEN_TTL: int = 300  # seconds a download link stays valid
+
+    # ── YouTube resolver ──
+    YOUTUBE_BASE_URL: str = "https://www.youtube.com"  # point at a stub server for testing
+    YOUTUBE_RESOLVE_TTL: int = 3600  # seconds a query → video id mapping is cached
+
     model_config = {"env_file": str(_ENV_FILE), "env_file_encoding": "utf-8"}
 
 
@@ -27,6 +27,16 @@ ACTION_REGISTRY: dict[str, ActionSchema] = {
         optional_params=["limit", "query"],
         executor="gmail",
     ),
+    "gmail.send_bulk": ActionSchema(
+        action_type="gmail.send_bulk",
+        display_name="Send Emails",
+        description="Send a list of emails via the paced outbound mail queue",
+        risk_level=RiskLevel.HIGH,
+        requires_confirmation=True,
+        required_params=["messages"],  # [{recipient, subject, body}, ...]
+        executor="gmail",
+        max_daily_executions=10,
+    ),
 
     # ── Twilio Voice ──
     "twilio.make_call": ActionSchema(
@@ -52,6 +62,17 @@ ACTION_REGISTRY: dict[str, ActionSchema] = {
         required_params=["recipient", "content"],
         executor="twilio_whatsapp",
     ),
+    "twilio.send_whatsapp_bulk": ActionSchema(
+        action_type="twilio.send_whatsapp_bulk",
+        display_name="Send WhatsApp Broadcast",
+        description="Send one WhatsApp message to a recipient list or contact group",
+        risk_level=RiskLevel.HIGH,
+        requires_confirmation=True,
+        required_params=["content"],
+        optional_params=["recipients", "group"],  # at least one of them
+        executor="twilio_whatsapp",
+        max_daily_executions=10,
+    ),
 
     # ── Filesystem ──
     "filesystem.read_file": ActionSchema(
@@ -61,6 +82,7 @@ ACTION_REGISTRY: dict[str, ActionSchema] = {
         risk_level=RiskLevel.LOW,
         requires_confirmation=False,
         required_params=["path"],
+        optional_params=["offset", "length", "start_line", "max_lines"],
         executor="filesystem",
     ),
     "filesystem.search": ActionSchema(
@@ -69,8 +91,8 @@ ACTION_REGISTRY: dict[str, ActionSchema] = {
         description="Search for files by name or content",
         risk_level=RiskLevel.LOW,
         requires_confirmation=False,
-        required_params=["query"],
-        optional_params=["directory", "extension"],
+        required_params=["query"],  # content mode: a string or a list of alternatives
+        optional_params=["directory", "extension", "mode", "limit", "cursor"],  # mode: name | content
         executor="filesystem",
     ),
     "filesystem.open_file": ActionSchema(
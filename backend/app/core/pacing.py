@@ -0,0 +1,32 @@
+"""
+Zia AI — Send Pacing
+Token buckets shared by the outbound mail queue and the WhatsApp fan-out.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def take(self, n: int = 1) -> float:
+        """Wait until `n` tokens are available and consume them; returns seconds waited."""
+        n = min(n, self.capacity)
+        start = time.monotonic()
+        async with self._lock:  # FIFO: one waiter refills at a time
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= n:
+                    self._tokens -= n
+                    return now - start
+                await asyncio.sleep((n - self._tokens) / self.rate)
@@ -3,6 +3,8 @@ Zia AI — Security Module
 JWT creation/validation, password hashing, and RBAC helpers.
 """
 
+import hashlib
+import hmac
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -53,6 +55,35 @@ def create_refresh_token(user_id: str) -> str:
     return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
 
+def _download_key() -> str:
+    # Derived key: download links end up in URLs and logs, so their tokens
+    # must not validate as access tokens (get_current_user doesn't check "type")
+    return hmac.new(settings.JWT_SECRET.encode(), b"file_download", hashlib.sha256).hexdigest()
+
+
+def create_download_token(user_id: str, path: str, mtime_ns: int) -> str:
+    """Create a short-lived token for one file download (filesystem.read_file by reference)."""
+    expires = datetime.utcnow() + timedelta(seconds=settings.FILE_DOWNLOAD_TOKEN_TTL)
+    payload = {
+        "sub": user_id,
+        "type": "file_download",
+        "path": path,
+        "mtime_ns": mtime_ns,
+        "exp": expires,
+        "iat": datetime.utcnow(),
+    }
+    return jwt.encode(payload, _download_key(), algorithm=settings.JWT_ALGORITHM)
+
+
+def decode_download_token(token: str) -> Optional[dict]:
+    """Decode and validate a download token. Returns payload or None."""
+    try:
+        payload = jwt.decode(token, _download_key(), algorithms=[settings.JWT_ALGORITHM])
+    except JWTError:
+        return None
+    return payload if payload.get("type") == "file_download" else None
+
+
 def decode_token(token: str) -> Optional[dict]:
     """Decode and validate a JWT. Returns payload or None."""
     try:
@@ -0,0 +1,78 @@
+"""
+Zia AI — Brain Tool Dispatch via ARQ
+Runs brain tool calls on worker nodes instead of inside the API process.
+
+With TOOL_EXECUTION_MODE=arq, ToolRegistry.aexecute() validates arguments
+locally, then hands the call to ArqToolDispatcher: the call is enqueued as
+an `execute_tool_task` job on the queue matching the tool's risk level
+(ActionEngine.get_queue_for_risk) and its result is awaited with a
+deadline. Jobs that are still queued when the deadline passes expire and
+never run.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+from arq import create_pool
+from arq.connections import ArqRedis, RedisSettings
+
+from app.core.action_engine import ActionEngine
+from app.middleware.metrics import TOOL_CALL_COUNT, TOOL_DISPATCH_LATENCY
+from app.schemas.action import RiskLevel
+
+logger = logging.getLogger("zia.dispatch")
+
+
+class ArqToolDispatcher:
+    """Enqueue brain tool calls as ARQ jobs and await their results."""
+
+    def __init__(self, redis_url: str, timeout: float):
+        self.redis_url = redis_url
+        self.timeout = timeout
+        self._pool: Optional[ArqRedis] = None
+        self._pool_lock = asyncio.Lock()
+
+    async def get_pool(self) -> ArqRedis:
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    self._pool = await create_pool(RedisSettings.from_dsn(self.redis_url))
+        return self._pool
+
+    async def dispatch(self, tool, arguments: dict[str, Any], user_id: str) -> dict:
+        """
+        Run `tool` (a BaseTool or ToolSpec) on a worker.
+        Returns the tool's result dict, or an error dict on timeout/failure.
+        """
+        queue = ActionEngine.get_queue_for_risk(RiskLevel(tool.risk_level))
+        start = time.perf_counter()
+        try:
+            pool = await self.get_pool()
+            job = await pool.enqueue_job(
+                "execute_tool_task",
+                tool.name,
+                arguments,
+                user_id,
+                _queue_name=queue,
+                _expires=self.timeout,
+            )
+            result = await job.result(timeout=self.timeout, poll_delay=0.05)
+        except asyncio.TimeoutError:
+            logger.error("Tool %s not completed on %s within %.0fs", tool.name, queue, self.timeout)
+            TOOL_CALL_COUNT.labels(tool.name, "timeout").inc()
+            return {"error": f"{tool.name} timed out after {self.timeout:g}s"}
+        except Exception as e:
+            logger.error("Dispatch of %s to %s failed: %s", tool.name, queue, e)
+            TOOL_CALL_COUNT.labels(tool.name, "error").inc()
+            return {"error": f"{tool.name} failed: {e}"}
+        finally:
+            TOOL_DISPATCH_LATENCY.labels(tool.name, queue).observe(time.perf_counter() - start)
+
+        return result
+
+    async def close(self):
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
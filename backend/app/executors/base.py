@@ -4,8 +4,13 @@ Abstract base class all executors must implement.
 """
 
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from typing import Any, Dict, List
 
+# Execution id of the action job being run, set by the worker for executors
+# that record per-item outcomes in the action log.
+current_execution_id: ContextVar[str] = ContextVar("current_execution_id", default="")
+
 
 class BaseExecutor(ABC):
     """Base class for all action executors."""
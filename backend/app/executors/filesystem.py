@@ -3,11 +3,17 @@ Zia AI — Filesystem Executor
 Read, search, and open local files (sandboxed).
 """
 
-import glob
+import asyncio
 import os
+import time
 from typing import Any, Dict, List
 
-from app.executors.base import BaseExecutor
+from app.config import settings
+from app.core.security import create_download_token
+from app.executors.base import BaseExecutor, current_execution_id
+from app.middleware.metrics import FILE_READS, FILE_SEARCH_LATENCY
+from app.services.file_catalog import get_file_catalog
+from app.services.file_walk import decode_cursor, encode_cursor, search_tree
 
 # Sandbox: only allow access under these paths
 ALLOWED_ROOTS = [
@@ -18,6 +24,17 @@ ALLOWED_ROOTS = [
 BLOCKED_EXTENSIONS = {".exe", ".bat", ".cmd", ".ps1", ".vbs", ".msi"}
 
 
+def resolve_sandboxed(path: str) -> str:
+    """Resolve path and check it is inside the sandbox; raises PermissionError."""
+    resolved = os.path.realpath(path)
+    if not any(resolved.startswith(root) for root in ALLOWED_ROOTS):
+        raise PermissionError(f"Access denied: {path} is outside sandbox")
+    _, ext = os.path.splitext(resolved)
+    if ext.lower() in BLOCKED_EXTENSIONS:
+        raise PermissionError(f"Blocked extension: {ext}")
+    return resolved
+
+
 class FilesystemExecutor(BaseExecutor):
     def get_supported_actions(self) -> List[str]:
         return ["filesystem.read_file", "filesystem.search", "filesystem.open_file"]
@@ -27,10 +44,12 @@ class FilesystemExecutor(BaseExecutor):
     ) -> Dict[str, Any]:
         if action_type == "filesystem.read_file":
             self.validate_params(action_type, params, ["path"])
-            return self._read_file(params["path"])
+            return await asyncio.to_thread(self._read_file, params, user_id)
         elif action_type == "filesystem.search":
             self.validate_params(action_type, params, ["query"])
-            return self._search(params)
+            if params.get("mode", "name") == "content":
+                return await self._search_content(params, user_id)
+            return await asyncio.to_thread(self._search, params)
         elif action_type == "filesystem.open_file":
             self.validate_params(action_type, params, ["path"])
             return self._open_file(params["path"])
@@ -38,34 +57,165 @@ class FilesystemExecutor(BaseExecutor):
 
     def _check_path(self, path: str) -> str:
         """Resolve and validate path is within sandbox."""
-        resolved = os.path.realpath(path)
-        if not any(resolved.startswith(root) for root in ALLOWED_ROOTS):
-            raise PermissionError(f"Access denied: {path} is outside sandbox")
-        _, ext = os.path.splitext(resolved)
-        if ext.lower() in BLOCKED_EXTENSIONS:
-            raise PermissionError(f"Blocked extension: {ext}")
-        return resolved
-
-    def _read_file(self, path: str) -> Dict:
+        return resolve_sandboxed(path)
+
+    def _read_file(self, params: Dict, user_id: str) -> Dict:
+        """
+        Read a byte range (offset/length, default the whole file) or a line
+        window (start_line/max_lines). Content up to FILE_READ_INLINE_MAX_BYTES
+        is returned inline; a larger byte range comes back as a signed
+        download link, so big payloads never pass through Redis and JSON.
+        """
+        path = params["path"]
         resolved = self._check_path(path)
         if not os.path.isfile(resolved):
             return {"error": f"Not a file: {path}"}
-        size = os.path.getsize(resolved)
-        if size > 1_000_000:  # 1MB limit
-            return {"error": "File too large (>1MB)", "size": size}
-        with open(resolved, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read()
-        return {"status": "read", "path": resolved, "size": size, "content": content}
+        stat = os.stat(resolved)
+        size = stat.st_size
+
+        if params.get("start_line") is not None or params.get("max_lines") is not None:
+            return self._read_lines(resolved, size, params)
+
+        offset = min(max(int(params.get("offset") or 0), 0), size)
+        length = params.get("length")
+        end = size if length is None else min(size, offset + max(int(length), 0))
+        result = {"status": "read", "path": resolved, "size": size, "offset": offset, "length": end - offset}
+
+        if end - offset > settings.FILE_READ_INLINE_MAX_BYTES:
+            token = create_download_token(user_id, resolved, stat.st_mtime_ns)
+            result["download"] = {
+                "url": f"/api/v1/files/download?token={token}",
+                "expires_in": settings.FILE_DOWNLOAD_TOKEN_TTL,
+            }
+            if (offset, end) != (0, size):
+                result["download"]["range"] = f"bytes={offset}-{end - 1}"  # send as the Range header
+            FILE_READS.labels(delivery="reference").inc()
+            return result
+
+        with open(resolved, "rb") as f:
+            f.seek(offset)
+            result["content"] = f.read(end - offset).decode("utf-8", errors="replace")
+        FILE_READS.labels(delivery="inline").inc()
+        return result
+
+    def _read_lines(self, resolved: str, size: int, params: Dict) -> Dict:
+        """Lines start_line.. (1-based), at most max_lines and FILE_READ_INLINE_MAX_BYTES."""
+        start = max(int(params.get("start_line") or 1), 1)
+        count = min(int(params.get("max_lines") or settings.FILE_READ_MAX_LINES), settings.FILE_READ_MAX_LINES)
+        budget = settings.FILE_READ_INLINE_MAX_BYTES
+        chunks: List[bytes] = []
+        taken, used, eof, truncated = 0, 0, True, False
+
+        with open(resolved, "rb") as f:
+            line_no = self._seek_line(f, start)
+            while True:
+                # Bounded readline: a huge line without newlines can't fill memory.
+                # A chunk shorter than the bound ends in a newline or at EOF.
+                chunk = f.readline(budget + 1)
+                if not chunk:
+                    break
+                if line_no >= start:
+                    if taken >= count:
+                        eof = False
+                        break
+                    if used + len(chunk) > budget:
+                        chunks.append(chunk[:budget - used])
+                        eof, truncated = False, True
+                        break
+                    chunks.append(chunk)
+                    used += len(chunk)
+                    taken += 1
+                if chunk.endswith(b"\n"):
+                    line_no += 1
+
+        FILE_READS.labels(delivery="lines").inc()
+        return {
+            "status": "read",
+            "path": resolved,
+            "size": size,
+            "start_line": start,
+            "line_count": taken,
+            "content": b"".join(chunks).decode("utf-8", errors="replace"),
+            "eof": eof,
+            "truncated": truncated,
+        }
+
+    @staticmethod
+    def _seek_line(f, line: int) -> int:
+        """Position f at the start of a 1-based line by counting newlines in 1 MB blocks."""
+        line_no, offset = 1, 0
+        while line_no < line:
+            block = f.read(1 << 20)
+            if not block:
+                break
+            newlines = block.count(b"\n")
+            if line_no + newlines < line:
+                line_no += newlines
+                offset += len(block)
+                continue
+            end = -1
+            for _ in range(line - line_no):
+                end = block.index(b"\n", end + 1)
+            line_no = line
+            offset += end + 1
+        f.seek(offset)
+        return line_no
 
     def _search(self, params: Dict) -> Dict:
+        """
+        Name search, one page of `limit` matches. Pass the returned
+        next_cursor as `cursor` for the next page; it is None on the last.
+        """
         query = params["query"]
         directory = params.get("directory", os.path.expanduser("~"))
         extension = params.get("extension", "*")
         directory = self._check_path(directory)
+        limit = self._limit(params)
+        cursor = decode_cursor(params.get("cursor"))
+        start = time.perf_counter()
+
+        # Served from the file catalog once it has indexed this directory
+        # (a walk that is already paging keeps walking)
+        catalog = get_file_catalog()
+        if catalog is not None and catalog.covers(directory) and cursor.get("source") != "walk":
+            matches, match, after_id = catalog.search(
+                query, directory, extension, limit=limit, after_id=int(cursor.get("after") or 0),
+            )
+            FILE_SEARCH_LATENCY.labels(source="catalog").observe(time.perf_counter() - start)
+            return {"status": "search_complete", "matches": matches, "count": len(matches),
+                    "match": match, "next_cursor": encode_cursor("catalog", after_id) if after_id else None}
+        if cursor.get("source") == "catalog":
+            raise ValueError("Search cursor expired; start the search again")
+
+        found = search_tree(directory, query, extension, limit=limit,
+                            deadline_s=settings.FILE_SEARCH_DEADLINE, after=cursor.get("after"))
+        FILE_SEARCH_LATENCY.labels(source="walk").observe(time.perf_counter() - start)
+        return {"status": "search_complete", "matches": found["matches"], "count": len(found["matches"]),
+                "timed_out": found["timed_out"], "next_cursor": found["next_cursor"]}
+
+    @staticmethod
+    def _limit(params: Dict) -> int:
+        return max(1, min(int(params.get("limit") or 50), settings.FILE_SEARCH_MAX_RESULTS))
+
+    async def _search_content(self, params: Dict, user_id: str) -> Dict:
+        """Files whose text contains the query (or any of a list of queries)."""
+        from app.services.content_search import get_content_search
+
+        query = params["query"]
+        patterns = [query] if isinstance(query, str) else [str(q) for q in query if q]
+        if not patterns:
+            raise ValueError("query must be a string or a list of strings")
+        directory = self._check_path(params.get("directory", os.path.expanduser("~")))
+        limit = self._limit(params)
+        start = time.perf_counter()
 
-        pattern = os.path.join(directory, "**", f"*{query}*.{extension}")
-        matches = glob.glob(pattern, recursive=True)[:50]
-        return {"status": "search_complete", "matches": matches, "count": len(matches)}
+        result = await get_content_search().search(
+            patterns, directory, params.get("extension", "*"), limit=limit,
+            deadline_s=settings.FILE_CONTENT_SEARCH_DEADLINE,
+            execution_id=current_execution_id.get() or None, user_id=user_id,
+        )
+        FILE_SEARCH_LATENCY.labels(source="content").observe(time.perf_counter() - start)
+        return result
 
     def _open_file(self, path: str) -> Dict:
         resolved = self._check_path(path)
@@ -1,29 +1,27 @@
 """
 Zia AI — Gmail Executor
 Send and read emails via Gmail API with OAuth2.
+Credentials are the user's stored tokens (app.services.credential_provider),
+or token.json while the user has none stored;
+blocking googleapiclient calls run on the Gmail I/O pool, off the event loop.
+Sends go through the worker's outbound mail queue (app.services.mail_outbox).
 """
 
-import base64
-import os
-from email.mime.text import MIMEText
+import uuid
 from typing import Any, Dict, List
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-
-from app.executors.base import BaseExecutor
-
-SCOPES = ["https://www.googleapis.com/auth/gmail.send",
-           "https://www.googleapis.com/auth/gmail.readonly"]
+from app.config import settings
+from app.executors.base import BaseExecutor, current_execution_id
+from app.services.mail_outbox import get_mail_outbox
+from tools.gmail_mirror import read_inbox_cached
+from tools.gmail_service import get_user_gmail_service, run_gmail_io
 
 
 class GmailExecutor(BaseExecutor):
     """Gmail send/read executor using Google API."""
 
     def get_supported_actions(self) -> List[str]:
-        return ["gmail.send_email", "gmail.read_inbox"]
+        return ["gmail.send_email", "gmail.send_bulk", "gmail.read_inbox"]
 
     async def execute(
         self, action_type: str, params: Dict[str, Any], user_id: str
@@ -31,67 +29,43 @@ class GmailExecutor(BaseExecutor):
         if action_type == "gmail.send_email":
             self.validate_params(action_type, params, ["recipient", "subject", "body"])
             return await self._send_email(params, user_id)
+        elif action_type == "gmail.send_bulk":
+            self.validate_params(action_type, params, ["messages"])
+            return await self._send_bulk(params, user_id)
         elif action_type == "gmail.read_inbox":
             return await self._read_inbox(params, user_id)
         raise ValueError(f"Unsupported action: {action_type}")
 
     async def _send_email(self, params: Dict, user_id: str) -> Dict:
-        service = self._get_service(user_id)
-        message = MIMEText(params["body"])
-        message["to"] = params["recipient"]
-        message["subject"] = params["subject"]
-
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-        service.users().messages().send(userId="me", body={"raw": raw}).execute()
+        [result] = await get_mail_outbox().submit(user_id, [params], _execution_id())
+        if result["status"] != "sent":
+            raise RuntimeError(f"Email to {params['recipient']} failed: {result['error']}")
         return {"status": "email_sent", "to": params["recipient"]}
 
+    async def _send_bulk(self, params: Dict, user_id: str) -> Dict:
+        messages = params["messages"]
+        if len(messages) > settings.MAIL_BULK_MAX_MESSAGES:
+            raise ValueError(f"At most {settings.MAIL_BULK_MAX_MESSAGES} emails per bulk send")
+        for i, message in enumerate(messages):
+            self.validate_params(f"messages[{i}]", message, ["recipient", "subject", "body"])
+
+        results = await get_mail_outbox().submit(user_id, messages, _execution_id(), source="macro")
+        sent = sum(r["status"] == "sent" for r in results)
+        return {
+            "status": "bulk_sent" if sent == len(results) else "bulk_partial",
+            "sent": sent,
+            "failed": len(results) - sent,
+            "results": results,
+        }
+
     async def _read_inbox(self, params: Dict, user_id: str) -> Dict:
-        service = self._get_service(user_id)
+        service = await get_user_gmail_service(user_id)
         limit = params.get("limit", 10)
         query = params.get("query", "")
 
-        results = (
-            service.users()
-            .messages()
-            .list(userId="me", maxResults=limit, q=query)
-            .execute()
-        )
-        messages = results.get("messages", [])
-
-        emails = []
-        for msg in messages[:limit]:
-            detail = (
-                service.users().messages().get(userId="me", id=msg["id"]).execute()
-            )
-            headers = {
-                h["name"]: h["value"]
-                for h in detail["payload"]["headers"]
-                if h["name"] in ("From", "Subject", "Date")
-            }
-            emails.append(headers)
-
+        emails = await run_gmail_io(read_inbox_cached, service, user_id, query, limit)
         return {"status": "inbox_read", "count": len(emails), "emails": emails}
 
-    def _get_service(self, user_id: str):
-        """Get authenticated Gmail service.
-        In production, tokens are loaded from encrypted DB per user.
-        This fallback uses token.json for local development.
-        """
-        creds = None
-        if os.path.exists("token.json"):
-            creds = Credentials.from_authorized_user_file("token.json", SCOPES)
-
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                if not os.path.exists("client_secret.json"):
-                    raise FileNotFoundError("Missing client_secret.json")
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    "client_secret.json", SCOPES
-                )
-                creds = flow.run_local_server(port=0)
-            with open("token.json", "w") as f:
-                f.write(creds.to_json())
 
-        return build("gmail", "v1", credentials=creds)
+def _execution_id() -> str:
+    return current_execution_id.get() or str(uuid.uuid4())
@@ -1,15 +1,17 @@
 """
 Zia AI — Twilio Voice Executor
-Make outgoing voice calls via Twilio.
+Make outgoing voice calls via Twilio, using the shared async client
+(app.services.twilio_client). Calls are logged with their SID so status
+callbacks can update them (app.services.twilio_status).
 """
 
-import os
+import uuid
 from typing import Any, Dict, List
 
-from twilio.rest import Client
-
 from app.config import settings
-from app.executors.base import BaseExecutor
+from app.executors.base import BaseExecutor, current_execution_id
+from app.services.twilio_client import get_twilio_client
+from app.services.twilio_status import record_twilio_sends, status_callback_kwargs
 
 
 class TwilioVoiceExecutor(BaseExecutor):
@@ -21,12 +23,18 @@ class TwilioVoiceExecutor(BaseExecutor):
     ) -> Dict[str, Any]:
         self.validate_params(action_type, params, ["recipient"])
 
-        client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+        client = await get_twilio_client()
         message = params.get("message", "Hello, this is Zia AI calling on behalf of a user.")
 
-        call = client.calls.create(
+        call = await client.calls.create_async(
             twiml=f"<Response><Say voice='alice'>{message}</Say></Response>",
             to=params["recipient"],
             from_=settings.TWILIO_PHONE_NUMBER,
+            **status_callback_kwargs("call"),
         )
+        await record_twilio_sends(user_id, action_type, "high", [{
+            "execution_id": current_execution_id.get() or str(uuid.uuid4()),
+            "params": {"recipient": params["recipient"]},
+            "sid": call.sid,
+        }])
         return {"status": "call_initiated", "call_sid": call.sid}
@@ -1,32 +1,82 @@
 """
 Zia AI — Twilio WhatsApp Executor
-Send WhatsApp messages via Twilio Sandbox or Business API.
+Send WhatsApp messages via Twilio Sandbox or Business API, using the
+shared async client (app.services.twilio_client). Bulk sends fan out
+through app.services.whatsapp_fanout. Messages are logged with their SID
+so status callbacks can update them (app.services.twilio_status).
 """
 
+import uuid
 from typing import Any, Dict, List
 
-from twilio.rest import Client
+from sqlalchemy import select
 
 from app.config import settings
-from app.executors.base import BaseExecutor
+from app.executors.base import BaseExecutor, current_execution_id
+from app.services.twilio_client import get_twilio_client
+from app.services.twilio_status import record_twilio_sends, status_callback_kwargs
+from app.services.whatsapp_fanout import get_whatsapp_fanout
 
 
 class TwilioWhatsAppExecutor(BaseExecutor):
     def get_supported_actions(self) -> List[str]:
-        return ["twilio.send_whatsapp"]
+        return ["twilio.send_whatsapp", "twilio.send_whatsapp_bulk"]
 
     async def execute(
         self, action_type: str, params: Dict[str, Any], user_id: str
     ) -> Dict[str, Any]:
+        if action_type == "twilio.send_whatsapp_bulk":
+            self.validate_params(action_type, params, ["content"])
+            return await self._send_bulk(params, user_id)
+
         self.validate_params(action_type, params, ["recipient", "content"])
 
-        client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+        client = await get_twilio_client()
         from_num = f"whatsapp:{settings.TWILIO_WHATSAPP_NUMBER}"
         to_num = params["recipient"]
         if not to_num.startswith("whatsapp:"):
             to_num = f"whatsapp:{to_num}"
 
-        message = client.messages.create(
-            body=params["content"], from_=from_num, to=to_num
+        message = await client.messages.create_async(
+            body=params["content"], from_=from_num, to=to_num, **status_callback_kwargs("message")
         )
+        await record_twilio_sends(user_id, action_type, "medium", [{
+            "execution_id": current_execution_id.get() or str(uuid.uuid4()),
+            "params": {"recipient": params["recipient"]},
+            "sid": message.sid,
+        }])
         return {"status": "whatsapp_sent", "message_sid": message.sid}
+
+    async def _send_bulk(self, params: Dict, user_id: str) -> Dict:
+        recipients = params.get("recipients") or []
+        if params.get("group"):
+            recipients = [*recipients, *await self._group_members(user_id, params["group"])]
+        if not recipients:
+            raise ValueError("Missing required parameters: recipients or group")
+        if len(recipients) > settings.WHATSAPP_FANOUT_MAX_RECIPIENTS:
+            raise ValueError(f"At most {settings.WHATSAPP_FANOUT_MAX_RECIPIENTS} recipients per bulk send")
+
+        return await get_whatsapp_fanout().run(
+            await get_twilio_client(),
+            execution_id=current_execution_id.get() or str(uuid.uuid4()),
+            user_id=user_id,
+            sender=settings.TWILIO_WHATSAPP_NUMBER,
+            recipients=recipients,
+            content=params["content"],
+        )
+
+    @staticmethod
+    async def _group_members(user_id: str, name: str) -> List[str]:
+        from app.database import async_session
+        from app.models.contact_group import ContactGroup
+
+        async with async_session() as db:
+            result = await db.execute(
+                select(ContactGroup.members).where(
+                    ContactGroup.user_id == uuid.UUID(user_id), ContactGroup.name == name,
+                )
+            )
+            members = result.scalar_one_or_none()
+        if members is None:
+            raise ValueError(f"Unknown contact group: {name}")
+        return members
@@ -4,6 +4,7 @@ Production-grade middleware stack, lifespan management, route mounting,
 and Zia Brain (Groq LLM) integration.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -21,17 +22,29 @@ from app.middleware.metrics import PrometheusMiddleware, metrics_endpoint
 from core.memory import ShortTermMemory
 from core.brain import ZiaBrain
 from tools.base_tool import ToolRegistry
-from tools.email_tool import EmailTool
-from tools.os_tool import OpenFileTool, LaunchAppTool
-from tools.browser_tool import YouTubeTool, YouTubeControlTool
+from tools.result_cache import ToolResultCache
+from tools.manifest import BRAIN_TOOLS
+from tools.driver_pool import get_driver_pool, shutdown_driver_pool
+from app.core.tool_dispatch import ArqToolDispatcher
 
 # ── Zia Brain singleton (shared across all requests) ──
-_registry = ToolRegistry()
-_registry.register(EmailTool())
-_registry.register(OpenFileTool())
-_registry.register(LaunchAppTool())
-_registry.register(YouTubeTool())
-_registry.register(YouTubeControlTool())
+# Tools are registered lazily: the system prompt is built from the static
+# manifest, and selenium/googleapiclient are imported on first use only.
+# In arq mode tools never load here: calls run on ARQ workers, which own
+# the result cache.
+if settings.TOOL_EXECUTION_MODE == "arq":
+    _registry = ToolRegistry(
+        dispatcher=ArqToolDispatcher(settings.REDIS_URL, settings.TOOL_DISPATCH_TIMEOUT)
+    )
+else:
+    _registry = ToolRegistry(
+        cache=ToolResultCache(
+            max_entries=settings.TOOL_CACHE_MAX_ENTRIES,
+            redis_url=settings.REDIS_URL if settings.TOOL_CACHE_SHARED else None,
+        )
+    )
+for _spec in BRAIN_TOOLS:
+    _registry.register_lazy(_spec)
 
 _memory = ShortTermMemory(max_turns=20)
 
@@ -51,10 +64,17 @@ async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # Browser tools run here in local mode — start their Chrome sessions now
+    if settings.BROWSER_PREWARM and settings.TOOL_EXECUTION_MODE != "arq":
+        await asyncio.to_thread(get_driver_pool().prewarm)
+
     print("🚀 Zia AI started successfully")
 
     yield
 
+    _registry.shutdown()
+    await _registry.close()
+    await asyncio.to_thread(shutdown_driver_pool)
     await engine.dispose()
 
 
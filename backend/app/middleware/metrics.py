@@ -42,6 +42,179 @@ ACTIVE_WS_CONNECTIONS = Gauge(
     "Active WebSocket connections",
 )
 
+# ── Brain: tool execution ──
+
+TOOL_CALL_COUNT = Counter(
+    "zia_tool_calls_total",
+    "Brain tool calls by outcome",
+    ["tool", "status"],  # ok | error | timeout | invalid | cached
+)
+
+TOOL_QUEUE_LATENCY = Histogram(
+    "zia_tool_queue_seconds",
+    "Time a tool call waited for a free slot in its pool",
+    ["tool"],
+    buckets=[0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 30.0],
+)
+
+TOOL_RUN_LATENCY = Histogram(
+    "zia_tool_run_seconds",
+    "Tool execution time in seconds",
+    ["tool"],
+    buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+)
+
+TOOL_DISPATCH_LATENCY = Histogram(
+    "zia_tool_dispatch_seconds",
+    "Enqueue-to-result time of brain tool calls run on ARQ workers",
+    ["tool", "queue"],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+)
+
+# ── Brain: long-term memory recall ──
+
+MEMORY_RECALL_COUNT = Counter(
+    "zia_memory_recall_total",
+    "Long-term memory recalls by outcome",
+    ["outcome"],  # hit | miss | timeout | error
+)
+
+MEMORY_RECALL_LATENCY = Histogram(
+    "zia_memory_recall_duration_seconds",
+    "Long-term memory retrieval latency in seconds",
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.15, 0.25, 0.5, 1.0],
+)
+
+MEMORY_RECALL_TOKENS = Histogram(
+    "zia_memory_recall_tokens",
+    "Estimated prompt tokens added by recalled memories",
+    buckets=[0, 25, 50, 100, 200, 400, 800],
+)
+
+# ── Browser: Chrome driver pool ──
+
+BROWSER_LEASE_WAIT = Histogram(
+    "zia_browser_lease_wait_seconds",
+    "Time spent waiting for (or starting) a pooled Chrome driver",
+    buckets=[0.001, 0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+)
+
+BROWSER_POOL_DRIVERS = Gauge(
+    "zia_browser_pool_drivers",
+    "Chrome drivers currently open in the pool",
+)
+
+BROWSER_POOL_LEASED = Gauge(
+    "zia_browser_pool_leased",
+    "Chrome drivers currently leased out",
+)
+
+BROWSER_DRIVERS_RECYCLED = Counter(
+    "zia_browser_drivers_recycled_total",
+    "Chrome drivers quit and replaced",
+    ["reason"],  # broken | max_uses
+)
+
+BROWSER_STEP_LATENCY = Histogram(
+    "zia_browser_step_seconds",
+    "Duration of individual browser steps (page load, element wait, video ready)",
+    ["step", "outcome"],  # outcome: ok | timeout | error
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0],
+)
+
+# ── Outbound mail ──
+
+MAIL_SENT = Counter(
+    "zia_mail_sent_total",
+    "Outbound emails by outcome",
+    ["status"],  # sent | failed | retried
+)
+
+MAIL_BATCH_MESSAGES = Histogram(
+    "zia_mail_batch_messages",
+    "Emails per Gmail batch send request",
+    buckets=[1, 2, 5, 10, 20, 50, 100],
+)
+
+MAIL_PACING_WAIT = Histogram(
+    "zia_mail_pacing_wait_seconds",
+    "Time an outbound batch waited on a token bucket",
+    ["bucket"],  # user | provider
+    buckets=[0.001, 0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+)
+
+# ── Twilio ──
+
+TWILIO_CONNECTIONS = Counter(
+    "zia_twilio_connections_total",
+    "Connections used for Twilio API requests",
+    ["event"],  # created | reused
+)
+
+TWILIO_REQUEST_LATENCY = Histogram(
+    "zia_twilio_request_seconds",
+    "Twilio API request latency in seconds",
+    ["method"],
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+)
+
+TWILIO_CALLBACKS = Counter(
+    "zia_twilio_callbacks_total",
+    "Twilio status callbacks received by the webhook",
+    ["outcome"],  # accepted | rejected | ignored
+)
+
+TWILIO_STATUS_BATCH = Histogram(
+    "zia_twilio_status_batch_size",
+    "Status callbacks applied per consumer batch",
+    buckets=[1, 5, 10, 50, 100, 250, 500, 1000],
+)
+
+TWILIO_STATUS_APPLIED = Counter(
+    "zia_twilio_status_updates_total",
+    "Status callbacks by what the consumer did with them",
+    ["outcome"],  # applied | stale | unmatched | dropped
+)
+
+WHATSAPP_FANOUT_SENT = Counter(
+    "zia_whatsapp_fanout_messages_total",
+    "Recipients settled by WhatsApp fan-outs",
+    ["status"],  # sent | failed | unconfirmed
+)
+
+# ── Filesystem ──
+
+FILE_CATALOG_FILES = Gauge(
+    "zia_file_catalog_files",
+    "Files indexed by the file catalog",
+)
+
+FILE_CATALOG_SCAN = Histogram(
+    "zia_file_catalog_scan_seconds",
+    "File catalog rescan duration in seconds",
+    ["mode"],  # incremental | full
+    buckets=[0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0],
+)
+
+FILE_CONTENT_FILES = Counter(
+    "zia_file_content_files_total",
+    "Files visited by content search",
+    ["outcome"],  # searched | binary | too_large | unreadable
+)
+
+FILE_READS = Counter(
+    "zia_file_reads_total",
+    "filesystem.read_file results by how the content was delivered",
+    ["delivery"],  # inline | lines | reference
+)
+
+FILE_SEARCH_LATENCY = Histogram(
+    "zia_file_search_seconds",
+    "filesystem.search latency in seconds",
+    ["source"],  # catalog | walk | content
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0],
+)
+
 
 # ── Middleware ────────────────────────────────────────
 
@@ -4,3 +4,4 @@ from app.models.action_log import ActionLog  # noqa: F401
 from app.models.oauth_token import OAuthToken  # noqa: F401
 from app.models.connected_service import ConnectedService  # noqa: F401
 from app.models.confirmation import PendingConfirmation  # noqa: F401
+from app.models.contact_group import ContactGroup  # noqa: F401
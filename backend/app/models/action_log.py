@@ -24,3 +24,6 @@ class ActionLog(Base):
     completed_at = Column(DateTime(timezone=True), nullable=True)
     duration_ms = Column(Integer, nullable=True)
     state_history = Column(JSON, default=[])  # FSM transitions
+    provider_sid = Column(String(64), nullable=True, index=True)  # Twilio call/message SID
+    delivery_status = Column(String(20), nullable=True)  # from provider status callbacks
+    delivery_updated_at = Column(DateTime(timezone=True), nullable=True)
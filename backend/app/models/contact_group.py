@@ -0,0 +1,17 @@
+"""Zia AI — Contact Group Model"""
+import uuid
+from sqlalchemy import Column, String, DateTime, JSON, Uuid, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ContactGroup(Base):
+    __tablename__ = "contact_groups"
+    __table_args__ = (UniqueConstraint("user_id", "name"),)
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, nullable=False, index=True)
+    name = Column(String(100), nullable=False)
+    members = Column(JSON, default=[])  # E.164 phone numbers
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
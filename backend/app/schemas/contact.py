@@ -0,0 +1,20 @@
+"""
+Zia AI — Contact Group Schema Contracts
+"""
+
+from datetime import datetime
+from typing import Annotated, List, Optional
+
+from pydantic import BaseModel, Field
+
+PhoneNumber = Annotated[str, Field(pattern=r"^(whatsapp:)?\+[1-9]\d{6,14}$")]  # E.164
+
+
+class ContactGroupRequest(BaseModel):
+    members: List[PhoneNumber] = Field(..., min_length=1, max_length=500)
+
+
+class ContactGroupResponse(BaseModel):
+    name: str
+    members: List[str]
+    updated_at: Optional[datetime] = None
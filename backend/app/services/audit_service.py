@@ -51,6 +51,7 @@ class AuditService:
         user_agent: Optional[str] = None,
         duration_ms: Optional[int] = None,
         state_history: list = None,
+        provider_sid: Optional[str] = None,
     ) -> ActionLog:
         """Log an action execution to the audit trail."""
         log = ActionLog(
@@ -67,6 +68,7 @@ class AuditService:
             user_agent=user_agent,
             duration_ms=duration_ms,
             state_history=state_history or [],
+            provider_sid=provider_sid,
         )
 
         if status in ("completed", "failed"):
@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 
 import httpx
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.crypto import crypto
@@ -73,8 +73,70 @@ class AuthService:
             return None
         return crypto.decrypt(token.access_token_encrypted, str(user_id))
 
+    async def get_tokens(self, user_id: str, service: str) -> Optional[dict]:
+        """Retrieve and decrypt the full token set (access, refresh, expiry, scopes)."""
+        result = await self.db.execute(
+            select(OAuthToken).where(
+                OAuthToken.user_id == user_id,
+                OAuthToken.service == service,
+            )
+        )
+        token = result.scalar_one_or_none()
+        if not token:
+            return None
+        uid = str(user_id)
+        return {
+            "access_token": crypto.decrypt(token.access_token_encrypted, uid),
+            "refresh_token": (
+                crypto.decrypt(token.refresh_token_encrypted, uid)
+                if token.refresh_token_encrypted else None
+            ),
+            "expires_at": token.expires_at,
+            "scopes": token.scopes or [],
+        }
+
+    async def update_access_token(
+        self,
+        user_id: str,
+        service: str,
+        access_token: str,
+        expires_at: Optional[datetime],
+        refresh_token: Optional[str] = None,
+    ) -> None:
+        """Write back a refreshed access token (and a rotated refresh token, if any)."""
+        uid = str(user_id)
+        values = {
+            "access_token_encrypted": crypto.encrypt(access_token, uid),
+            "expires_at": expires_at,
+        }
+        if refresh_token:
+            values["refresh_token_encrypted"] = crypto.encrypt(refresh_token, uid)
+        await self.db.execute(
+            update(OAuthToken)
+            .where(OAuthToken.user_id == user_id, OAuthToken.service == service)
+            .values(**values)
+        )
+        await self.db.flush()
+        logger.info(f"Refreshed {service} token (user={uid})")
+
+    async def delete_tokens(self, user_id: str, service: str) -> None:
+        """
+        Delete stored OAuth tokens. Once committed, callers must drop cached
+        credentials (credential_provider.invalidate).
+        """
+        await self.db.execute(
+            delete(OAuthToken).where(
+                OAuthToken.user_id == user_id,
+                OAuthToken.service == service,
+            )
+        )
+        await self.db.flush()
+
     async def revoke_service(self, user_id: str, service: str) -> bool:
-        """Revoke OAuth tokens: call provider + delete from DB."""
+        """
+        Revoke OAuth tokens: call provider + delete from DB.
+        Callers commit, then drop cached credentials (credential_provider.invalidate).
+        """
         uid = str(user_id)
         access_token = await self.get_access_token(user_id, service)
 
@@ -88,12 +150,7 @@ class AuthService:
                 logger.warning(f"Revocation call failed for {service}: {e}")
 
         # Delete from DB
-        await self.db.execute(
-            delete(OAuthToken).where(
-                OAuthToken.user_id == user_id,
-                OAuthToken.service == service,
-            )
-        )
+        await self.delete_tokens(user_id, service)
         await self.db.execute(
             delete(ConnectedService).where(
                 ConnectedService.user_id == user_id,
@@ -0,0 +1,319 @@
+"""
+Zia AI — Content Search
+filesystem.search with mode="content": files whose text contains the
+query (or any of several queries), case-insensitively.
+
+  - candidates come from the file catalog when it covers the directory,
+    otherwise from a streaming walk (app.services.file_walk); both skip
+    hidden and vendor directories (.git, node_modules, ... — file_catalog.IGNORED_DIRS)
+  - files over FILE_CONTENT_MAX_BYTES and binaries (a NUL byte in the
+    first 8 KB) are skipped
+  - chunks of candidates are scanned in a process pool
+    (FILE_SEARCH_PROCESSES) with one compiled regex alternation of all the
+    patterns. Files over 64 KB are mmap'ed and searched in place; smaller
+    ones are read and lowercased, which beats mmap setup plus a
+    case-insensitive regex at that size
+  - the search stops once `limit` files have matched or
+    FILE_CONTENT_SEARCH_DEADLINE seconds have passed: chunks not started
+    yet are cancelled and running ones stop at the deadline
+  - matches are appended to a Redis stream as chunks finish, so the API
+    can show them while the action is still running (read_events)
+
+Keys (namespace zia:search, expire after FILE_SEARCH_EVENTS_TTL):
+  {ns}:{execution_id}:meta     hash    user_id, done
+  {ns}:{execution_id}:events   stream  one entry per matching file
+"""
+
+import asyncio
+import json
+import logging
+import mmap
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.middleware.metrics import FILE_CONTENT_FILES
+from app.services.file_catalog import get_file_catalog
+from app.services.file_walk import iter_files
+
+logger = logging.getLogger("zia.content_search")
+
+_CHUNK_FILES = 64  # candidate files per process-pool task
+_SNIFF_BYTES = 8192
+_MMAP_MIN_BYTES = 64 * 1024
+_LINES_PER_FILE = 3
+_LINE_CHARS = 200
+
+
+# ── Scanning (runs in the pool processes) ──
+
+@lru_cache(maxsize=32)
+def _compile(patterns: Tuple[str, ...]) -> Tuple["re.Pattern[bytes]", "re.Pattern[bytes]"]:
+    """(pattern for lowercased text, case-insensitive pattern) for the alternatives."""
+    literals = [re.escape(p.encode()) for p in patterns]
+    return (re.compile(b"|".join(literal.lower() for literal in literals)),
+            re.compile(b"|".join(literals), re.IGNORECASE))
+
+
+def _matching_lines(data, haystack, regex, size: int) -> List[Dict[str, Any]]:
+    """First few lines of data where regex matches haystack (same offsets)."""
+    lines = []
+    line_no, counted_to, pos = 1, 0, 0
+    while len(lines) < _LINES_PER_FILE:
+        found = regex.search(haystack, pos)
+        if found is None:
+            break
+        start = data.rfind(b"\n", 0, found.start()) + 1
+        end = data.find(b"\n", found.end())
+        end = size if end < 0 else end
+        line_no += data[counted_to:start].count(b"\n")
+        counted_to = start
+        text = data[start:min(end, start + _LINE_CHARS)].decode("utf-8", "replace").strip()
+        lines.append({"line": line_no, "text": text})
+        pos = end + 1
+    return lines
+
+
+def _scan_file(path: str, patterns: Tuple[str, ...], max_bytes: int) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """(outcome, match) for one file; match has the first few matching lines."""
+    lowered, ignorecase = _compile(patterns)
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > max_bytes:
+                return "too_large", None
+            if size == 0:
+                return "searched", None
+            head = f.read(_SNIFF_BYTES)
+            if b"\0" in head:
+                return "binary", None
+            if size < _MMAP_MIN_BYTES:
+                data = head + f.read()
+                lines = _matching_lines(data, data.lower(), lowered, len(data))
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    lines = _matching_lines(data, data, ignorecase, size)
+    except (OSError, ValueError):
+        return "unreadable", None
+    if not lines:
+        return "searched", None
+    return "searched", {"path": path, "size": size, "lines": lines}
+
+
+def _scan_chunk(paths: List[str], patterns: Tuple[str, ...], max_bytes: int,
+                deadline: float) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    matches, outcomes = [], {}
+    for path in paths:
+        if time.time() >= deadline:
+            break
+        outcome, match = _scan_file(path, patterns, max_bytes)
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        if match:
+            matches.append(match)
+    return matches, outcomes
+
+
+# ── Candidates ──
+
+def _candidate_chunks(directory: str, extension: str, max_bytes: int,
+                      deadline: float) -> Iterator[List[str]]:
+    catalog = get_file_catalog()
+    if catalog is not None and catalog.covers(directory):
+        after = ""
+        while time.time() < deadline:
+            page = catalog.list_files(directory, extension, max_bytes, after=after, limit=_CHUNK_FILES)
+            if not page:
+                return
+            yield page
+            after = page[-1]
+        return
+
+    suffix = "." + extension.lower() if extension else ""
+    chunk: List[str] = []
+    for entry in iter_files(directory, deadline=deadline):
+        if suffix and not entry.name.lower().endswith(suffix):
+            continue
+        chunk.append(entry.path)
+        if len(chunk) >= _CHUNK_FILES:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ── Orchestration (worker event loop) ──
+
+class ContentSearch:
+    """Runs content searches on a shared process pool and streams their matches."""
+
+    def __init__(self, processes: int = 0, max_bytes: int = 10_000_000,
+                 events_ttl: int = 3600, namespace: str = "zia:search"):
+        self.processes = processes or min(os.cpu_count() or 1, 8)
+        self.max_bytes = max_bytes
+        self.events_ttl = events_ttl
+        self.namespace = namespace
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._redis: Optional[aioredis.Redis] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: forking a worker that runs threads (Gmail I/O, to_thread) is unsafe
+            self._pool = ProcessPoolExecutor(self.processes, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    async def get_redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self._redis
+
+    def _key(self, execution_id: str, part: str) -> str:
+        return f"{self.namespace}:{execution_id}:{part}"
+
+    async def search(
+        self, patterns: List[str], directory: str, extension: str = "", limit: int = 50,
+        deadline_s: float = 10.0, execution_id: Optional[str] = None, user_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        patterns = tuple(p for p in patterns if p)
+        extension = "" if extension in ("", "*") else extension.lstrip(".")
+        deadline = time.time() + deadline_s
+        pool = self._get_pool()
+        chunks = _candidate_chunks(directory, extension, self.max_bytes, deadline)
+        publish = execution_id is not None and await self._open_events(execution_id, user_id)
+
+        matches: List[Dict[str, Any]] = []
+        outcomes: Dict[str, int] = {}
+        in_flight: set = set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < 2 * self.processes and time.time() < deadline:
+                    chunk = await asyncio.to_thread(next, chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    in_flight.add(asyncio.wrap_future(
+                        pool.submit(_scan_chunk, chunk, patterns, self.max_bytes, deadline)))
+                if not in_flight:
+                    break
+                done, in_flight = await asyncio.wait(
+                    in_flight, timeout=max(deadline - time.time(), 0), return_when=asyncio.FIRST_COMPLETED,
+                )
+                for future in done:
+                    found, counts = future.result()
+                    for outcome, n in counts.items():
+                        outcomes[outcome] = outcomes.get(outcome, 0) + n
+                    found = found[:limit - len(matches)]
+                    matches += found
+                    if found and publish:
+                        publish = await self._publish(execution_id, found)
+                if len(matches) >= limit or time.time() >= deadline:
+                    break
+        except BrokenProcessPool:
+            self._pool = None
+            raise
+        finally:
+            for future in in_flight:
+                future.cancel()
+            if publish:
+                await self._finish_events(execution_id)
+
+        for outcome, n in outcomes.items():
+            FILE_CONTENT_FILES.labels(outcome=outcome).inc(n)
+        timed_out = len(matches) < limit and time.time() >= deadline
+        return {
+            "status": "search_complete",
+            "mode": "content",
+            "matches": matches,
+            "count": len(matches),
+            "files_searched": outcomes.get("searched", 0),
+            "files_skipped": sum(n for o, n in outcomes.items() if o != "searched"),
+            "timed_out": timed_out,
+        }
+
+    # ── Match stream ──
+
+    async def _open_events(self, execution_id: str, user_id: Optional[str]) -> bool:
+        try:
+            redis = await self.get_redis()
+            pipe = redis.pipeline()
+            pipe.hset(self._key(execution_id, "meta"), mapping={"user_id": str(user_id), "done": 0})
+            pipe.expire(self._key(execution_id, "meta"), self.events_ttl)
+            await pipe.execute()
+            return True
+        except RedisError as e:
+            logger.warning("Content search %s will not stream matches: %s", execution_id, e)
+            return False
+
+    async def _publish(self, execution_id: str, found: List[Dict[str, Any]]) -> bool:
+        try:
+            pipe = (await self.get_redis()).pipeline()
+            for match in found:
+                pipe.xadd(self._key(execution_id, "events"), {"match": json.dumps(match)})
+            pipe.expire(self._key(execution_id, "events"), self.events_ttl)
+            await pipe.execute()
+            return True
+        except RedisError as e:
+            logger.warning("Content search %s stopped streaming matches: %s", execution_id, e)
+            return False
+
+    async def _finish_events(self, execution_id: str):
+        try:
+            await (await self.get_redis()).hset(self._key(execution_id, "meta"), "done", 1)
+        except RedisError:
+            pass
+
+    async def read_events(
+        self, execution_id: str, user_id: str, after: str = "0-0", count: int = 100, block_ms: int = 0
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Matches found after stream id `after` (oldest first), plus a cursor
+        for the next call. None if the search is unknown or not the user's.
+        """
+        redis = await self.get_redis()
+        meta = await redis.hgetall(self._key(execution_id, "meta"))
+        if not meta or meta.get("user_id") != str(user_id):
+            return None
+        finished = meta.get("done") == "1"  # read first: every match was streamed before this
+        streams = await redis.xread(
+            {self._key(execution_id, "events"): after}, count=count,
+            block=None if finished else block_ms or None,
+        )
+        entries = streams[0][1] if streams else []
+        return {
+            "events": [json.loads(fields["match"]) for _, fields in entries],
+            "cursor": entries[-1][0] if entries else after,
+            "done": finished and len(entries) < count,
+        }
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+_content_search: Optional[ContentSearch] = None
+
+
+def get_content_search() -> ContentSearch:
+    global _content_search
+    if _content_search is None:
+        _content_search = ContentSearch(
+            processes=settings.FILE_SEARCH_PROCESSES,
+            max_bytes=settings.FILE_CONTENT_MAX_BYTES,
+            events_ttl=settings.FILE_SEARCH_EVENTS_TTL,
+        )
+    return _content_search
+
+
+def shutdown_content_search():
+    if _content_search is not None:
+        _content_search.shutdown()
@@ -0,0 +1,186 @@
+"""
+Zia AI — OAuth Credential Provider
+Per-user Google credentials for executors and brain tools, loaded from the
+encrypted oauth_tokens table (AuthService). Users without stored tokens
+fall back to token.json (tools.gmail_service.get_user_gmail_service).
+
+  - decrypted credentials are cached in memory until GMAIL_REFRESH_MARGIN
+    seconds before they expire, or until invalidate() (revoked or deleted
+    tokens) bumps the user's generation counter in Redis, which every
+    process checks before serving a cached entry
+  - tokens are refreshed with the client that issued them: the Google
+    OAuth client (GOOGLE_CLIENT_ID, app.services.google_oauth)
+  - refreshes are single-flight: concurrent callers in one process share
+    an asyncio lock, and callers across workers share a Redis lock, so one
+    refresh happens per user/service and everyone else reads the result
+  - refreshed tokens are written back through AuthService
+"""
+
+import asyncio
+import hashlib
+import logging
+from datetime import timezone
+from typing import Optional
+
+import redis.asyncio as aioredis
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from redis.exceptions import LockError, RedisError
+
+from app.config import settings
+from app.database import async_session
+from app.services.auth_service import AuthService
+from tools.gmail_service import needs_refresh
+
+logger = logging.getLogger("zia.credentials")
+
+GOOGLE_TOKEN_URI = "https://oauth2.googleapis.com/token"
+
+
+def _version(creds: Credentials) -> str:
+    """Identifies a token; changes whenever it is refreshed."""
+    return hashlib.sha256(creds.token.encode()).hexdigest()[:16]
+
+
+class NotConnectedError(PermissionError):
+    """The user has not connected (or has revoked) the service."""
+
+
+class OAuthCredentialProvider:
+    """In-memory, single-flight cache of per-user Google OAuth credentials."""
+
+    def __init__(self, refresh_margin: float = 300.0, lock_timeout: float = 30.0):
+        self.refresh_margin = refresh_margin
+        self.lock_timeout = lock_timeout
+        # (user_id, service) -> (credentials, generation they were loaded at)
+        self._cache: dict[tuple[str, str], tuple[Credentials, Optional[str]]] = {}
+        self._locks: dict[tuple[str, str], asyncio.Lock] = {}
+        self._redis: Optional[aioredis.Redis] = None
+
+    async def get_redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self._redis
+
+    async def google_credentials(self, user_id: str, service: str = "gmail") -> tuple[Credentials, str]:
+        """
+        Return (credentials, version) for the user's connected Google service.
+        `version` changes whenever the access token does.
+        Raises NotConnectedError if the user has no stored tokens.
+        """
+        key = (str(user_id), service)
+        generation = await self._generation(key)
+        creds = self._fresh(key, generation)
+        if creds is not None:
+            return creds, _version(creds)
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another task may have loaded or refreshed it while we waited
+            creds = self._fresh(key, generation)
+            if creds is None:
+                self._cache.pop(key, None)
+                creds = await self._load(user_id, service)
+                if needs_refresh(creds, self.refresh_margin):
+                    creds = await self._refresh(user_id, service)
+                self._cache[key] = (creds, generation)
+        return creds, _version(creds)
+
+    async def invalidate(self, user_id: str, service: str = "gmail"):
+        """
+        Forget cached credentials in every process, e.g. after the user
+        revoked access. Call it after the token change is committed.
+        """
+        key = (str(user_id), service)
+        self._cache.pop(key, None)
+        try:
+            await (await self.get_redis()).incr(self._generation_key(key))
+        except RedisError as e:
+            logger.warning(f"Could not invalidate {service} credentials in other workers: {e}")
+
+    # ── Internals ──
+
+    def _fresh(self, key: tuple[str, str], generation: Optional[str]) -> Optional[Credentials]:
+        """The cached credentials, unless missing, invalidated or about to expire."""
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        creds, loaded_at = cached
+        if loaded_at != generation or needs_refresh(creds, self.refresh_margin):
+            return None
+        return creds
+
+    @staticmethod
+    def _generation_key(key: tuple[str, str]) -> str:
+        return f"zia:oauth:generation:{key[0]}:{key[1]}"
+
+    async def _generation(self, key: tuple[str, str]) -> Optional[str]:
+        """Invalidation counter for the user's service; None while Redis is unreachable."""
+        try:
+            return await (await self.get_redis()).get(self._generation_key(key))
+        except RedisError as e:
+            logger.warning(f"Redis unavailable, serving cached credentials unchecked: {e}")
+            cached = self._cache.get(key)
+            return cached[1] if cached else None
+
+    async def _load(self, user_id: str, service: str) -> Credentials:
+        async with async_session() as db:
+            tokens = await AuthService(db).get_tokens(user_id, service)
+        if tokens is None:
+            raise NotConnectedError(f"{service} is not connected for this user")
+
+        expiry = tokens["expires_at"]
+        if expiry is not None and expiry.tzinfo is not None:
+            expiry = expiry.astimezone(timezone.utc).replace(tzinfo=None)
+        return Credentials(
+            token=tokens["access_token"],
+            refresh_token=tokens["refresh_token"],
+            token_uri=GOOGLE_TOKEN_URI,
+            client_id=settings.GOOGLE_CLIENT_ID,
+            client_secret=settings.GOOGLE_CLIENT_SECRET,
+            scopes=tokens["scopes"] or None,
+            expiry=expiry,
+        )
+
+    async def _refresh(self, user_id: str, service: str) -> Credentials:
+        """Refresh under a cross-worker lock; re-read first in case another worker won."""
+        try:
+            redis = await self.get_redis()
+            lock = redis.lock(
+                f"zia:oauth:refresh:{user_id}:{service}",
+                timeout=self.lock_timeout,
+                blocking_timeout=self.lock_timeout,
+            )
+            async with lock:
+                creds = await self._load(user_id, service)
+                if not needs_refresh(creds, self.refresh_margin):
+                    logger.info(f"{service} token already refreshed by another worker (user={user_id})")
+                    return creds
+                return await self._refresh_and_store(creds, user_id, service)
+        except LockError:
+            raise RuntimeError(f"Timed out waiting for {service} token refresh (user={user_id})")
+        except RedisError as e:
+            logger.warning(f"Redis unavailable, refreshing {service} token without lock: {e}")
+            creds = await self._load(user_id, service)
+            return await self._refresh_and_store(creds, user_id, service)
+
+    async def _refresh_and_store(self, creds: Credentials, user_id: str, service: str) -> Credentials:
+        if not creds.refresh_token:
+            raise NotConnectedError(f"{service} token expired and cannot be refreshed — reconnect it")
+        await asyncio.to_thread(creds.refresh, Request())
+
+        expires_at = creds.expiry.replace(tzinfo=timezone.utc) if creds.expiry else None
+        async with async_session() as db:
+            await AuthService(db).update_access_token(
+                user_id, service, creds.token, expires_at, refresh_token=creds.refresh_token,
+            )
+            await db.commit()
+        return creds
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+credential_provider = OAuthCredentialProvider(refresh_margin=settings.GMAIL_REFRESH_MARGIN)
@@ -0,0 +1,410 @@
+"""
+Zia AI — File Catalog
+A persistent index of the files under the filesystem sandbox
+(ALLOWED_ROOTS), so filesystem.search doesn't walk the disk per query.
+
+  - one SQLite database (FILE_CATALOG_PATH, WAL mode): files(path, name,
+    ext, size, mtime) plus an FTS5 trigram index on the name, which serves
+    substring queries of 3+ characters from the index; when a query has no
+    substring match, names sharing most of its trigrams are returned
+    instead (typo tolerance). Queries with glob syntax (*, ?, [...]) match
+    like the tree walk (fnmatch): the index narrows by the longest literal
+    run and every candidate name is checked against the pattern
+  - a background task on the default-queue worker rescans the roots every
+    FILE_CATALOG_RESCAN_INTERVAL seconds. A rescan only lists directories
+    whose mtime changed (a file was added, removed or renamed in them);
+    every FILE_CATALOG_FULL_RESCAN_INTERVAL seconds all directories are
+    listed again, which also refreshes sizes and mtimes of edited files
+  - hidden files/directories, vendor directories (IGNORED_DIRS) and the
+    names in FILE_SEARCH_EXTRA_IGNORED are not indexed, as the glob search
+    this replaces never matched them either
+  - other worker processes read the same database; until a root has been
+    scanned once, searches under it fall back to walking the tree
+
+Results can trail the disk by up to one rescan interval: new files are
+missing until then, and deleted files are filtered out at query time.
+"""
+
+import asyncio
+import fnmatch
+import functools
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.config import settings
+from app.middleware.metrics import FILE_CATALOG_FILES, FILE_CATALOG_SCAN
+
+logger = logging.getLogger("zia.file_catalog")
+
+IGNORED_DIRS = {"node_modules", "bower_components", "__pycache__", "venv", "site-packages",
+                "$RECYCLE.BIN", "System Volume Information"}
+IGNORED_DIRS |= {name.strip() for name in settings.FILE_SEARCH_EXTRA_IGNORED.split(",") if name.strip()}
+
+_COMMIT_EVERY = 500  # directories written per transaction during a scan
+
+_GLOB_CHARS = set("*?[")
+# Wildcards and bracket expressions ([abc], [!a-z], []x]); what's left between them is literal
+_GLOB_TOKENS = re.compile(r"\[!?\]?[^\]]*\]?|[*?]")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    dir TEXT NOT NULL,
+    name TEXT NOT NULL,
+    ext TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_dir ON files(dir);
+CREATE INDEX IF NOT EXISTS files_ext ON files(ext);
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent);
+CREATE TABLE IF NOT EXISTS roots (
+    path TEXT PRIMARY KEY,
+    scanned_at REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS names USING fts5(
+    name, content='files', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS files_ai AFTER INSERT ON files BEGIN
+    INSERT INTO names(rowid, name) VALUES (new.id, new.name);
+END;
+CREATE TRIGGER IF NOT EXISTS files_ad AFTER DELETE ON files BEGIN
+    INSERT INTO names(names, rowid, name) VALUES ('delete', old.id, old.name);
+END;
+"""
+
+
+def is_ignored(name: str) -> bool:
+    return name.startswith(".") or name in IGNORED_DIRS
+
+
+def _ext(name: str) -> str:
+    return os.path.splitext(name)[1][1:].lower()
+
+
+def _prefix_range(directory: str) -> Tuple[str, str]:
+    """Bounds that select every path strictly below directory on the path index."""
+    prefix = directory.rstrip(os.sep) + os.sep
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+
+@functools.lru_cache(maxsize=64)
+def _glob_matcher(query: str):
+    return re.compile(fnmatch.translate(f"*{query}*"), re.IGNORECASE).match
+
+
+def _name_glob(query: str, name: str) -> bool:
+    """SQL name_glob(query, name): the tree walk's *query* match."""
+    return _glob_matcher(query)(name) is not None
+
+
+def _trigrams(text: str) -> set:
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class FileCatalog:
+    """SQLite-backed name index over a set of root directories."""
+
+    def __init__(self, path: str, roots: Iterable[str]):
+        self.path = os.path.expanduser(path)
+        self.roots = self._normalize_roots(roots)
+        self._local = threading.local()
+
+    @staticmethod
+    def _normalize_roots(roots: Iterable[str]) -> List[str]:
+        existing = sorted({os.path.realpath(r) for r in roots if os.path.isdir(r)}, key=len)
+        kept: List[str] = []
+        for root in existing:
+            if not any(root == k or root.startswith(k.rstrip(os.sep) + os.sep) for k in kept):
+                kept.append(root)
+        return kept
+
+    # ── Connections ──
+
+    def _open(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.create_function("name_glob", 2, _name_glob, deterministic=True)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._open()
+        return conn
+
+    # ── Queries ──
+
+    def covers(self, directory: str) -> bool:
+        """Whether directory lies under a root that has been scanned at least once."""
+        if not os.path.exists(self.path):
+            return False
+        scanned = [row[0] for row in self._reader().execute("SELECT path FROM roots")]
+        return any(directory == r or directory.startswith(r.rstrip(os.sep) + os.sep) for r in scanned)
+
+    def count(self) -> int:
+        return self._reader().execute("SELECT count(*) FROM files").fetchone()[0]
+
+    def search(
+        self, query: str, directory: Optional[str] = None, extension: Optional[str] = None,
+        limit: int = 50, after_id: int = 0,
+    ) -> Tuple[List[str], str, Optional[int]]:
+        """
+        Paths under directory whose name contains query (case-insensitive,
+        glob syntax as in file_walk.search_tree), optionally with the given
+        extension, in index order after row after_id. Returns (paths,
+        "substring", next after_id or None at the end), or (paths, "fuzzy",
+        None) when nothing contains a plain query.
+        """
+        where, args = [], []
+        if directory:
+            low, high = _prefix_range(directory)
+            where.append("f.path > ? AND f.path < ?")
+            args += [low, high]
+        ext = (extension or "").lstrip(".").lower()
+        if ext and ext != "*":
+            where.append("f.ext = ?")
+            args.append(ext)
+        glob = bool(_GLOB_CHARS & set(query))
+        literal = query
+        if glob:
+            where.append("name_glob(?, f.name)")
+            args.append(query)
+            literal = max(_GLOB_TOKENS.split(query), key=len)
+        filters = "".join(f" AND {w}" for w in where)
+
+        conn = self._reader()
+        if len(literal) >= 3:
+            # CROSS JOIN pins the index lookup first; otherwise SQLite may
+            # drive the join from the ext/path indexes and re-run MATCH per row
+            phrase = '"' + literal.replace('"', '""') + '"'
+            rows = conn.execute(
+                f"SELECT f.id, f.path FROM names CROSS JOIN files f ON f.id = names.rowid "
+                f"WHERE names MATCH ? AND names.rowid > ?{filters} ORDER BY names.rowid LIMIT ?",
+                [phrase, after_id, *args, limit],
+            ).fetchall()
+        else:
+            # Too short for a trigram: scan the names
+            pattern = "%" + literal.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            rows = conn.execute(
+                f"SELECT f.id, f.path FROM files f WHERE f.name LIKE ? ESCAPE '\\' AND f.id > ?{filters} "
+                f"ORDER BY f.id LIMIT ?",
+                [pattern, after_id, *args, limit],
+            ).fetchall()
+        paths = [p for _, p in rows if os.path.exists(p)]
+        if rows or after_id or glob or len(query) < 4:
+            return paths, "substring", rows[-1][0] if len(rows) == limit else None
+        return self._fuzzy(conn, query, filters, args, limit), "fuzzy", None
+
+    def list_files(
+        self, directory: str, extension: Optional[str] = None, max_size: Optional[int] = None,
+        after: str = "", limit: int = 256,
+    ) -> List[str]:
+        """
+        One page of indexed paths under directory in path order, starting
+        after the given path (keyset pagination on the path index).
+        """
+        low, high = _prefix_range(directory)
+        sql, args = "SELECT path FROM files WHERE path > ? AND path < ?", [max(low, after), high]
+        ext = (extension or "").lstrip(".").lower()
+        if ext and ext != "*":
+            sql += " AND +ext = ?"  # unary + keeps the planner on the path index
+            args.append(ext)
+        if max_size is not None:
+            sql += " AND size <= ?"
+            args.append(max_size)
+        rows = self._reader().execute(sql + " ORDER BY path LIMIT ?", [*args, limit])
+        return [p for (p,) in rows]
+
+    def _fuzzy(self, conn, query: str, filters: str, args: list, limit: int) -> List[str]:
+        """Names sharing at least 40% of the query's trigrams, best overlap first."""
+        grams = _trigrams(query)
+        expression = " OR ".join('"' + g.replace('"', '""') + '"' for g in grams)
+        rows = conn.execute(
+            f"SELECT f.path, f.name FROM names CROSS JOIN files f ON f.id = names.rowid "
+            f"WHERE names MATCH ?{filters} ORDER BY rank LIMIT ?",
+            [expression, *args, limit * 20],
+        )
+        scored = []
+        for path, name in rows:
+            shared = len(grams & _trigrams(name))
+            if shared * 5 >= len(grams) * 2:
+                scored.append((-shared, len(name), path))
+        scored.sort()
+        return [path for _, _, path in scored if os.path.exists(path)][:limit]
+
+    # ── Scanning ──
+
+    def rescan(self, full: bool = False) -> Dict[str, int]:
+        """
+        Bring the index up to date with the disk (blocking). Directories
+        whose mtime is unchanged are not listed again unless full is set.
+        """
+        stats = {"dirs": 0, "listed": 0, "added": 0, "removed": 0, "updated": 0}
+        conn = self._open()
+        try:
+            for root in self.roots:
+                self._scan_root(conn, root, full, stats)
+                conn.execute("INSERT OR REPLACE INTO roots(path, scanned_at) VALUES (?, ?)",
+                             (root, time.time()))
+                conn.commit()
+            FILE_CATALOG_FILES.set(conn.execute("SELECT count(*) FROM files").fetchone()[0])
+        finally:
+            conn.close()
+        return stats
+
+    def _scan_root(self, conn: sqlite3.Connection, root: str, full: bool, stats: Dict[str, int]):
+        known = dict(conn.execute(
+            "SELECT path, mtime_ns FROM dirs WHERE path = ? OR (path > ? AND path < ?)",
+            (root, *_prefix_range(root)),
+        ))
+        stack = [(root, None)]
+        pending = 0
+        while stack:
+            directory, parent = stack.pop()
+            stats["dirs"] += 1
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                self._forget_dir(conn, directory, stats)
+                continue
+
+            if not full and known.get(directory) == mtime_ns:
+                # Listing unchanged: same files, same subdirectories
+                stack.extend((child, directory) for (child,) in
+                             conn.execute("SELECT path FROM dirs WHERE parent = ?", (directory,)))
+                continue
+
+            files, subdirs = self._list(directory)
+            stats["listed"] += 1
+            self._sync_files(conn, directory, files, stats)
+            previous = {child for (child,) in
+                        conn.execute("SELECT path FROM dirs WHERE parent = ?", (directory,))}
+            for gone in previous - set(subdirs):
+                self._forget_dir(conn, gone, stats)
+            conn.execute("INSERT OR REPLACE INTO dirs(path, parent, mtime_ns) VALUES (?, ?, ?)",
+                         (directory, parent, mtime_ns))
+            stack.extend((child, directory) for child in subdirs)
+
+            pending += 1
+            if pending >= _COMMIT_EVERY:
+                conn.commit()
+                pending = 0
+        conn.commit()
+
+    @staticmethod
+    def _list(directory: str) -> Tuple[Dict[str, Tuple[int, float]], List[str]]:
+        files: Dict[str, Tuple[int, float]] = {}
+        subdirs: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if is_ignored(entry.name):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file():
+                            st = entry.stat()
+                            files[entry.name] = (st.st_size, st.st_mtime)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug("Cannot list %s: %s", directory, e)
+        return files, subdirs
+
+    @staticmethod
+    def _sync_files(conn, directory: str, files: Dict[str, Tuple[int, float]], stats: Dict[str, int]):
+        current = {name: (size, mtime) for name, size, mtime in
+                   conn.execute("SELECT name, size, mtime FROM files WHERE dir = ?", (directory,))}
+        removed = [os.path.join(directory, n) for n in current.keys() - files.keys()]
+        if removed:
+            conn.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in removed])
+            stats["removed"] += len(removed)
+        added = [(os.path.join(directory, n), directory, n, _ext(n), size, mtime)
+                 for n, (size, mtime) in files.items() if n not in current]
+        if added:
+            conn.executemany(
+                "INSERT INTO files(path, dir, name, ext, size, mtime) VALUES (?, ?, ?, ?, ?, ?)", added,
+            )
+            stats["added"] += len(added)
+        changed = [(size, mtime, os.path.join(directory, n))
+                   for n, (size, mtime) in files.items() if n in current and current[n] != (size, mtime)]
+        if changed:
+            conn.executemany("UPDATE files SET size = ?, mtime = ? WHERE path = ?", changed)
+            stats["updated"] += len(changed)
+
+    @staticmethod
+    def _forget_dir(conn, directory: str, stats: Dict[str, int]):
+        """Drop a vanished directory and everything indexed below it."""
+        low, high = _prefix_range(directory)
+        cursor = conn.execute("DELETE FROM files WHERE dir = ? OR (dir > ? AND dir < ?)",
+                              (directory, low, high))
+        stats["removed"] += cursor.rowcount
+        conn.execute("DELETE FROM dirs WHERE path = ? OR (path > ? AND path < ?)", (directory, low, high))
+
+    async def run(self, interval: float, full_interval: float):
+        """Rescan until cancelled."""
+        last_full = 0.0
+        while True:
+            full = time.monotonic() - last_full >= full_interval
+            mode = "full" if full else "incremental"
+            start = time.perf_counter()
+            try:
+                stats = await asyncio.to_thread(self.rescan, full)
+                elapsed = time.perf_counter() - start
+                FILE_CATALOG_SCAN.labels(mode=mode).observe(elapsed)
+                if full:
+                    last_full = time.monotonic()
+                logger.info("File catalog %s rescan in %.1fs: %s", mode, elapsed, stats)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("File catalog rescan failed")
+            await asyncio.sleep(interval)
+
+
+_catalog: Optional[FileCatalog] = None
+_scan_task: Optional[asyncio.Task] = None
+
+
+def get_file_catalog() -> Optional[FileCatalog]:
+    """The catalog over the filesystem sandbox, or None when disabled."""
+    global _catalog
+    if _catalog is None and settings.FILE_CATALOG_ENABLED:
+        from app.executors.filesystem import ALLOWED_ROOTS
+        _catalog = FileCatalog(settings.FILE_CATALOG_PATH, ALLOWED_ROOTS)
+    return _catalog
+
+
+def start_file_catalog() -> Optional[asyncio.Task]:
+    global _scan_task
+    catalog = get_file_catalog()
+    if catalog is not None and _scan_task is None:
+        _scan_task = asyncio.create_task(catalog.run(
+            settings.FILE_CATALOG_RESCAN_INTERVAL, settings.FILE_CATALOG_FULL_RESCAN_INTERVAL,
+        ))
+    return _scan_task
+
+
+async def stop_file_catalog():
+    global _scan_task
+    if _scan_task is not None:
+        _scan_task.cancel()
+        await asyncio.gather(_scan_task, return_exceptions=True)
+        _scan_task = None
@@ -0,0 +1,146 @@
+"""
+Zia AI — File Walk
+Streaming directory walk for filesystem searches the file catalog can't
+serve (catalog disabled, or the directory not indexed yet).
+
+  - os.scandir, one directory at a time; nothing is materialized beyond
+    the current directory listing, so a search stops as soon as it has
+    `limit` matches
+  - hidden entries and vendor/ignored directories are pruned
+    (file_catalog.is_ignored)
+  - entries are visited in path order (sorted per directory), so a walk
+    can resume after any path: continuing from a cursor lists only the
+    directories on the way back down to it
+  - a wall-clock deadline: when it passes the matches found so far are
+    returned with a cursor that continues the walk where it stopped
+"""
+
+import base64
+import fnmatch
+import json
+import os
+import re
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.services.file_catalog import is_ignored
+
+
+def encode_cursor(source: str, after: Any) -> str:
+    """Opaque continuation token: where the next page of a search starts."""
+    raw = json.dumps({"source": source, "after": after}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Dict[str, Any]:
+    if not cursor:
+        return {}
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise ValueError("Invalid search cursor")
+    if not isinstance(data, dict) or data.get("source") not in ("catalog", "walk"):
+        raise ValueError("Invalid search cursor")
+    return data
+
+
+def _entries(directory: str) -> List[os.DirEntry]:
+    try:
+        with os.scandir(directory) as it:
+            return sorted((e for e in it if not is_ignored(e.name)), key=lambda e: e.name)
+    except OSError:
+        return []
+
+
+class TreeWalk:
+    """
+    Files below directory in path order, starting after the path `after`.
+    Stops early (without error) once time.time() passes deadline.
+
+    `position` is where a later walk can resume: the last file yielded or
+    entry skipped, or the last directory walked to the end. The deadline
+    is only honoured once position has moved past `after`, so every
+    resumed walk makes progress, however little time it had.
+    """
+
+    def __init__(self, directory: str, after: Optional[str] = None, deadline: Optional[float] = None):
+        self.directory = directory
+        self.deadline = deadline
+        self.after = self.position = after
+        self._resume = os.path.relpath(after, directory).split(os.sep) if after else None
+        if self._resume and self._resume[0] == os.pardir:
+            self._resume = None  # cursor from another directory: start over
+            self.after = self.position = None
+
+    def __iter__(self) -> Iterator[os.DirEntry]:
+        return self._walk(self.directory, self._resume)
+
+    def expired(self) -> bool:
+        if self.deadline is None or self.position == self.after:
+            return False
+        return time.time() >= self.deadline
+
+    def _walk(self, directory: str, resume: Optional[List[str]]) -> Iterator[os.DirEntry]:
+        """Yields the files below directory; returns True once all of it was walked."""
+        if self.expired():
+            return False
+        entries = _entries(directory)
+        head = resume[0] if resume else None
+        for entry in entries:
+            if head is not None and entry.name < head:
+                continue
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if head is not None and entry.name == head:
+                    # On the way back to the cursor: descend, but don't repeat the file itself
+                    if is_dir and len(resume) > 1:
+                        if not (yield from self._walk(entry.path, resume[1:])):
+                            return False
+                        self.position = entry.path
+                elif is_dir:
+                    if not (yield from self._walk(entry.path, None)):
+                        return False
+                    self.position = entry.path
+                else:
+                    self.position = entry.path
+                    if entry.is_file():
+                        yield entry
+            except OSError:
+                self.position = entry.path
+            if self.expired():
+                return False
+        return True
+
+
+def iter_files(directory: str, after: Optional[str] = None,
+               deadline: Optional[float] = None) -> Iterator[os.DirEntry]:
+    """Files below directory in path order, starting after the file `after` (see TreeWalk)."""
+    return iter(TreeWalk(directory, after, deadline))
+
+
+def search_tree(directory: str, query: str, extension: str = "*", limit: int = 50,
+                deadline_s: float = 5.0, after: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Files below directory whose name matches *query*.extension
+    (case-insensitive, glob syntax), up to limit. next_cursor is set when
+    the walk stopped early, at the limit or the deadline.
+    """
+    pattern = f"*{query}*" + (f".{extension.lstrip('.')}" if extension and extension != "*" else "")
+    matcher = re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+    walk = TreeWalk(directory, after, time.time() + deadline_s)
+    matches: List[str] = []
+    visited = 0
+    for entry in walk:
+        visited += 1
+        if matcher.match(entry.name):
+            matches.append(entry.path)
+            if len(matches) >= limit:
+                break
+    timed_out = len(matches) < limit and walk.expired()
+    more = timed_out or len(matches) >= limit
+    return {
+        "matches": matches,
+        "files_visited": visited,
+        "timed_out": timed_out,
+        "next_cursor": encode_cursor("walk", walk.position) if more else None,
+    }
@@ -0,0 +1,261 @@
+"""
+Zia AI — Outbound Mail Queue
+Worker-side queue for gmail.send_email / gmail.send_bulk.
+
+Sends are grouped per user instead of running one Gmail call per job:
+
+  - each user has one in-memory queue drained by one task; concurrent
+    jobs for the same user share its batches and its (cached) Gmail service
+  - a drained batch of up to MAIL_BATCH_SIZE messages goes out as a single
+    Gmail batch request (one HTTPS round trip)
+  - pacing is a token bucket per user (MAIL_USER_RATE/MAIL_USER_BURST) and
+    one per provider (MAIL_PROVIDER_RATE/MAIL_PROVIDER_BURST), so bursts are
+    smoothed before Gmail starts answering 429s; rate-limited messages are
+    retried with backoff up to MAIL_MAX_RETRIES times
+  - the outcome of every message is written to action_logs
+
+Buckets are per worker process; the daily cap per action is still
+enforced by ActionEngine.
+"""
+
+import asyncio
+import base64
+import logging
+from email.mime.text import MIMEText
+from typing import Any, Dict, List, Optional
+
+from googleapiclient.errors import HttpError
+
+from app.config import settings
+from app.core.pacing import TokenBucket
+from app.middleware.metrics import MAIL_BATCH_MESSAGES, MAIL_PACING_WAIT, MAIL_SENT
+from tools.gmail_service import get_user_gmail_service, run_gmail_io
+
+logger = logging.getLogger("zia.mail_outbox")
+
+_RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+
+def build_raw_message(recipient: str, subject: str, body: str) -> str:
+    """RFC 2822 message, base64url-encoded for messages.send."""
+    message = MIMEText(body)
+    message["to"] = recipient
+    message["subject"] = subject
+    return base64.urlsafe_b64encode(message.as_bytes()).decode()
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    if not isinstance(error, HttpError):
+        return False
+    if error.resp.status == 429:
+        return True
+    return error.resp.status == 403 and any(
+        d.get("reason") in _RATE_LIMIT_REASONS for d in (error.error_details or []) if isinstance(d, dict)
+    )
+
+
+def send_batch(service, raw_messages: List[str]) -> List[tuple]:
+    """
+    Send messages in one Gmail batch request (blocking).
+    Returns one (message id, error) pair per message, in order.
+    """
+    results: List[tuple] = [(None, None)] * len(raw_messages)
+
+    def _collect(request_id, response, exception):
+        results[int(request_id)] = (None, exception) if exception else (response.get("id"), None)
+
+    batch = service.new_batch_http_request(callback=_collect)
+    for i, raw in enumerate(raw_messages):
+        batch.add(service.users().messages().send(userId="me", body={"raw": raw}), request_id=str(i))
+    batch.execute()
+    return results
+
+
+class _Outgoing:
+    __slots__ = ("execution_id", "recipient", "subject", "raw", "source", "future", "attempts")
+
+    def __init__(self, execution_id: str, email: Dict[str, str], source: str):
+        self.execution_id = execution_id
+        self.recipient = email["recipient"]
+        self.subject = email["subject"]
+        self.raw = build_raw_message(email["recipient"], email["subject"], email["body"])
+        self.source = source
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.attempts = 0
+
+
+class MailOutbox:
+    """Per-user outbound mail queues with batching and token-bucket pacing."""
+
+    provider = "gmail"
+
+    def __init__(
+        self,
+        batch_size: int = 10,
+        batch_window: float = 0.05,
+        user_rate: float = 1.0,
+        user_burst: int = 10,
+        provider_rate: float = 20.0,
+        provider_burst: int = 50,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        audit: bool = True,
+    ):
+        self.batch_size = max(1, min(batch_size, user_burst, provider_burst))
+        self.batch_window = batch_window
+        self.user_rate = user_rate
+        self.user_burst = user_burst
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.audit = audit
+        self._provider_bucket = TokenBucket(provider_rate, provider_burst)
+        self._user_buckets: Dict[str, TokenBucket] = {}
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._drainers: Dict[str, asyncio.Task] = {}
+
+    async def submit(
+        self, user_id: str, emails: List[Dict[str, str]], execution_id: str, source: str = "text"
+    ) -> List[Dict[str, Any]]:
+        """
+        Queue `emails` ({recipient, subject, body}) for `user_id` and wait
+        for their outcomes. A single email is logged under `execution_id`,
+        several under "{execution_id}:{index}".
+        """
+        items = [
+            _Outgoing(execution_id if len(emails) == 1 else f"{execution_id}:{i}", email, source)
+            for i, email in enumerate(emails)
+        ]
+        queue = self._queues.setdefault(user_id, asyncio.Queue())
+        for item in items:
+            queue.put_nowait(item)
+        if user_id not in self._drainers:
+            self._drainers[user_id] = asyncio.create_task(self._drain(user_id))
+        return list(await asyncio.gather(*(item.future for item in items)))
+
+    # ── Draining ──
+
+    async def _drain(self, user_id: str):
+        queue = self._queues[user_id]
+        bucket = self._user_buckets.setdefault(user_id, TokenBucket(self.user_rate, self.user_burst))
+        try:
+            while not queue.empty():
+                batch = await self._next_batch(queue)
+
+                MAIL_PACING_WAIT.labels(bucket="user").observe(await bucket.take(len(batch)))
+                MAIL_PACING_WAIT.labels(bucket="provider").observe(
+                    await self._provider_bucket.take(len(batch))
+                )
+                MAIL_BATCH_MESSAGES.observe(len(batch))
+                retry = await self._send(user_id, batch)
+
+                if retry:
+                    attempts = max(item.attempts for item in retry)
+                    await asyncio.sleep(self.retry_backoff * 2 ** (attempts - 1))
+                    for item in retry:
+                        queue.put_nowait(item)
+        finally:
+            # No await between the empty check and this, so submit() can't slip in between
+            del self._drainers[user_id]
+            if queue.empty():
+                del self._queues[user_id]
+
+    async def _next_batch(self, queue: asyncio.Queue) -> List[_Outgoing]:
+        if queue.qsize() < self.batch_size and self.batch_window > 0:
+            await asyncio.sleep(self.batch_window)  # let concurrent jobs join the batch
+        batch = []
+        while not queue.empty() and len(batch) < self.batch_size:
+            batch.append(queue.get_nowait())
+        return batch
+
+    async def _send(self, user_id: str, batch: List[_Outgoing]) -> List[_Outgoing]:
+        """Send one batch, settle final outcomes and return the items to retry."""
+        try:
+            service = await get_user_gmail_service(user_id)
+            outcomes = await run_gmail_io(send_batch, service, [item.raw for item in batch])
+        except Exception as e:
+            outcomes = [(None, e)] * len(batch)
+
+        retry, settled = [], []
+        for item, (message_id, error) in zip(batch, outcomes):
+            if error is not None and _is_rate_limited(error) and item.attempts < self.max_retries:
+                item.attempts += 1
+                retry.append(item)
+                MAIL_SENT.labels(status="retried").inc()
+                continue
+            result = {"recipient": item.recipient, "status": "sent" if error is None else "failed"}
+            if error is None:
+                result["message_id"] = message_id
+            else:
+                result["error"] = str(error)
+                logger.warning("Email to %s failed (user=%s): %s", item.recipient, user_id, error)
+            MAIL_SENT.labels(status=result["status"]).inc()
+            settled.append((item, result))
+
+        if settled and self.audit:
+            await self._record(user_id, settled)
+        for item, result in settled:
+            if not item.future.done():
+                item.future.set_result(result)
+        return retry
+
+    async def _record(self, user_id: str, settled: List[tuple]):
+        """Write one action_logs row per settled message."""
+        from app.database import async_session
+        from app.services.audit_service import AuditService
+
+        try:
+            async with async_session() as db:
+                audit = AuditService(db)
+                for item, result in settled:
+                    await audit.log_action(
+                        user_id=user_id,
+                        execution_id=item.execution_id,
+                        action_type="gmail.send_email",
+                        params={"recipient": item.recipient, "subject": item.subject},
+                        risk_level="high",
+                        status="completed" if result["status"] == "sent" else "failed",
+                        source=item.source,
+                        result={"message_id": result["message_id"]} if "message_id" in result else None,
+                        error=result.get("error"),
+                    )
+                await db.commit()
+        except Exception:
+            logger.exception("Could not record email outcomes for user=%s", user_id)
+
+    async def close(self, timeout: float = 30.0):
+        """Let queued mail drain for up to `timeout` seconds, then cancel the rest."""
+        drainers = list(self._drainers.values())
+        if not drainers:
+            return
+        _, pending = await asyncio.wait(drainers, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        for queue in self._queues.values():
+            while not queue.empty():
+                queue.get_nowait().future.cancel()
+
+
+_outbox: Optional[MailOutbox] = None
+
+
+def get_mail_outbox() -> MailOutbox:
+    """Return the process-wide outbox, built from settings on first use."""
+    global _outbox
+    if _outbox is None:
+        _outbox = MailOutbox(
+            batch_size=settings.MAIL_BATCH_SIZE,
+            batch_window=settings.MAIL_BATCH_WINDOW_MS / 1000,
+            user_rate=settings.MAIL_USER_RATE,
+            user_burst=settings.MAIL_USER_BURST,
+            provider_rate=settings.MAIL_PROVIDER_RATE,
+            provider_burst=settings.MAIL_PROVIDER_BURST,
+            max_retries=settings.MAIL_MAX_RETRIES,
+        )
+    return _outbox
+
+
+async def shutdown_mail_outbox():
+    global _outbox
+    if _outbox is not None:
+        await _outbox.close()
+        _outbox = None
@@ -0,0 +1,114 @@
+"""
+Zia AI — Shared Twilio Client
+One process-wide twilio.rest.Client for the voice and WhatsApp executors.
+
+The executors used to build a new synchronous Client per message, so every
+call paid for a fresh TLS connection and blocked the worker's event loop
+while Twilio answered. Here:
+
+  - the client uses Twilio's AsyncTwilioHttpClient (aiohttp) and the
+    executors await the *_async API methods
+  - one aiohttp session with a keep-alive connection pool is shared by all
+    jobs, bounded by TWILIO_HTTP_POOL_LIMIT in total and
+    TWILIO_HTTP_LIMIT_PER_HOST per Twilio host
+  - the client is created at worker startup (or on first use) and closed
+    at shutdown; new vs reused connections and request latency are
+    exported as Prometheus metrics
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, TraceConfig
+from twilio.http.async_http_client import AsyncTwilioHttpClient
+from twilio.rest import Client
+
+from app.config import settings
+from app.middleware.metrics import TWILIO_CONNECTIONS, TWILIO_REQUEST_LATENCY
+
+logger = logging.getLogger("zia.twilio")
+
+
+def _connection_trace() -> TraceConfig:
+    trace = TraceConfig()
+
+    async def created(session, ctx, params):
+        TWILIO_CONNECTIONS.labels(event="created").inc()
+
+    async def reused(session, ctx, params):
+        TWILIO_CONNECTIONS.labels(event="reused").inc()
+
+    trace.on_connection_create_end.append(created)
+    trace.on_connection_reuseconn.append(reused)
+    return trace
+
+
+class PooledTwilioHttpClient(AsyncTwilioHttpClient):
+    """AsyncTwilioHttpClient over one keep-alive aiohttp session with explicit pool limits."""
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        keepalive_timeout: float = 60.0,
+        timeout: float = 15.0,
+        trace_configs: Optional[list] = None,
+    ):
+        super().__init__(pool_connections=False)
+        self.timeout = timeout
+        self.trace_configs = [_connection_trace(), *(trace_configs or [])]
+        self.session = ClientSession(
+            connector=TCPConnector(
+                limit=limit, limit_per_host=limit_per_host, keepalive_timeout=keepalive_timeout,
+            ),
+            timeout=ClientTimeout(total=timeout),
+            trace_configs=self.trace_configs,
+        )
+
+    async def request(self, method: str, url: str, *args, timeout: Optional[float] = None, **kwargs):
+        # Twilio passes timeout=None on every call, which aiohttp reads as "no
+        # timeout" and which would override the session's ClientTimeout
+        if timeout is None:
+            timeout = self.timeout
+        start = time.perf_counter()
+        try:
+            return await super().request(method, url, *args, timeout=timeout, **kwargs)
+        finally:
+            TWILIO_REQUEST_LATENCY.labels(method=method.upper()).observe(time.perf_counter() - start)
+
+
+_client: Optional[Client] = None
+_client_lock = asyncio.Lock()
+
+
+async def init_twilio_client() -> Client:
+    """Create the shared client (must run on the event loop that will use it)."""
+    global _client
+    async with _client_lock:
+        if _client is None:
+            http_client = PooledTwilioHttpClient(
+                limit=settings.TWILIO_HTTP_POOL_LIMIT,
+                limit_per_host=settings.TWILIO_HTTP_LIMIT_PER_HOST,
+                keepalive_timeout=settings.TWILIO_HTTP_KEEPALIVE,
+                timeout=settings.TWILIO_HTTP_TIMEOUT,
+            )
+            _client = Client(
+                settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN, http_client=http_client,
+            )
+            logger.info("Twilio client ready (pool %d, %d per host)",
+                        settings.TWILIO_HTTP_POOL_LIMIT, settings.TWILIO_HTTP_LIMIT_PER_HOST)
+    return _client
+
+
+async def get_twilio_client() -> Client:
+    """Return the shared client, creating it if worker startup didn't."""
+    return _client if _client is not None else await init_twilio_client()
+
+
+async def close_twilio_client():
+    global _client
+    if _client is not None:
+        await _client.http_client.close()
+        _client = None
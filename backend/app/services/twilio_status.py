@@ -0,0 +1,286 @@
+"""
+Zia AI — Twilio Delivery Status
+Records Twilio sends in action_logs and applies Twilio's status callbacks
+(queued → sent → delivered/failed, ringing → completed, ...) to them.
+
+  - executors log every call/message with its SID (provider_sid) and ask
+    Twilio to call TWILIO_STATUS_CALLBACK_URL as its status changes
+  - the webhook (app.api.v1.webhooks) only checks the signature and XADDs
+    the callback to the TWILIO_STATUS_STREAM Redis stream
+  - a consumer on the default-queue worker reads the stream in batches
+    (consumer group), looks up the matching rows with one SELECT and
+    updates them with one executemany; a status never moves backwards
+    (a late "sent" can't overwrite "delivered")
+  - callbacks that arrive before their row exists stay pending and are
+    retried after TWILIO_STATUS_RETRY_AFTER seconds, up to
+    TWILIO_STATUS_MAX_DELIVERIES times
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError, ResponseError
+from sqlalchemy import bindparam, func, select, update
+
+from app.config import settings
+from app.middleware.metrics import TWILIO_STATUS_APPLIED, TWILIO_STATUS_BATCH
+
+logger = logging.getLogger("zia.twilio_status")
+
+CONSUMER_GROUP = "zia-status"
+
+# Later states win; terminal states (rank 9) are never overwritten
+_STATUS_RANK = {
+    "accepted": 0, "scheduled": 0, "queued": 1, "initiated": 1, "sending": 2, "ringing": 2,
+    "in-progress": 3, "sent": 4, "delivered": 5, "read": 6,
+    "completed": 9, "busy": 9, "no-answer": 9, "canceled": 9, "failed": 9, "undelivered": 9,
+}
+
+
+def status_callback_kwargs(kind: str) -> Dict[str, Any]:
+    """Extra create_async() arguments that make Twilio report status changes."""
+    if not settings.TWILIO_STATUS_CALLBACK_URL:
+        return {}
+    kwargs: Dict[str, Any] = {"status_callback": settings.TWILIO_STATUS_CALLBACK_URL}
+    if kind == "call":
+        kwargs["status_callback_event"] = ["initiated", "ringing", "answered", "completed"]
+    return kwargs
+
+
+async def record_twilio_sends(
+    user_id: str, action_type: str, risk_level: str, sends: List[Dict[str, Any]], source: str = "text"
+):
+    """
+    Write one action_logs row per send: {execution_id, params, sid | error}.
+    Failures to record are logged, never raised — the send already happened.
+    """
+    from app.database import async_session
+    from app.services.audit_service import AuditService
+
+    try:
+        async with async_session() as db:
+            audit = AuditService(db)
+            for send in sends:
+                await audit.log_action(
+                    user_id=user_id,
+                    execution_id=send["execution_id"],
+                    action_type=action_type,
+                    params=send["params"],
+                    risk_level=risk_level,
+                    status="failed" if send.get("error") else "completed",
+                    source=source,
+                    result={"sid": send["sid"]} if send.get("sid") else None,
+                    error=send.get("error"),
+                    provider_sid=send.get("sid"),
+                )
+            await db.commit()
+    except Exception:
+        logger.exception("Could not record %d Twilio sends for user=%s", len(sends), user_id)
+
+
+async def unrecorded_execution_ids(execution_ids: List[str]) -> List[str]:
+    """
+    The execution ids that have no action_logs row yet, in order.
+    On a database error nothing is reported missing (recording would fail too).
+    """
+    from app.database import async_session
+    from app.models.action_log import ActionLog
+
+    recorded = set()
+    try:
+        async with async_session() as db:
+            for start in range(0, len(execution_ids), 500):
+                chunk = execution_ids[start:start + 500]
+                rows = await db.execute(select(ActionLog.execution_id).where(ActionLog.execution_id.in_(chunk)))
+                recorded.update(rows.scalars())
+    except Exception:
+        logger.exception("Could not look up recorded Twilio sends")
+        return []
+    return [e for e in execution_ids if e not in recorded]
+
+
+def parse_callback(params: Dict[str, str]) -> Optional[Dict[str, str]]:
+    """Reduce a Twilio status callback to the stream entry fields, or None if it has no SID."""
+    sid = params.get("MessageSid") or params.get("CallSid")
+    status = params.get("MessageStatus") or params.get("CallStatus") or params.get("SmsStatus")
+    if not sid or not status:
+        return None
+    entry = {"sid": sid, "status": status}
+    if params.get("ErrorCode"):
+        entry["error_code"] = params["ErrorCode"]
+    return entry
+
+
+class StatusCallbackConsumer:
+    """Applies queued status callbacks to action_logs in batches."""
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        stream: str = "zia:twilio:status",
+        batch_size: int = 500,
+        retry_after: float = 30.0,
+        max_deliveries: int = 5,
+        apply=None,
+    ):
+        self.redis = redis_client
+        self.stream = stream
+        self.batch_size = batch_size
+        self.retry_after = retry_after
+        self.max_deliveries = max_deliveries
+        self.consumer = f"{socket.gethostname()}:{os.getpid()}"
+        self._apply = apply or apply_statuses
+        self._last_retry = 0.0
+
+    async def ensure_group(self):
+        try:
+            await self.redis.xgroup_create(self.stream, CONSUMER_GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def run(self):
+        """Consume until cancelled."""
+        await self.ensure_group()
+        logger.info("Twilio status consumer %s reading %s", self.consumer, self.stream)
+        while True:
+            try:
+                await self.step(block_ms=1000)
+            except asyncio.CancelledError:
+                raise
+            except RedisError as e:
+                logger.warning("Twilio status stream unavailable: %s", e)
+                await asyncio.sleep(5)
+            except Exception:
+                logger.exception("Twilio status batch failed; it will be retried")
+                await asyncio.sleep(1)
+
+    async def step(self, block_ms: int = 0) -> int:
+        """Process one batch of new callbacks (plus due retries); returns entries read."""
+        response = await self.redis.xreadgroup(
+            CONSUMER_GROUP, self.consumer, {self.stream: ">"},
+            count=self.batch_size, block=block_ms or None,
+        )
+        entries = response[0][1] if response else []
+        loop_time = asyncio.get_running_loop().time()
+        if loop_time - self._last_retry >= self.retry_after:
+            self._last_retry = loop_time
+            entries += await self._claim_retries()
+        if entries:
+            await self._process(entries)
+        return len(entries)
+
+    async def _claim_retries(self) -> List[Tuple[str, Dict[str, str]]]:
+        pending = await self.redis.xpending_range(
+            self.stream, CONSUMER_GROUP, min="-", max="+", count=self.batch_size,
+            idle=int(self.retry_after * 1000),
+        )
+        if not pending:
+            return []
+        exhausted = [p["message_id"] for p in pending if p["times_delivered"] >= self.max_deliveries]
+        if exhausted:
+            await self.redis.xack(self.stream, CONSUMER_GROUP, *exhausted)
+            TWILIO_STATUS_APPLIED.labels(outcome="dropped").inc(len(exhausted))
+            logger.warning("Dropped %d Twilio status callbacks with no matching action log", len(exhausted))
+        retry = [p["message_id"] for p in pending if p["times_delivered"] < self.max_deliveries]
+        if not retry:
+            return []
+        claimed = await self.redis.xclaim(
+            self.stream, CONSUMER_GROUP, self.consumer, int(self.retry_after * 1000), retry,
+        )
+        return [(entry_id, fields) for entry_id, fields in claimed if fields]
+
+    async def _process(self, entries: List[Tuple[str, Dict[str, str]]]):
+        TWILIO_STATUS_BATCH.observe(len(entries))
+        # Keep the furthest-along status per SID within the batch
+        latest: Dict[str, Dict[str, str]] = {}
+        ids_by_sid: Dict[str, List[str]] = {}
+        for entry_id, fields in entries:
+            sid = fields["sid"]
+            ids_by_sid.setdefault(sid, []).append(entry_id)
+            if sid not in latest or _rank(fields["status"]) >= _rank(latest[sid]["status"]):
+                latest[sid] = fields
+
+        matched = await self._apply(latest)
+        done = [entry_id for sid in matched for entry_id in ids_by_sid[sid]]
+        if done:
+            await self.redis.xack(self.stream, CONSUMER_GROUP, *done)
+        unmatched = len(latest) - len(matched)
+        if unmatched:
+            TWILIO_STATUS_APPLIED.labels(outcome="unmatched").inc(unmatched)
+
+
+def _rank(status: str) -> int:
+    return _STATUS_RANK.get(status, 0)
+
+
+async def apply_statuses(latest: Dict[str, Dict[str, str]]) -> set:
+    """
+    Apply {sid: {status, error_code?}} to action_logs; returns the SIDs that
+    have a row (whether or not the status moved forward).
+    """
+    from app.database import async_session
+    from app.models.action_log import ActionLog
+
+    async with async_session() as db:
+        rows = await db.execute(
+            select(ActionLog.provider_sid, ActionLog.delivery_status)
+            .where(ActionLog.provider_sid.in_(list(latest)))
+        )
+        current = dict(rows.all())
+
+        now = datetime.now(timezone.utc)
+        updates = []
+        for sid, fields in latest.items():
+            if sid not in current:
+                continue
+            old = current[sid]
+            if old is not None and (_rank(old) >= 9 or _rank(fields["status"]) < _rank(old)):
+                TWILIO_STATUS_APPLIED.labels(outcome="stale").inc()
+                continue
+            error = f"Twilio error {fields['error_code']}" if fields.get("error_code") else None
+            updates.append({"b_sid": sid, "b_status": fields["status"], "b_error": error, "b_at": now})
+
+        if updates:
+            # Core UPDATE: executemany by SID (the ORM form would require primary keys)
+            table = ActionLog.__table__
+            await db.execute(
+                update(table)
+                .where(table.c.provider_sid == bindparam("b_sid"))
+                .values(delivery_status=bindparam("b_status"), delivery_updated_at=bindparam("b_at"),
+                        error=func.coalesce(bindparam("b_error"), table.c.error)),
+                updates,
+            )
+            await db.commit()
+            TWILIO_STATUS_APPLIED.labels(outcome="applied").inc(len(updates))
+    return set(current)
+
+
+_consumer_task: Optional[asyncio.Task] = None
+
+
+def start_status_consumer() -> asyncio.Task:
+    global _consumer_task
+    if _consumer_task is None:
+        consumer = StatusCallbackConsumer(
+            aioredis.from_url(settings.REDIS_URL, decode_responses=True),
+            stream=settings.TWILIO_STATUS_STREAM,
+            batch_size=settings.TWILIO_STATUS_BATCH_SIZE,
+            retry_after=settings.TWILIO_STATUS_RETRY_AFTER,
+            max_deliveries=settings.TWILIO_STATUS_MAX_DELIVERIES,
+        )
+        _consumer_task = asyncio.create_task(consumer.run())
+    return _consumer_task
+
+
+async def stop_status_consumer():
+    global _consumer_task
+    if _consumer_task is not None:
+        _consumer_task.cancel()
+        await asyncio.gather(_consumer_task, return_exceptions=True)
+        _consumer_task = None
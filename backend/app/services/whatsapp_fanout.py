@@ -0,0 +1,248 @@
+"""
+Zia AI — WhatsApp Fan-out
+twilio.send_whatsapp_bulk: one confirmed action sends the same message to
+a recipient list or a stored contact group.
+
+  - up to WHATSAPP_FANOUT_CONCURRENCY sends are in flight at once, over
+    the shared Twilio client (app.services.twilio_client)
+  - a token bucket per sender number (WHATSAPP_SEND_RATE/WHATSAPP_SEND_BURST)
+    keeps the fan-out under Twilio's per-sender throughput; a 429 that
+    still gets through is retried with backoff
+  - each recipient's outcome is appended to a Redis stream as soon as it is
+    known, so the API can stream progress (read_events)
+  - progress is kept in Redis under the job's execution id. ARQ re-runs a
+    job with the same execution id after a worker crash; the re-run skips
+    recipients that already have an outcome. A recipient whose send was in
+    flight when the worker died is reported as "unconfirmed" instead of
+    being messaged twice.
+  - sends are written to action_logs ({execution_id}:{index}, with the
+    message SID) in chunks of 25, so status callbacks can find them; a
+    re-run first writes the settled recipients the crashed run had not
+    recorded yet
+
+Keys (namespace zia:fanout, expire after WHATSAPP_FANOUT_STATE_TTL):
+  {ns}:{execution_id}          hash    recipient → JSON outcome | "sending"
+  {ns}:{execution_id}:meta     hash    user_id, total, settled
+  {ns}:{execution_id}:events   stream  one entry per settled recipient
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+import redis.asyncio as aioredis
+from twilio.base.exceptions import TwilioRestException
+
+from app.config import settings
+from app.core.pacing import TokenBucket
+from app.middleware.metrics import WHATSAPP_FANOUT_SENT
+from app.services.twilio_status import record_twilio_sends, status_callback_kwargs, unrecorded_execution_ids
+
+logger = logging.getLogger("zia.whatsapp_fanout")
+
+_SENDING = "sending"
+_RECORD_CHUNK = 25
+
+
+def whatsapp_address(number: str) -> str:
+    return number if number.startswith("whatsapp:") else f"whatsapp:{number}"
+
+
+def _send_record(execution_id: str, index: int, outcome: Dict[str, Any]) -> Dict[str, Any]:
+    """The record_twilio_sends() entry for one recipient's outcome."""
+    error = outcome.get("error")
+    if outcome["status"] == "unconfirmed":
+        error = "unconfirmed: the worker stopped while this send was in flight"
+    return {
+        "execution_id": f"{execution_id}:{index}",
+        "params": {"recipient": outcome["recipient"]},
+        "sid": outcome.get("message_sid"),
+        "error": error,
+    }
+
+
+class WhatsAppFanout:
+    """Concurrent, rate-shaped and resumable WhatsApp sends to many recipients."""
+
+    def __init__(
+        self,
+        concurrency: int = 10,
+        rate: float = 10.0,
+        burst: int = 10,
+        state_ttl: int = 86400,
+        namespace: str = "zia:fanout",
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        audit: bool = True,
+    ):
+        self.concurrency = concurrency
+        self.rate = rate
+        self.burst = burst
+        self.state_ttl = state_ttl
+        self.namespace = namespace
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.audit = audit
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._redis: Optional[aioredis.Redis] = None
+
+    async def get_redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self._redis
+
+    def _key(self, execution_id: str, part: str = "") -> str:
+        return f"{self.namespace}:{execution_id}" + (f":{part}" if part else "")
+
+    async def run(
+        self,
+        client,
+        execution_id: str,
+        user_id: str,
+        sender: str,
+        recipients: List[str],
+        content: str,
+    ) -> Dict[str, Any]:
+        """Send `content` to every recipient not already settled for `execution_id`."""
+        redis = await self.get_redis()
+        state_key = self._key(execution_id)
+        recipients = list(dict.fromkeys(whatsapp_address(r) for r in recipients))
+        sender = whatsapp_address(sender)
+
+        pipe = redis.pipeline()
+        pipe.hset(self._key(execution_id, "meta"), mapping={"user_id": user_id, "total": len(recipients)})
+        pipe.hsetnx(self._key(execution_id, "meta"), "settled", 0)
+        pipe.hgetall(state_key)
+        pipe.expire(self._key(execution_id, "meta"), self.state_ttl)
+        previous = (await pipe.execute())[2]
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for recipient, raw in previous.items():
+            if raw == _SENDING:
+                # In flight when the last run died: it may or may not have gone out
+                outcome = {"recipient": recipient, "status": "unconfirmed"}
+                await self._settle(redis, execution_id, outcome)
+            else:
+                outcome = json.loads(raw)
+            results[recipient] = outcome
+        if previous:
+            logger.info("Resuming fan-out %s: %d/%d recipients already settled",
+                        execution_id, len(previous), len(recipients))
+            if self.audit:
+                await self._record_settled(execution_id, user_id, recipients, results)
+
+        pending = iter([(i, r) for i, r in enumerate(recipients) if r not in results])
+        bucket = self._buckets.setdefault(sender, TokenBucket(self.rate, self.burst))
+        unrecorded: List[Dict[str, Any]] = []
+
+        async def record(force: bool = False):
+            if self.audit and unrecorded and (force or len(unrecorded) >= _RECORD_CHUNK):
+                sends = unrecorded[:]
+                unrecorded.clear()
+                await record_twilio_sends(user_id, "twilio.send_whatsapp_bulk", "high", sends, source="macro")
+
+        async def send_worker():
+            # Workers share one iterator, so each recipient is taken exactly once
+            for index, recipient in pending:
+                await redis.hset(state_key, recipient, _SENDING)
+                outcome = await self._send(client, bucket, sender, recipient, content)
+                results[recipient] = outcome
+                await self._settle(redis, execution_id, outcome)
+                unrecorded.append(_send_record(execution_id, index, outcome))
+                await record()
+
+        workers = min(self.concurrency, len(recipients) - len(results))
+        try:
+            await asyncio.gather(*(send_worker() for _ in range(workers)))
+        finally:
+            await record(force=True)
+
+        ordered = [results[r] for r in recipients]
+        counts = {s: sum(r["status"] == s for r in ordered) for s in ("sent", "failed", "unconfirmed")}
+        return {
+            "status": "fanout_completed" if counts["sent"] == len(ordered) else "fanout_partial",
+            "total": len(ordered),
+            "resumed": len(previous),
+            **counts,
+            "results": ordered,
+        }
+
+    async def _record_settled(self, execution_id: str, user_id: str, recipients: List[str],
+                              results: Dict[str, Dict[str, Any]]):
+        """Write the action_logs rows a crashed run settled but never recorded."""
+        settled = {f"{execution_id}:{i}": (i, r) for i, r in enumerate(recipients) if r in results}
+        missing = await unrecorded_execution_ids(list(settled))
+        if missing:
+            logger.info("Fan-out %s: recording %d sends the previous run missed", execution_id, len(missing))
+            sends = [_send_record(execution_id, settled[m][0], results[settled[m][1]]) for m in missing]
+            await record_twilio_sends(user_id, "twilio.send_whatsapp_bulk", "high", sends, source="macro")
+
+    async def _send(self, client, bucket: TokenBucket, sender: str, recipient: str, content: str) -> Dict:
+        for attempt in range(self.max_retries + 1):
+            await bucket.take()
+            try:
+                message = await client.messages.create_async(
+                    body=content, from_=sender, to=recipient, **status_callback_kwargs("message"),
+                )
+                return {"recipient": recipient, "status": "sent", "message_sid": message.sid}
+            except TwilioRestException as e:
+                if e.status == 429 and attempt < self.max_retries:
+                    await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+                    continue
+                return {"recipient": recipient, "status": "failed", "error": e.msg, "code": e.code}
+            except Exception as e:
+                return {"recipient": recipient, "status": "failed", "error": str(e)}
+
+    async def _settle(self, redis: aioredis.Redis, execution_id: str, outcome: Dict[str, Any]):
+        pipe = redis.pipeline()
+        pipe.hset(self._key(execution_id), outcome["recipient"], json.dumps(outcome))
+        pipe.hincrby(self._key(execution_id, "meta"), "settled", 1)
+        pipe.xadd(self._key(execution_id, "events"), {"outcome": json.dumps(outcome)})
+        for part in ("", "meta", "events"):
+            pipe.expire(self._key(execution_id, part), self.state_ttl)
+        await pipe.execute()
+        WHATSAPP_FANOUT_SENT.labels(status=outcome["status"]).inc()
+
+    async def read_events(
+        self, execution_id: str, user_id: str, after: str = "0-0", count: int = 100, block_ms: int = 0
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Outcomes settled after stream id `after` (oldest first), plus a cursor
+        for the next call. None if the fan-out is unknown or not the user's.
+        """
+        redis = await self.get_redis()
+        meta = await redis.hgetall(self._key(execution_id, "meta"))
+        if not meta or meta.get("user_id") != str(user_id):
+            return None
+        if int(meta.get("settled", 0)) >= int(meta["total"]):
+            block_ms = 0  # nothing more will arrive
+        streams = await redis.xread(
+            {self._key(execution_id, "events"): after}, count=count, block=block_ms or None,
+        )
+        entries = streams[0][1] if streams else []
+        if block_ms:
+            meta = await redis.hgetall(self._key(execution_id, "meta"))
+        settled, total = int(meta.get("settled", 0)), int(meta["total"])
+        return {
+            "events": [json.loads(fields["outcome"]) for _, fields in entries],
+            "cursor": entries[-1][0] if entries else after,
+            "settled": settled,
+            "total": total,
+            "done": settled >= total,
+        }
+
+
+_fanout: Optional[WhatsAppFanout] = None
+
+
+def get_whatsapp_fanout() -> WhatsAppFanout:
+    global _fanout
+    if _fanout is None:
+        _fanout = WhatsAppFanout(
+            concurrency=settings.WHATSAPP_FANOUT_CONCURRENCY,
+            rate=settings.WHATSAPP_SEND_RATE,
+            burst=settings.WHATSAPP_SEND_BURST,
+            state_ttl=settings.WHATSAPP_FANOUT_STATE_TTL,
+        )
+    return _fanout
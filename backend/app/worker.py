@@ -3,53 +3,144 @@ Zia AI — ARQ Background Worker
 Async task execution with priority queues, cron jobs, and retries.
 """
 
+import asyncio
+import importlib
 import logging
 
 from arq import cron
 from arq.connections import RedisSettings
 
 from app.config import settings
+from app.executors.base import current_execution_id
 
 logger = logging.getLogger("zia.worker")
 
 
+# Executor key → "module:Class". Modules are imported on first use so a
+# worker that never sends a WhatsApp message never imports twilio.
+EXECUTOR_PATHS = {
+    "gmail": "app.executors.gmail:GmailExecutor",
+    "twilio_voice": "app.executors.twilio_voice:TwilioVoiceExecutor",
+    "twilio_whatsapp": "app.executors.twilio_whatsapp:TwilioWhatsAppExecutor",
+    "filesystem": "app.executors.filesystem:FilesystemExecutor",
+    "browser": "app.executors.browser:BrowserExecutor",
+    "system": "app.executors.system:SystemExecutor",
+    "macros": "app.executors.macros:MacroExecutor",
+}
+
+_executors: dict = {}
+
+
+def get_executor(executor_key: str):
+    """Return the (cached) executor instance for a key, importing it on first use."""
+    executor = _executors.get(executor_key)
+    if executor is None:
+        path = EXECUTOR_PATHS.get(executor_key)
+        if not path:
+            return None
+        module_name, _, class_name = path.partition(":")
+        executor = getattr(importlib.import_module(module_name), class_name)()
+        _executors[executor_key] = executor
+        logger.info(f"Loaded executor {executor_key}")
+    return executor
+
+
 async def execute_action_task(ctx, execution_id: str, action_type: str,
                               params: dict, user_id: str):
     """ARQ task: execute an action via the appropriate executor."""
     logger.info(f"Executing {action_type} (id={execution_id}, user={user_id})")
 
-    from app.executors.gmail import GmailExecutor
-    from app.executors.twilio_voice import TwilioVoiceExecutor
-    from app.executors.twilio_whatsapp import TwilioWhatsAppExecutor
-    from app.executors.filesystem import FilesystemExecutor
-    from app.executors.browser import BrowserExecutor
-    from app.executors.system import SystemExecutor
-    from app.executors.macros import MacroExecutor
-
-    executor_map = {
-        "gmail": GmailExecutor(),
-        "twilio_voice": TwilioVoiceExecutor(),
-        "twilio_whatsapp": TwilioWhatsAppExecutor(),
-        "filesystem": FilesystemExecutor(),
-        "browser": BrowserExecutor(),
-        "system": SystemExecutor(),
-        "macros": MacroExecutor(),
-    }
-
     # Determine executor from action_type prefix
     executor_key = action_type.split(".")[0]
     if executor_key == "twilio":
         executor_key = "twilio_voice" if "call" in action_type else "twilio_whatsapp"
 
-    executor = executor_map.get(executor_key)
+    executor = get_executor(executor_key)
     if not executor:
         raise ValueError(f"No executor for action type: {action_type}")
 
+    current_execution_id.set(execution_id)
     result = await executor.execute(action_type, params, user_id)
     logger.info(f"Completed {action_type} (id={execution_id}): {result.get('status')}")
     return result
 
 
+async def execute_tool_task(ctx, tool_name: str, arguments: dict, user_id: str):
+    """
+    ARQ task: run a brain tool call dispatched by the API (TOOL_EXECUTION_MODE=arq).
+    Validation, deadlines, caching and invalidation are applied by the
+    worker's own ToolRegistry; failures come back as {"error": ...}.
+    """
+    registry = ctx["tool_registry"]
+    logger.info(f"Executing tool {tool_name} (user={user_id})")
+    return await registry.aexecute(tool_name, arguments, user_id)
+
+
+async def startup(ctx):
+    """
+    Worker startup: build the local brain tool registry (tools load lazily),
+    the shared clients that are configured (Chrome pool, Twilio) and, on
+    the default-queue worker, the Twilio status callback consumer and the
+    file catalog rescans.
+    """
+    from tools.base_tool import ToolRegistry
+    from tools.driver_pool import get_driver_pool
+    from tools.manifest import BRAIN_TOOLS
+    from tools.result_cache import ToolResultCache
+
+    registry = ToolRegistry(
+        cache=ToolResultCache(
+            max_entries=settings.TOOL_CACHE_MAX_ENTRIES,
+            redis_url=settings.REDIS_URL if settings.TOOL_CACHE_SHARED else None,
+        )
+    )
+    for spec in BRAIN_TOOLS:
+        registry.register_lazy(spec)
+    ctx["tool_registry"] = registry
+
+    if settings.BROWSER_PREWARM:
+        await asyncio.to_thread(get_driver_pool().prewarm)
+
+    if settings.TWILIO_ACCOUNT_SID:
+        from app.services.twilio_client import init_twilio_client
+        await init_twilio_client()
+
+    if settings.TWILIO_STATUS_CALLBACK_URL and settings.WORKER_QUEUE_NAME == "zia:tasks:default":
+        from app.services.twilio_status import start_status_consumer
+        start_status_consumer()
+
+    if settings.FILE_CATALOG_ENABLED and settings.WORKER_QUEUE_NAME == "zia:tasks:default":
+        from app.services.file_catalog import start_file_catalog
+        start_file_catalog()
+
+
+async def shutdown(ctx):
+    registry = ctx.get("tool_registry")
+    if registry is not None:
+        registry.shutdown()
+
+    from tools.driver_pool import shutdown_driver_pool
+    await asyncio.to_thread(shutdown_driver_pool)
+
+    from app.services.mail_outbox import shutdown_mail_outbox
+    await shutdown_mail_outbox()
+
+    if settings.TWILIO_ACCOUNT_SID:
+        from app.services.twilio_client import close_twilio_client
+        await close_twilio_client()
+
+    if settings.TWILIO_STATUS_CALLBACK_URL:
+        from app.services.twilio_status import stop_status_consumer
+        await stop_status_consumer()
+
+    if settings.FILE_CATALOG_ENABLED:
+        from app.services.file_catalog import stop_file_catalog
+        await stop_file_catalog()
+
+    from app.services.content_search import shutdown_content_search
+    shutdown_content_search()
+
+
 async def expire_confirmations(ctx):
     """Cron: expire stale pending confirmations every 60s."""
     logger.info("Running confirmation expiry sweep")
@@ -63,12 +154,15 @@ async def refresh_oauth_tokens(ctx):
 class WorkerSettings:
     """ARQ worker configuration."""
     redis_settings = RedisSettings.from_dsn(settings.REDIS_URL)
-    functions = [execute_action_task]
+    functions = [execute_action_task, execute_tool_task]
+    on_startup = startup
+    on_shutdown = shutdown
+    # Sweeps run once, on the default-queue worker only
     cron_jobs = [
         cron(expire_confirmations, second=0),        # Every minute
         cron(refresh_oauth_tokens, minute={0, 30}),  # Every 30 min
-    ]
+    ] if settings.WORKER_QUEUE_NAME == "zia:tasks:default" else []
     max_jobs = settings.WORKER_MAX_JOBS
     job_timeout = settings.WORKER_JOB_TIMEOUT
     retry_jobs = 3
-    queue_name = "zia:tasks:default"
+    queue_name = settings.WORKER_QUEUE_NAME
@@ -0,0 +1 @@
+"""Zia AI — standalone micro/throughput benchmarks (run with `python -m benchmarks.<name>`)."""
@@ -0,0 +1,124 @@
+"""
+Benchmark: content search, sequential read-everything vs ContentSearch.
+
+Builds --files text files (~4 KB of words each) under a temporary tree,
+plus binaries, oversized files and a node_modules directory that must be
+skipped. For a common term (matches early) and a rare term (needs the
+whole tree), compares:
+
+  - sequential: read every file whole, lowercase it and test `in`, then
+    take the first --limit hits (one process, no early exit)
+  - content search: app.services.content_search with --limit and the
+    default deadline, on --processes pool processes
+
+and reports wall time and the time until the first match was streamed.
+The pool is started before timing (it is long-lived in the worker).
+
+Usage (from backend/):
+    python -m benchmarks.bench_content_search [--files 20000] [--processes 0] [--limit 50]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from app.services.content_search import ContentSearch
+
+WORDS = ("alpha beta gamma delta invoice budget meeting agenda travel receipt summary "
+         "python report draft notes quarterly revenue forecast contract").split()
+
+
+def _build_tree(root: str, files: int) -> None:
+    rng = random.Random(3)
+    for i in range(files):
+        directory = os.path.join(root, f"d{i // 200}")
+        os.makedirs(directory, exist_ok=True)
+        words = [rng.choice(WORDS) for _ in range(600)]
+        if i % 997 == 0:
+            words[rng.randrange(len(words))] = "Zebracorn"  # the rare term
+        lines = [" ".join(words[j:j + 12]) for j in range(0, len(words), 12)]
+        with open(os.path.join(directory, f"note_{i}.txt"), "w") as f:
+            f.write("\n".join(lines))
+    for i in range(50):
+        with open(os.path.join(root, "d0", f"blob_{i}.bin"), "wb") as f:
+            f.write(b"\0zebracorn" * 400)
+    with open(os.path.join(root, "d0", "huge.log"), "wb") as f:
+        f.write(b"zebracorn\n" * 2_000_000)
+    os.makedirs(os.path.join(root, "node_modules", "pkg"), exist_ok=True)
+    with open(os.path.join(root, "node_modules", "pkg", "index.js"), "w") as f:
+        f.write("zebracorn")
+
+
+def _sequential(root: str, term: str, limit: int) -> int:
+    hits = []
+    for directory, _, names in os.walk(root):
+        for name in names:
+            with open(os.path.join(directory, name), "r", encoding="utf-8", errors="replace") as f:
+                if term.lower() in f.read().lower():
+                    hits.append(os.path.join(directory, name))
+    return len(hits[:limit])
+
+
+class _TimedSearch(ContentSearch):
+    """Records when the first match would have been streamed, without Redis."""
+
+    first_match = None
+
+    async def _open_events(self, execution_id, user_id):
+        return True
+
+    async def _publish(self, execution_id, found):
+        if self.first_match is None:
+            self.first_match = time.perf_counter()
+        return True
+
+    async def _finish_events(self, execution_id):
+        pass
+
+
+async def _content(search: _TimedSearch, root: str, term: str, limit: int):
+    search.first_match = None
+    start = time.perf_counter()
+    result = await search.search([term], root, limit=limit, deadline_s=60, execution_id="bench")
+    elapsed = time.perf_counter() - start
+    first = (search.first_match - start) if search.first_match else None
+    return elapsed, first, result
+
+
+async def _main(opts, root):
+    search = _TimedSearch(processes=opts.processes, max_bytes=10_000_000)
+    await asyncio.get_running_loop().run_in_executor(search._get_pool(), time.sleep, 0)
+
+    print(f"{'term':<12}{'mode':<16}{'wall ms':>9}{'first ms':>10}{'hits':>6}{'searched':>10}{'skipped':>9}")
+    for term in ("quarterly", "zebracorn"):
+        start = time.perf_counter()
+        hits = _sequential(root, term, opts.limit)
+        print(f"{term:<12}{'sequential':<16}{(time.perf_counter() - start) * 1000:>9.0f}{'':>10}{hits:>6}")
+        elapsed, first, result = await _content(search, root, term, opts.limit)
+        first_ms = f"{first * 1000:.0f}" if first is not None else "-"
+        print(f"{term:<12}{'content search':<16}{elapsed * 1000:>9.0f}{first_ms:>10}{result['count']:>6}"
+              f"{result['files_searched']:>10}{result['files_skipped']:>9}")
+    search.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=20_000)
+    parser.add_argument("--processes", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=50)
+    opts = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="zia-content-")
+    try:
+        _build_tree(root, opts.files)
+        asyncio.run(_main(opts, root))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
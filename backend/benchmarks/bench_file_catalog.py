@@ -0,0 +1,115 @@
+"""
+Benchmark: filesystem.search by tree walk (glob) vs the file catalog.
+
+Builds a synthetic tree of --files files (--per-dir per directory, three
+levels deep) under a temporary directory, then:
+
+1. indexes it with FileCatalog (full build), then rescans it unchanged and
+   after adding a file to --touch directories (incremental rescans);
+2. runs the same name queries through the old glob search and through
+   the catalog, reporting per-query latency.
+
+Usage (from backend/):
+    python -m benchmarks.bench_file_catalog [--files 100000] [--per-dir 100] [--keep DIR]
+"""
+
+import argparse
+import glob
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+
+from app.services.file_catalog import FileCatalog
+
+WORDS = ["report", "invoice", "budget", "notes", "draft", "meeting", "photo", "scan", "resume",
+         "contract", "summary", "backup", "design", "spec", "plan", "letter", "thesis", "slides"]
+EXTS = ["pdf", "docx", "txt", "jpg", "png", "xlsx", "md", "py"]
+QUERIES = [("invoice", "*"), ("budget_2", "xlsx"), ("ting_1", "*"), ("thesis_0042", "pdf"),
+           ("no-such-name", "*")]
+FUZZY = ["invioce_1", "sumary_00"]
+
+
+def _build_tree(root: str, files: int, per_dir: int) -> int:
+    rng = random.Random(1)
+    dirs = max(1, files // per_dir)
+    fanout = max(2, round(dirs ** (1 / 3)))
+    made = 0
+    for d in range(dirs):
+        path = os.path.join(root, f"a{d // (fanout * fanout)}", f"b{d // fanout % fanout}", f"c{d % fanout}")
+        os.makedirs(path, exist_ok=True)
+        for _ in range(per_dir):
+            name = f"{rng.choice(WORDS)}_{rng.randrange(10000):04d}.{rng.choice(EXTS)}"
+            open(os.path.join(path, name), "a").close()
+            made += 1
+    os.makedirs(os.path.join(root, "a0", ".git", "objects"), exist_ok=True)
+    os.makedirs(os.path.join(root, "a0", "node_modules", "left-pad"), exist_ok=True)
+    return made
+
+
+def _timed(fn, repeat: int) -> tuple:
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--per-dir", type=int, default=100)
+    parser.add_argument("--touch", type=int, default=20)
+    parser.add_argument("--keep", help="reuse/keep the tree in this directory")
+    opts = parser.parse_args()
+
+    workdir = opts.keep or tempfile.mkdtemp(prefix="zia-catalog-")
+    tree = os.path.join(workdir, "tree")
+    try:
+        if not os.path.isdir(tree):
+            start = time.perf_counter()
+            made = _build_tree(tree, opts.files, opts.per_dir)
+            print(f"built {made} files in {time.perf_counter() - start:.1f}s")
+        db = os.path.join(workdir, "catalog.db")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db + suffix):
+                os.remove(db + suffix)
+        catalog = FileCatalog(db, [tree])
+
+        print(f"\n{'scan':<26}{'wall s':>8}{'listed':>9}{'added':>9}")
+        for label, prepare, full in (
+            ("initial build", None, True),
+            ("incremental, unchanged", None, False),
+            (f"incremental, {opts.touch} dirs changed", "touch", False),
+            ("full relist", None, True),
+        ):
+            if prepare == "touch":
+                dirs = sorted({os.path.dirname(p) for p in glob.glob(os.path.join(tree, "*", "*", "*", "*"))})
+                for d in random.Random(2).sample(dirs, min(opts.touch, len(dirs))):
+                    open(os.path.join(d, "new_file.txt"), "a").close()
+            start = time.perf_counter()
+            stats = catalog.rescan(full=full)
+            print(f"{label:<26}{time.perf_counter() - start:>8.2f}{stats['listed']:>9}{stats['added']:>9}")
+        print(f"indexed files: {catalog.count()}, db size {os.path.getsize(db) / 1e6:.0f} MB")
+
+        print(f"\n{'query':<30}{'glob ms':>10}{'catalog ms':>12}{'hits':>6}")
+        for query, ext in QUERIES:
+            walk_s, walk = _timed(
+                lambda: glob.glob(os.path.join(tree, "**", f"*{query}*.{ext}"), recursive=True)[:50], 1)
+            cat_s, (hits, match, _) = _timed(lambda: catalog.search(query, tree, ext, limit=50), 20)
+            assert (match == "substring" and bool(hits)) == bool(walk), (query, match, len(walk))
+            label = f"{query}.{ext}" + ("" if match == "substring" else f" ({match})")
+            print(f"{label:<30}{walk_s * 1000:>10.0f}{cat_s * 1000:>12.2f}{len(hits):>6}")
+        for query in FUZZY:
+            cat_s, (hits, match, _) = _timed(lambda: catalog.search(query, tree, "*", limit=50), 5)
+            print(f"{query + ' (' + match + ')':<30}{'':>10}{cat_s * 1000:>12.2f}{len(hits):>6}")
+    finally:
+        if not opts.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
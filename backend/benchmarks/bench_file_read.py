@@ -0,0 +1,113 @@
+"""
+Benchmark: filesystem.read_file inline vs by reference.
+
+For text files of each --sizes MB (in the sandbox, under a temp dir in
+$HOME):
+
+  - inline: the old behaviour — read the whole file into the result, then
+    pickle it (ARQ result store) and JSON-encode it (API response). The
+    old executor refused anything over 1 MB; it is measured anyway.
+  - reference: the current read_file result (a signed link), then the
+    download itself from /api/v1/files/download served by uvicorn on
+    localhost, in full and as a Range request (1 MB, or half of a smaller file).
+  - line window: 100 lines starting 90% of the way into the file.
+
+Usage (from backend/):
+    python -m benchmarks.bench_file_read [--sizes 1,16,64]
+"""
+
+import argparse
+import json
+import os
+import pickle
+import shutil
+import socket
+import tempfile
+import threading
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+from app.api.v1 import files
+from app.executors.filesystem import FilesystemExecutor
+
+LINE = b"2026-10-19 12:00:00 INFO worker request handled in 12 ms status=200 path=/api/v1/actions\n"
+
+
+def _write(path: str, megabytes: int) -> int:
+    lines = megabytes * 1024 * 1024 // len(LINE)
+    with open(path, "wb") as f:
+        for _ in range(lines // 1000):
+            f.write(LINE * 1000)
+    return lines // 1000 * 1000
+
+
+def _serve() -> tuple:
+    app = FastAPI()
+    app.include_router(files.router, prefix="/api/v1/files")
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f"http://127.0.0.1:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1,16,64")
+    opts = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix=".zia-bench-read-", dir=os.path.expanduser("~"))
+    executor = FilesystemExecutor()
+    server, base = _serve()
+    try:
+        print(f"{'size':>6}  {'mode':<16}{'ms':>9}{'result bytes':>14}{'MB/s':>8}")
+        for megabytes in (int(s) for s in opts.sizes.split(",")):
+            path = os.path.join(workdir, f"log_{megabytes}mb.txt")
+            lines = _write(path, megabytes)
+            size = os.path.getsize(path)
+
+            start = time.perf_counter()
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                result = {"status": "read", "path": path, "size": size, "content": f.read()}
+            encoded = json.dumps(pickle.loads(pickle.dumps(result)))
+            elapsed = time.perf_counter() - start
+            print(f"{megabytes:>4}MB  {'inline':<16}{elapsed * 1000:>9.1f}{len(encoded):>14}")
+
+            start = time.perf_counter()
+            result = executor._read_file({"path": path}, "bench-user")
+            encoded = json.dumps(pickle.loads(pickle.dumps(result)))
+            elapsed = time.perf_counter() - start
+            print(f"{'':>6}  {'reference':<16}{elapsed * 1000:>9.1f}{len(encoded):>14}")
+
+            part = min(2 ** 20, size // 2)
+            with httpx.Client(base_url=base) as client:
+                for label, headers, expect in (
+                    ("  download", {}, size),
+                    ("  range", {"Range": f"bytes={size // 4}-{size // 4 + part - 1}"}, part),
+                ):
+                    start = time.perf_counter()
+                    response = client.get(result["download"]["url"], headers=headers)
+                    elapsed = time.perf_counter() - start
+                    assert len(response.content) == expect, (response.status_code, len(response.content))
+                    print(f"{'':>6}  {label:<16}{elapsed * 1000:>9.1f}{'':>14}{expect / 2 ** 20 / elapsed:>8.0f}")
+
+            start = time.perf_counter()
+            window = executor._read_file({"path": path, "start_line": lines * 9 // 10, "max_lines": 100},
+                                         "bench-user")
+            elapsed = time.perf_counter() - start
+            assert window["line_count"] == 100
+            print(f"{'':>6}  {'line window':<16}{elapsed * 1000:>9.1f}{len(json.dumps(window)):>14}")
+    finally:
+        server.should_exit = True
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: name search by glob.glob vs the streaming walk (file_walk).
+
+Builds a synthetic tree of --files user files plus a node_modules and a
+.git directory holding --vendor files more, then runs the old search
+(recursive glob, then [:50]) and search_tree for:
+
+  - a common name: the first 50 matches, then the next 50 (cursor)
+  - a rare name: the whole tree is walked (glob also descends into the
+    vendor directories; the walk prunes them)
+  - the rare name with a 50 ms deadline: partial results + cursor
+
+Usage (from backend/):
+    python -m benchmarks.bench_file_walk [--files 100000] [--vendor 100000]
+"""
+
+import argparse
+import glob
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from app.services.file_walk import decode_cursor, search_tree
+
+
+def _build_tree(root: str, files: int, vendor: int) -> None:
+    rng = random.Random(5)
+    words = ["report", "invoice", "notes", "photo", "draft", "plan", "summary", "budget"]
+    for i in range(files):
+        directory = os.path.join(root, f"p{i // 2000}", f"d{i // 100 % 20}")
+        os.makedirs(directory, exist_ok=True)
+        open(os.path.join(directory, f"{rng.choice(words)}_{i}.txt"), "a").close()
+    for i in range(vendor):
+        for name in ("node_modules", ".git"):
+            directory = os.path.join(root, "p0", name, f"m{i // 500}")
+            os.makedirs(directory, exist_ok=True)
+            open(os.path.join(directory, f"index_{i}.txt"), "a").close()
+    open(os.path.join(root, f"p{files // 4000}", "d7", "needle_report.txt"), "a").close()
+
+
+def _glob(root: str, query: str) -> tuple:
+    start = time.perf_counter()
+    matches = glob.glob(os.path.join(root, "**", f"*{query}*.txt"), recursive=True)[:50]
+    return time.perf_counter() - start, len(matches)
+
+
+def _walk(root: str, query: str, deadline_s: float = 30.0, cursor=None) -> tuple:
+    start = time.perf_counter()
+    result = search_tree(root, query, "txt", limit=50, deadline_s=deadline_s,
+                         after=decode_cursor(cursor).get("after"))
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--vendor", type=int, default=100_000)
+    opts = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="zia-walk-")
+    try:
+        _build_tree(root, opts.files, opts.vendor)
+        print(f"{'search':<30}{'ms':>9}{'hits':>6}{'visited':>9}  cursor")
+        elapsed, hits = _glob(root, "report")
+        print(f"{'glob: report':<30}{elapsed * 1000:>9.0f}{hits:>6}")
+        elapsed, first = _walk(root, "report")
+        print(f"{'walk: report':<30}{elapsed * 1000:>9.1f}{len(first['matches']):>6}"
+              f"{first['files_visited']:>9}  {'yes' if first['next_cursor'] else 'no'}")
+        elapsed, second = _walk(root, "report", cursor=first["next_cursor"])
+        assert not set(first["matches"]) & set(second["matches"])
+        print(f"{'walk: report, next 50':<30}{elapsed * 1000:>9.1f}{len(second['matches']):>6}"
+              f"{second['files_visited']:>9}  {'yes' if second['next_cursor'] else 'no'}")
+
+        elapsed, hits = _glob(root, "needle")
+        print(f"{'glob: needle':<30}{elapsed * 1000:>9.0f}{hits:>6}")
+        elapsed, rare = _walk(root, "needle")
+        print(f"{'walk: needle':<30}{elapsed * 1000:>9.0f}{len(rare['matches']):>6}{rare['files_visited']:>9}"
+              f"  {'yes' if rare['next_cursor'] else 'no'}")
+        elapsed, partial = _walk(root, "needle", deadline_s=0.05)
+        print(f"{'walk: needle, 50 ms deadline':<30}{elapsed * 1000:>9.0f}{len(partial['matches']):>6}"
+              f"{partial['files_visited']:>9}  {'yes' if partial['next_cursor'] else 'no'}"
+              f"{' (timed out)' if partial['timed_out'] else ''}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
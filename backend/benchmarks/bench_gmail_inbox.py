@@ -0,0 +1,53 @@
+"""
+Benchmark: Gmail inbox read round trips, N+1 fetches vs batched metadata.
+
+Runs both implementations against the local fake Gmail API
+(benchmarks.fake_gmail) and reports HTTP requests and wall time.
+
+Usage (from backend/):
+    python -m benchmarks.bench_gmail_inbox [--limit 50] [--page-size 50] [--delay-ms 20]
+"""
+
+import argparse
+import time
+
+from benchmarks.fake_gmail import FakeGmail
+from tools.gmail_inbox import read_inbox
+
+
+def legacy_read_inbox(service, query: str, limit: int) -> list[dict]:
+    """Inbox read before batching: list, then one messages.get per id."""
+    listing = service.users().messages().list(userId="me", maxResults=limit, q=query).execute()
+    emails = []
+    for msg in listing.get("messages", [])[:limit]:
+        detail = service.users().messages().get(userId="me", id=msg["id"]).execute()
+        emails.append({
+            h["name"]: h["value"] for h in detail["payload"]["headers"]
+            if h["name"] in ("From", "Subject", "Date")
+        })
+    return emails
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    opts = parser.parse_args()
+
+    with FakeGmail(messages=500, delay=opts.delay_ms / 1000) as fake:
+        service = fake.service()
+        print(f"{'implementation':<16}{'emails':>8}{'requests':>10}{'ms':>10}")
+        for label, fn in (
+            ("N+1 get", lambda: legacy_read_inbox(service, "", opts.limit)),
+            ("batched", lambda: read_inbox(service, "", opts.limit, opts.page_size)),
+        ):
+            fake.reset()
+            start = time.perf_counter()
+            emails = fn()
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{label:<16}{len(emails):>8}{fake.requests:>10}{elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: inbox reads from the Redis mirror vs the Gmail API.
+
+Uses the local fake Gmail API (benchmarks.fake_gmail) and a real Redis
+(--redis-url, default REDIS_URL; keys go under zia:bench:inbox and are
+removed afterwards). Reports round trips and latency for: a direct API
+read, the first mirrored read (full sync), a read after new mail
+(history replay), a fresh read (served from Redis only), a user-label
+query, a read after the history id expired (full resync), and a query
+with too few hits in a mirror holding only part of the mailbox (falls
+back to the API).
+
+Usage (from backend/):
+    python -m benchmarks.bench_gmail_mirror [--messages 500] [--delay-ms 20]
+"""
+
+import argparse
+import time
+
+import redis
+
+from app.config import settings
+from benchmarks.fake_gmail import FakeGmail
+from tools.gmail_inbox import read_inbox
+from tools.gmail_mirror import InboxMirror
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    parser.add_argument("--redis-url", default=settings.REDIS_URL)
+    opts = parser.parse_args()
+
+    client = redis.Redis.from_url(opts.redis_url, decode_responses=True)
+    mirror = InboxMirror(client, max_messages=opts.messages, sync_interval=60,
+                         namespace="zia:bench:inbox")
+    user = "bench-user"
+
+    with FakeGmail(messages=opts.messages, delay=opts.delay_ms / 1000) as fake:
+        service = fake.service()
+
+        def measure(label, fn):
+            fake.reset()
+            start = time.perf_counter()
+            emails = fn()
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{label:<28}{len(emails):>8}{fake.requests:>10}{elapsed:>10.1f}")
+            return emails
+
+        print(f"{'read':<28}{'emails':>8}{'requests':>10}{'ms':>10}")
+        measure("Gmail API (batched)", lambda: read_inbox(service, "", 10))
+        measure("mirror: full sync", lambda: mirror.read(service, user, "", 10))
+        measure("mirror: fresh", lambda: mirror.read(service, user, "is:unread", 10))
+
+        new_id = fake.add_message()
+        fake.delete_message("m00003")
+        mirror.sync_interval = 0
+        emails = measure("mirror: history replay", lambda: mirror.read(service, user, "", 10))
+        assert emails[0]["Subject"] == f"Subject {new_id}", "new mail not mirrored"
+        assert all(e["Subject"] != "Subject m00003" for e in emails), "deleted mail still mirrored"
+        measure("mirror: no changes", lambda: mirror.read(service, user, "", 10))
+
+        emails = measure("mirror: label:work", lambda: mirror.read(service, user, "label:work", 10))
+        assert all(int(e["Subject"][-5:]) % 3 == 0 for e in emails), "label not resolved"
+
+        fake.expire_history()
+        measure("mirror: expired history", lambda: mirror.read(service, user, "", 10))
+
+        partial = InboxMirror(client, max_messages=opts.messages // 5, sync_interval=60,
+                              namespace="zia:bench:inbox-partial")
+        partial.full_sync(service, user)
+        emails = measure("partial mirror: fallback",
+                         lambda: partial.read(service, user, "label:work", 50)
+                         or read_inbox(service, "label:work", 50))
+        assert len(emails) == 50, "older matching mail missed"
+        partial.clear(user)
+
+    mirror.clear(user)
+
+
+if __name__ == "__main__":
+    main()
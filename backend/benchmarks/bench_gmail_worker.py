@@ -0,0 +1,68 @@
+"""
+Benchmark: ARQ worker throughput for Gmail jobs, blocking vs offloaded I/O.
+
+Runs `gmail.read_inbox` jobs through GmailExecutor against the local fake
+Gmail API (benchmarks.fake_gmail), at most WORKER_MAX_JOBS at a time on
+one event loop — the same concurrency an ARQ worker gives its jobs. The
+"blocking" variant calls googleapiclient inline on the loop, as the
+executor used to; "offloaded" is the current executor (run_gmail_io).
+
+Usage (from backend/):
+    python -m benchmarks.bench_gmail_worker [--jobs 40] [--max-jobs 10] [--delay-ms 30]
+"""
+
+import argparse
+import asyncio
+import time
+
+import app.executors.gmail as gmail_executor
+from app.executors.gmail import GmailExecutor
+from benchmarks.fake_gmail import FakeGmail
+from tools.gmail_inbox import read_inbox
+
+
+class BlockingGmailExecutor(GmailExecutor):
+    """_read_inbox as it was: googleapiclient called directly on the event loop."""
+
+    async def _read_inbox(self, params, user_id):
+        service = await gmail_executor.get_user_gmail_service(user_id)
+        emails = read_inbox(service, params.get("query", ""), params.get("limit", 10))
+        return {"status": "inbox_read", "count": len(emails), "emails": emails}
+
+
+async def _run(executor: GmailExecutor, jobs: int, max_jobs: int) -> float:
+    slots = asyncio.Semaphore(max_jobs)
+
+    async def job(i: int):
+        async with slots:
+            result = await executor.execute("gmail.read_inbox", {"limit": 10}, f"user-{i}")
+            assert result["count"] == 10
+
+    start = time.perf_counter()
+    await asyncio.gather(*(job(i) for i in range(jobs)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=40)
+    parser.add_argument("--max-jobs", type=int, default=10)
+    parser.add_argument("--delay-ms", type=float, default=30.0)
+    opts = parser.parse_args()
+
+    with FakeGmail(messages=100, delay=opts.delay_ms / 1000) as fake:
+        service = fake.service()
+
+        async def fake_service(user_id):
+            return service
+
+        gmail_executor.get_user_gmail_service = fake_service
+
+        print(f"{'executor':<12}{'jobs/s':>10}{'wall s':>10}")
+        for label, executor in (("blocking", BlockingGmailExecutor()), ("offloaded", GmailExecutor())):
+            elapsed = asyncio.run(_run(executor, opts.jobs, opts.max_jobs))
+            print(f"{label:<12}{opts.jobs / elapsed:>10.1f}{elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: outbound email, one Gmail call per job vs the mail outbox.
+
+Sends --emails messages for one user through the local fake Gmail API
+(benchmarks.fake_gmail), at most WORKER_MAX_JOBS at a time. "per job" is
+the old executor: one messages.send round trip per email, no pacing.
+"outbox" is app.services.mail_outbox: batched sends paced by the token
+buckets. Run twice: with no quota, and with the fake enforcing
+--quota sends/s (it answers 429 beyond that, like Gmail's per-user limit).
+Action-log writes are disabled.
+
+Usage (from backend/):
+    python -m benchmarks.bench_mail_outbox [--emails 200] [--quota 50] [--delay-ms 30]
+"""
+
+import argparse
+import asyncio
+import time
+
+from googleapiclient.errors import HttpError
+
+import app.services.mail_outbox as mail_outbox
+from app.services.mail_outbox import MailOutbox, build_raw_message
+from benchmarks.fake_gmail import FakeGmail
+from tools.gmail_service import run_gmail_io
+
+
+def _emails(n: int) -> list[dict]:
+    return [{"recipient": f"user{i}@example.com", "subject": f"Notice {i}", "body": "Hello"}
+            for i in range(n)]
+
+
+async def _per_job(service, emails: list[dict], max_jobs: int) -> int:
+    slots = asyncio.Semaphore(max_jobs)
+    sent = 0
+
+    async def job(email):
+        nonlocal sent
+        raw = build_raw_message(email["recipient"], email["subject"], email["body"])
+        async with slots:
+            try:
+                await run_gmail_io(service.users().messages().send(userId="me", body={"raw": raw}).execute)
+                sent += 1
+            except HttpError:
+                pass
+
+    await asyncio.gather(*(job(e) for e in emails))
+    return sent
+
+
+async def _outbox(outbox: MailOutbox, emails: list[dict]) -> int:
+    results = await outbox.submit("bench-user", emails, "bench")
+    return sum(r["status"] == "sent" for r in results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--emails", type=int, default=200)
+    parser.add_argument("--quota", type=float, default=50.0)
+    parser.add_argument("--max-jobs", type=int, default=10)
+    parser.add_argument("--delay-ms", type=float, default=30.0)
+    opts = parser.parse_args()
+    emails = _emails(opts.emails)
+
+    print(f"{'quota':<10}{'mode':<10}{'sent':>6}{'429s':>6}{'requests':>10}{'emails/s':>10}{'wall s':>8}")
+    for quota in (0.0, opts.quota):
+        with FakeGmail(messages=1, delay=opts.delay_ms / 1000, send_quota=quota) as fake:
+            service = fake.service()
+
+            async def fake_service(user_id):
+                return service
+
+            mail_outbox.get_user_gmail_service = fake_service
+            # Pace at 80% of the quota so the bucket, not Gmail, does the throttling
+            rate = quota * 0.8 if quota else 10_000.0
+            outbox = MailOutbox(batch_size=20, user_rate=rate, user_burst=20,
+                                provider_rate=rate, provider_burst=20,
+                                retry_backoff=0.5, audit=False)
+
+            for mode, run in (("per job", lambda: _per_job(service, emails, opts.max_jobs)),
+                              ("outbox", lambda: _outbox(outbox, emails))):
+                time.sleep(1.0)  # let the fake's quota window empty
+                fake.reset()
+                start = time.perf_counter()
+                sent = asyncio.run(run())
+                elapsed = time.perf_counter() - start
+                label = f"{quota:g}/s" if quota else "none"
+                print(f"{label:<10}{mode:<10}{sent:>6}{fake.throttled:>6}{fake.requests:>10}"
+                      f"{sent / elapsed:>10.1f}{elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark: WebDriver round trips per youtube_control command.
+
+Compares the previous implementation (current_url, find_element, click,
+send_keys, separate state script — one chromedriver HTTP call each) with
+run_media_command, which does everything in a single execute_script.
+A fake driver counts calls and adds a fixed latency per call to stand
+in for the local chromedriver round trip.
+
+Usage (from backend/):
+    python -m benchmarks.bench_media_control [--calls 200] [--rtt-ms 3]
+"""
+
+import argparse
+import time
+
+from tools.youtube import run_media_command
+
+
+class FakeDriver:
+    """Counts WebDriver commands; each costs `rtt` seconds."""
+
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.round_trips = 0
+        self.paused = False
+
+    def _call(self):
+        self.round_trips += 1
+        time.sleep(self.rtt)
+
+    @property
+    def current_url(self):
+        self._call()
+        return "https://www.youtube.com/watch?v=abc"
+
+    def find_element(self, *_):
+        self._call()
+        return FakeElement(self)
+
+    def execute_script(self, script, *args):
+        self._call()
+        if args:  # run_media_command
+            action = args[0]
+            if action in ("pause", "resume"):
+                self.paused = action == "pause"
+            return {"status": "ok", "paused": self.paused, "title": "fake"}
+        return self.paused
+
+
+class FakeElement:
+    def __init__(self, driver: FakeDriver):
+        self.driver = driver
+
+    def click(self):
+        self.driver._call()
+        self.driver.paused = not self.driver.paused
+
+    def send_keys(self, *_):
+        self.driver._call()
+
+
+def legacy_control(driver, action: str) -> dict:
+    """youtube_control before batching: one WebDriver call per step."""
+    if "youtube.com" not in driver.current_url:
+        return {"error": "No YouTube session active."}
+    if action in ("next", "previous"):
+        driver.find_element("id", "movie_player").click()
+        driver.find_element("tag name", "body").send_keys("N")
+        return {"status": action}
+    is_paused = driver.execute_script("return document.querySelector('video')?.paused")
+    if (action == "pause") != is_paused:
+        driver.find_element("css selector", "button.ytp-play-button").click()
+        driver.execute_script("return document.querySelector('video')?.paused")
+    return {"status": action}
+
+
+def _run(fn, driver, calls: int) -> float:
+    actions = ("next", "pause", "resume", "previous")
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(driver, actions[i % len(actions)])
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=3.0)
+    opts = parser.parse_args()
+
+    print(f"{'implementation':<18}{'round trips/cmd':>16}{'ms/cmd':>10}")
+    for label, fn in (("legacy", legacy_control), ("single script", run_media_command)):
+        driver = FakeDriver(opts.rtt_ms / 1000)
+        elapsed = _run(fn, driver, opts.calls)
+        print(f"{label:<18}{driver.round_trips / opts.calls:>16.2f}"
+              f"{elapsed / opts.calls * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
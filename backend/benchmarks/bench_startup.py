@@ -0,0 +1,62 @@
+"""
+Benchmark: API worker startup time and resident memory, lazy vs eager tools.
+
+Each mode runs in a fresh interpreter (as a uvicorn worker would):
+  lazy  — `import app.main` (tools registered from tools.manifest)
+  eager — `import app.main`, then import + instantiate every tool module,
+          i.e. what startup cost before lazy registration
+
+Usage (from backend/):
+    python -m benchmarks.bench_startup [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+_CHILD = r"""
+import json, resource, sys, time
+start = time.perf_counter()
+import app.main
+if sys.argv[1] == "eager":
+    from tools.manifest import BRAIN_TOOLS
+    for spec in BRAIN_TOOLS:
+        spec.load()
+elapsed = time.perf_counter() - start
+heavy = [m for m in ("selenium", "googleapiclient", "google_auth_oauthlib", "twilio") if m in sys.modules]
+print(json.dumps({
+    "seconds": elapsed,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "heavy_modules": heavy,
+}))
+"""
+
+
+def _run(mode: str) -> dict:
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "postgresql+asyncpg://zia@localhost/zia")  # never connected at import
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, mode],
+        capture_output=True, text=True, env=env, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    opts = parser.parse_args()
+
+    print(f"{'mode':<8}{'startup s (median)':>20}{'max RSS MB':>12}  heavy modules imported")
+    for mode in ("eager", "lazy"):
+        samples = [_run(mode) for _ in range(opts.runs)]
+        seconds = statistics.median(s["seconds"] for s in samples)
+        rss = statistics.median(s["max_rss_mb"] for s in samples)
+        print(f"{mode:<8}{seconds:>20.3f}{rss:>12.1f}  {', '.join(samples[0]['heavy_modules']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: per-call argument validation cost in ToolRegistry.
+
+Compares the old path (jsonschema.validate per call: schema check +
+fresh validator) with the cached, precompiled validator used by
+ToolRegistry.execute.
+
+Usage (from backend/):
+    python -m benchmarks.bench_tool_validation [--calls 20000]
+"""
+
+import argparse
+import timeit
+
+import jsonschema
+
+from tools.base_tool import ToolRegistry
+from tools.browser_tool import YouTubeControlTool, YouTubeTool
+from tools.email_tool import EmailTool
+from tools.os_tool import LaunchAppTool, OpenFileTool
+
+
+def _sample_arguments(schema: dict) -> dict:
+    """Build a minimal valid argument dict from a tool schema."""
+    args = {}
+    for name, prop in schema.get("properties", {}).items():
+        if name not in schema.get("required", []):
+            continue
+        args[name] = prop["enum"][0] if "enum" in prop else "sample"
+    return args
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20_000)
+    opts = parser.parse_args()
+
+    registry = ToolRegistry()
+    for tool in (EmailTool(), OpenFileTool(), LaunchAppTool(), YouTubeTool(), YouTubeControlTool()):
+        registry.register(tool)
+
+    print(f"{'tool':<18}{'validate() µs':>16}{'cached µs':>12}{'speedup':>10}")
+    for name in registry.tool_names:
+        tool = registry.get_tool(name)
+        args = _sample_arguments(tool.parameters)
+        validator = registry._validators[name]
+
+        before = timeit.timeit(
+            lambda: jsonschema.validate(instance=args, schema=tool.parameters),
+            number=opts.calls,
+        )
+        after = timeit.timeit(lambda: validator.validate(args), number=opts.calls)
+
+        per_before = before / opts.calls * 1e6
+        per_after = after / opts.calls * 1e6
+        print(f"{name:<18}{per_before:>16.2f}{per_after:>12.2f}{per_before / per_after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: WhatsApp sends with a Client per message vs the shared async client.
+
+Runs --jobs twilio.send_whatsapp executions, at most WORKER_MAX_JOBS at a
+time on one event loop (as an ARQ worker does), against the local stub
+API (benchmarks.fake_twilio). "per message" is the old executor: a new
+synchronous twilio.rest.Client per job, called inline. "shared" is the
+current executor on app.services.twilio_client. Reports throughput,
+per-job latency and how many TCP connections the stub accepted.
+
+Usage (from backend/):
+    python -m benchmarks.bench_twilio_client [--jobs 200] [--max-jobs 10] [--delay-ms 30]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from twilio.rest import Client
+
+import app.executors.twilio_whatsapp as whatsapp_executor
+import app.services.twilio_client as twilio_client
+from app.config import settings
+from app.executors.twilio_whatsapp import TwilioWhatsAppExecutor
+from benchmarks.fake_twilio import FakeTwilio
+
+
+class PerMessageWhatsAppExecutor(TwilioWhatsAppExecutor):
+    """The executor as it was: a new blocking Client for every message."""
+
+    base_url = ""
+
+    async def execute(self, action_type, params, user_id):
+        client = Client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+        client.api.base_url = self.base_url
+        message = client.messages.create(
+            body=params["content"], from_=f"whatsapp:{settings.TWILIO_WHATSAPP_NUMBER}",
+            to=f"whatsapp:{params['recipient']}",
+        )
+        return {"status": "whatsapp_sent", "message_sid": message.sid}
+
+
+async def _run(executor, jobs: int, max_jobs: int) -> tuple[float, list[float]]:
+    slots = asyncio.Semaphore(max_jobs)
+    latencies = []
+
+    async def job(i: int):
+        async with slots:
+            start = time.perf_counter()
+            result = await executor.execute(
+                "twilio.send_whatsapp", {"recipient": f"+1555000{i:04d}", "content": "Hi"}, "bench-user",
+            )
+            latencies.append(time.perf_counter() - start)
+            assert result["message_sid"].startswith("SM")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(job(i) for i in range(jobs)))
+    return time.perf_counter() - start, latencies
+
+
+async def _shared(url: str, jobs: int, max_jobs: int):
+    client = await twilio_client.init_twilio_client()
+    client.api.base_url = url
+    try:
+        return await _run(TwilioWhatsAppExecutor(), jobs, max_jobs)
+    finally:
+        await twilio_client.close_twilio_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--max-jobs", type=int, default=10)
+    parser.add_argument("--delay-ms", type=float, default=30.0)
+    opts = parser.parse_args()
+
+    settings.TWILIO_ACCOUNT_SID = "AC" + "0" * 32
+    settings.TWILIO_AUTH_TOKEN = "bench"
+    settings.TWILIO_WHATSAPP_NUMBER = "+15550000000"
+
+    async def no_record(*args, **kwargs):
+        pass
+
+    whatsapp_executor.record_twilio_sends = no_record  # action-log writes are not measured here
+
+    with FakeTwilio(delay=opts.delay_ms / 1000) as fake:
+        PerMessageWhatsAppExecutor.base_url = fake.url
+        print(f"{'client':<14}{'jobs/s':>8}{'p50 ms':>8}{'p95 ms':>8}{'connections':>13}")
+        for label, run in (
+            ("per message", lambda: _run(PerMessageWhatsAppExecutor(), opts.jobs, opts.max_jobs)),
+            ("shared", lambda: _shared(fake.url, opts.jobs, opts.max_jobs)),
+        ):
+            fake.reset()
+            elapsed, latencies = asyncio.run(run())
+            cuts = statistics.quantiles(latencies, n=20)
+            print(f"{label:<14}{opts.jobs / elapsed:>8.1f}{cuts[9] * 1000:>8.1f}"
+                  f"{cuts[18] * 1000:>8.1f}{fake.connections:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark: WhatsApp broadcast as one action per recipient vs the fan-out.
+
+Sends one message to --recipients numbers through the local stub API
+(benchmarks.fake_twilio), which answers 429 above --quota messages/s per
+sender. "per action" runs one twilio.send_whatsapp job per recipient, at
+most WORKER_MAX_JOBS at a time, unpaced. "fan-out" is
+twilio.send_whatsapp_bulk paced at 80% of the quota. "crash + resume"
+cancels a fan-out halfway and re-runs it under the same execution id,
+as ARQ does after a worker crash; the re-run only sends what is left.
+
+Needs a real Redis (--redis-url, default REDIS_URL); keys go under
+zia:bench:fanout and expire after a minute.
+
+Usage (from backend/):
+    python -m benchmarks.bench_whatsapp_fanout [--recipients 200] [--quota 50] [--delay-ms 30]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import redis.asyncio as aioredis
+
+import app.executors.twilio_whatsapp as whatsapp_executor
+import app.services.twilio_client as twilio_client
+from app.config import settings
+from app.executors.twilio_whatsapp import TwilioWhatsAppExecutor
+from app.services.whatsapp_fanout import WhatsAppFanout
+from benchmarks.fake_twilio import FakeTwilio
+
+
+async def _per_action(recipients: list[str], max_jobs: int) -> int:
+    executor = TwilioWhatsAppExecutor()
+    slots = asyncio.Semaphore(max_jobs)
+
+    async def job(recipient):
+        async with slots:
+            try:
+                await executor.execute("twilio.send_whatsapp", {"recipient": recipient, "content": "Hi"}, "u")
+                return 1
+            except Exception:
+                return 0
+
+    return sum(await asyncio.gather(*(job(r) for r in recipients)))
+
+
+async def _main(opts):
+    settings.TWILIO_ACCOUNT_SID = "AC" + "0" * 32
+    settings.TWILIO_AUTH_TOKEN = "bench"
+    settings.TWILIO_WHATSAPP_NUMBER = "+15550000000"
+
+    async def no_record(*args, **kwargs):
+        pass
+
+    whatsapp_executor.record_twilio_sends = no_record  # action-log writes are not measured here
+    recipients = [f"+1555{i:07d}" for i in range(opts.recipients)]
+
+    with FakeTwilio(delay=opts.delay_ms / 1000, send_quota=opts.quota) as fake:
+        client = await twilio_client.init_twilio_client()
+        client.api.base_url = fake.url
+        fanout = WhatsAppFanout(concurrency=opts.max_jobs, rate=opts.quota * 0.8, burst=5,
+                                state_ttl=60, namespace="zia:bench:fanout", retry_backoff=0.5,
+                                audit=False)
+        fanout._redis = aioredis.from_url(opts.redis_url, decode_responses=True)
+
+        async def run_fanout(execution_id):
+            summary = await fanout.run(client, execution_id, "u", settings.TWILIO_WHATSAPP_NUMBER,
+                                       recipients, "Hi")
+            return summary["sent"]
+
+        async def crash_and_resume():
+            execution_id = str(uuid.uuid4())
+            await asyncio.sleep(1.0)
+            fake.reset()
+            task = asyncio.create_task(run_fanout(execution_id))
+            await asyncio.sleep(opts.recipients / (opts.quota * 0.8) / 2)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            before = fake.requests
+            await asyncio.sleep(1.0)
+            fake.reset()
+            start = time.perf_counter()
+            summary = await fanout.run(client, execution_id, "u", settings.TWILIO_WHATSAPP_NUMBER,
+                                       recipients, "Hi")
+            elapsed = time.perf_counter() - start
+            print(f"{'  cancelled run':<18}{'':>6}{'':>6}{before:>10}")
+            print(f"{'  resumed run':<18}{summary['sent']:>6}{fake.throttled:>6}{fake.requests:>10}"
+                  f"{'':>10}{elapsed:>8.2f}   ({summary['resumed']} settled before the crash,"
+                  f" {summary['unconfirmed']} unconfirmed)")
+
+        print(f"{'mode':<18}{'sent':>6}{'429s':>6}{'requests':>10}{'msgs/s':>10}{'wall s':>8}")
+        for label, run in (("per action", lambda: _per_action(recipients, opts.max_jobs)),
+                           ("fan-out", lambda: run_fanout(str(uuid.uuid4())))):
+            await asyncio.sleep(1.0)  # let the stub's quota window empty
+            fake.reset()
+            start = time.perf_counter()
+            sent = await run()
+            elapsed = time.perf_counter() - start
+            print(f"{label:<18}{sent:>6}{fake.throttled:>6}{fake.requests:>10}"
+                  f"{sent / elapsed:>10.1f}{elapsed:>8.2f}")
+
+        print("crash + resume")
+        await crash_and_resume()
+        await twilio_client.close_twilio_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--recipients", type=int, default=200)
+    parser.add_argument("--quota", type=float, default=50.0)
+    parser.add_argument("--max-jobs", type=int, default=10)
+    parser.add_argument("--delay-ms", type=float, default=30.0)
+    parser.add_argument("--redis-url", default=settings.REDIS_URL)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: YouTubeResolver against a local stub YouTube server.
+
+Serves a fake search results page (ytInitialData with videoIds) from a
+local HTTP server, then measures cold resolution (one pooled HTTP GET)
+and cached resolution, and checks the first video id is extracted.
+
+Usage (from backend/):
+    python -m benchmarks.bench_youtube_resolver [--queries 200] [--delay-ms 20]
+"""
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tools.youtube_resolver import YouTubeResolver
+
+_PAGE = (
+    '<html><script>var ytInitialData = {"contents":[{"videoRenderer":'
+    '{"videoId":"%s"}},{"videoRenderer":{"videoId":"zzzzzzzzzzz"}}]};'
+    "</script>%s</html>"
+)
+
+
+class StubYouTube(BaseHTTPRequestHandler):
+    delay = 0.0
+    requests = 0
+
+    def do_GET(self):
+        StubYouTube.requests += 1
+        time.sleep(self.delay)
+        video_id = f"{StubYouTube.requests % 10**11:011d}"
+        body = (_PAGE % (video_id, "x" * 400_000)).encode()  # real pages are ~0.5–1 MB
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    opts = parser.parse_args()
+
+    StubYouTube.delay = opts.delay_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubYouTube)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    resolver = YouTubeResolver(base_url=f"http://127.0.0.1:{server.server_port}")
+
+    queries = [f"song {i}" for i in range(opts.queries)]
+    start = time.perf_counter()
+    ids = [resolver.resolve(q) for q in queries]
+    cold = time.perf_counter() - start
+    assert all(ids) and "zzzzzzzzzzz" not in ids, "first videoId not extracted"
+
+    start = time.perf_counter()
+    for q in queries:
+        resolver.resolve(q)
+    warm = time.perf_counter() - start
+
+    print(f"stub requests:   {StubYouTube.requests}")
+    print(f"cold resolve:    {cold / opts.queries * 1000:.2f} ms/query")
+    print(f"cached resolve:  {warm / opts.queries * 1e6:.2f} µs/query")
+    resolver.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
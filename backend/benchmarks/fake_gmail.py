@@ -0,0 +1,208 @@
+"""
+Local fake Gmail API for benchmarks.
+
+Implements just enough of Gmail v1 over HTTP for the inbox and outbox
+code paths: messages.list (with paging), messages.get, messages.send,
+getProfile, history.list, labels.list and the /batch endpoint
+(multipart/mixed). Every third message carries the user label "Work"
+(id Label_1); messages.list understands q="label:work" and ignores any
+other query.
+add_message(), delete_message() and expire_history() change the mailbox
+the way the history API sees it; `send_quota` (sends per second) makes
+messages.send answer 429 like Gmail's per-user rate limit. Every HTTP
+request the server receives is counted so benchmarks can report real
+round trips. `service()` returns a
+googleapiclient resource built from the bundled discovery document with
+its root URL pointed at the server.
+"""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+_PART_RE = re.compile(r"Content-ID: <([^>]+)>.*?(GET|POST) (\S+) HTTP", re.S | re.I)
+
+
+class FakeGmail:
+    def __init__(self, messages: int = 200, delay: float = 0.0, send_quota: float = 0.0):
+        self.ids = [f"m{i:05d}" for i in range(messages)]  # newest first
+        self.dates = {m: 1_700_000_000_000 - i * 1000 for i, m in enumerate(self.ids)}
+        self.delay = delay
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.history_id = 1000
+        self.history_floor = self.history_id  # older start ids get a 404
+        self.history: list[dict] = []
+        self.send_quota = send_quota  # 0 = unlimited
+        self.sent = 0
+        self.throttled = 0
+        self._send_times: list[float] = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.sent = 0
+            self.throttled = 0
+
+    def service(self):
+        import httplib2
+        from googleapiclient import discovery_cache
+        from googleapiclient.discovery import build_from_document
+        from googleapiclient.http import HttpRequest
+
+        doc = json.loads(discovery_cache.get_static_doc("gmail", "v1"))
+        doc["rootUrl"] = self.url
+        doc["baseUrl"] = f"{self.url}gmail/v1/"
+        # New transport per request, as in tools.gmail_service — safe across threads
+        return build_from_document(
+            doc,
+            http=httplib2.Http(),
+            requestBuilder=lambda http, *a, **kw: HttpRequest(httplib2.Http(), *a, **kw),
+        )
+
+    # ── Mailbox changes (recorded in history) ──
+
+    def add_message(self) -> str:
+        with self.lock:
+            message_id = f"n{self.history_id:05d}"
+            self.ids.insert(0, message_id)
+            self.dates[message_id] = max(self.dates.values(), default=0) + 1000
+            self.history_id += 1
+            self.history.append({"id": str(self.history_id),
+                                 "messagesAdded": [{"message": {"id": message_id}}]})
+        return message_id
+
+    def delete_message(self, message_id: str):
+        with self.lock:
+            self.ids.remove(message_id)
+            self.dates.pop(message_id, None)
+            self.history_id += 1
+            self.history.append({"id": str(self.history_id),
+                                 "messagesDeleted": [{"message": {"id": message_id}}]})
+
+    def expire_history(self):
+        """Make every previously issued history id invalid."""
+        with self.lock:
+            self.history_floor = self.history_id + 1
+
+    # ── Gmail responses ──
+
+    def _send(self) -> tuple[int, dict]:
+        with self.lock:
+            now = time.monotonic()
+            if self.send_quota:
+                self._send_times = [t for t in self._send_times if now - t < 1.0]
+                if len(self._send_times) >= self.send_quota:
+                    self.throttled += 1
+                    return 429, {"error": {"code": 429, "message": "User-rate limit exceeded.",
+                                           "errors": [{"reason": "rateLimitExceeded"}]}}
+                self._send_times.append(now)
+            self.sent += 1
+            return 200, {"id": f"s{self.sent:05d}", "labelIds": ["SENT"]}
+
+    @staticmethod
+    def _labels(message_id: str) -> list[str]:
+        number = int(message_id[1:])
+        return ["INBOX"] + (["UNREAD"] if number % 2 else []) + (["Label_1"] if number % 3 == 0 else [])
+
+    def _route(self, path: str, method: str = "GET") -> tuple[int, dict]:
+        url = urlparse(path)
+        params = parse_qs(url.query)
+        if method == "POST" and url.path.endswith("/messages/send"):
+            return self._send()
+        if url.path.endswith("/profile"):
+            return 200, {"emailAddress": "me@example.com", "historyId": str(self.history_id)}
+        if url.path.endswith("/history"):
+            start = int(params["startHistoryId"][0])
+            if start < self.history_floor:
+                return 404, {"error": {"code": 404, "message": "Requested entity was not found."}}
+            records = [h for h in self.history if int(h["id"]) > start]
+            return 200, {"history": records, "historyId": str(self.history_id)}
+        if url.path.endswith("/labels"):
+            return 200, {"labels": [{"id": "INBOX", "name": "INBOX", "type": "system"},
+                                    {"id": "UNREAD", "name": "UNREAD", "type": "system"},
+                                    {"id": "Label_1", "name": "Work", "type": "user"}]}
+        if url.path.endswith("/messages"):
+            start = int(params.get("pageToken", ["0"])[0])
+            size = int(params.get("maxResults", ["100"])[0])
+            ids = self.ids
+            if params.get("q", [""])[0].lower() == "label:work":
+                ids = [m for m in ids if "Label_1" in self._labels(m)]
+            page = ids[start:start + size]
+            body = {"messages": [{"id": m, "threadId": m} for m in page]}
+            if start + size < len(ids):
+                body["nextPageToken"] = str(start + size)
+            return 200, body
+        message_id = url.path.rsplit("/", 1)[-1]
+        if message_id not in self.dates:
+            return 404, {"error": {"code": 404, "message": "Requested entity was not found."}}
+        return 200, {
+            "id": message_id,
+            "labelIds": self._labels(message_id),
+            "internalDate": str(self.dates[message_id]),
+            "payload": {"headers": [
+                {"name": "From", "value": f"sender-{message_id}@example.com"},
+                {"name": "Subject", "value": f"Subject {message_id}"},
+                {"name": "Date", "value": "Mon, 1 Jan 2024 00:00:00 +0000"},
+            ]},
+        }
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _count(self):
+                with fake.lock:
+                    fake.requests += 1
+                time.sleep(fake.delay)
+
+            def _send(self, body: bytes, content_type: str, status: int = 200):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                self._count()
+                status, body = fake._route(self.path)
+                self._send(json.dumps(body).encode(), "application/json", status)
+
+            def do_POST(self):
+                self._count()
+                raw = self.rfile.read(int(self.headers["Content-Length"])).decode()
+                if not self.path.startswith("/batch"):
+                    status, body = fake._route(self.path, "POST")
+                    self._send(json.dumps(body).encode(), "application/json", status)
+                    return
+                boundary = "fake_batch_boundary"
+                parts = []
+                for content_id, method, path in _PART_RE.findall(raw):
+                    status, payload = fake._route(path, method.upper())
+                    parts.append(
+                        f"--{boundary}\r\nContent-Type: application/http\r\n"
+                        f"Content-ID: <response-{content_id}>\r\n\r\n"
+                        f"HTTP/1.1 {status} OK\r\nContent-Type: application/json\r\n\r\n"
+                        f"{json.dumps(payload)}\r\n"
+                    )
+                body = ("".join(parts) + f"--{boundary}--\r\n").encode()
+                self._send(body, f"multipart/mixed; boundary={boundary}")
+
+            def log_message(self, *_):
+                pass
+
+        return Handler
@@ -0,0 +1,95 @@
+"""
+Local stub of the Twilio REST API for benchmarks.
+
+Answers POST .../Messages.json and .../Calls.json with a minimal resource
+after `delay` seconds, over HTTP/1.1 keep-alive. With `send_quota`
+(messages per second) it answers 429 beyond that rate, like Twilio's
+per-sender queue limit. Counts requests, rejections and the TCP
+connections it accepted, so benchmarks can report connection reuse.
+Point a client at it with `client.api.base_url = fake.url`.
+"""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeTwilio:
+    def __init__(self, delay: float = 0.0, send_quota: float = 0.0):
+        self.delay = delay
+        self.send_quota = send_quota  # 0 = unlimited
+        self.requests = 0
+        self.throttled = 0
+        self.connections = 0
+        self._send_times: list[float] = []
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.server.handle_error = lambda request, address: None  # clients hanging up mid-request
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.throttled = 0
+            self.connections = 0
+            self._send_times = []
+
+    def _admit(self) -> bool:
+        with self.lock:
+            if not self.send_quota:
+                return True
+            now = time.monotonic()
+            self._send_times = [t for t in self._send_times if now - t < 1.0]
+            if len(self._send_times) >= self.send_quota:
+                self.throttled += 1
+                return False
+            self._send_times.append(now)
+            return True
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out as separate writes; don't let Nagle hold the body
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with fake.lock:
+                    fake.connections += 1
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with fake.lock:
+                    fake.requests += 1
+                    n = fake.requests
+                time.sleep(fake.delay)
+                if fake._admit():
+                    status = 201
+                    prefix = "CA" if self.path.endswith("/Calls.json") else "SM"
+                    payload = {"sid": f"{prefix}{n:032d}", "status": "queued"}
+                else:
+                    status = 429
+                    payload = {"code": 20429, "message": "Too Many Requests", "status": 429}
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_):
+                pass
+
+        return Handler
@@ -11,15 +11,43 @@ Security:
   - Arguments validated via jsonschema before execution
   - API errors caught and surfaced cleanly
   - Malformed model output handled gracefully
+
+Execution:
+  - think()  — synchronous (CLI); tools run via ToolRegistry.execute
+  - athink() — async (API); Groq via AsyncGroq, tools via ToolRegistry.aexecute,
+               so a slow tool never blocks the event loop
+
+Memory:
+  - Long-term recall runs in parallel with prompt assembly under a hard
+    latency budget (MEMORY_RECALL_BUDGET_MS); a late recall is dropped.
+  - Salient facts from the user's message are persisted in the background
+    after the reply is returned.
 """
 
+import asyncio
 import json
 import logging
 import re
-from groq import Groq, APIError, RateLimitError, AuthenticationError, APIConnectionError
-
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from groq import (
+    Groq,
+    AsyncGroq,
+    APIError,
+    RateLimitError,
+    AuthenticationError,
+    APIConnectionError,
+)
+
+from app.middleware.metrics import (
+    MEMORY_RECALL_COUNT,
+    MEMORY_RECALL_LATENCY,
+    MEMORY_RECALL_TOKENS,
+)
 from core.config import settings
-from core.memory import ShortTermMemory, LongTermMemory
+from core.memory import ShortTermMemory, LongTermMemory, extract_facts, user_memory_path
 from tools.base_tool import ToolRegistry
 
 logger = logging.getLogger("zia.brain")
@@ -27,6 +55,11 @@ logger = logging.getLogger("zia.brain")
 MAX_TOOL_ROUNDS = 3
 
 
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 chars/token) — good enough for budgeting metrics."""
+    return max(1, len(text) // 4)
+
+
 def _build_system_prompt(registry: ToolRegistry) -> str:
     """Build system prompt that includes available tools as JSON instructions."""
     tool_descriptions = []
@@ -76,47 +109,159 @@ class ZiaBrain:
 
     def __init__(self, registry: ToolRegistry, memory: ShortTermMemory):
         self.client = Groq(api_key=settings.GROQ_API_KEY)
+        self.async_client = AsyncGroq(api_key=settings.GROQ_API_KEY)
         self.model = settings.GROQ_MODEL
         self.registry = registry
         self.memory = memory
-        self.long_term = LongTermMemory()
+        # One long-term store per user: facts never leak between accounts
+        self._long_term: dict[str, LongTermMemory] = {}
+        self._long_term_lock = threading.Lock()
         self._system_prompt = _build_system_prompt(registry)
 
+        # Separate pools: a slow write must never eat the recall budget
+        self._recall_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="zia-recall")
+        self._persist_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zia-persist")
+
         logger.info("Brain initialized — model: %s", self.model)
         logger.info("Available tools: %s", registry.tool_names)
 
-    def think(self, user_input: str) -> str:
+    def think(self, user_input: str, user_id: str = "") -> str:
         """
         Process user input, detect JSON actions, execute tools,
         and return the final text response.
+        `user_id` scopes tool result caching and long-term memory.
         """
         self.memory.add("user", user_input)
 
+        # Kick off recall first so it overlaps with prompt assembly
+        recall = self._recall_pool.submit(self._timed_recall, user_input, user_id)
+        messages = self._base_messages()
+
+        budget = settings.MEMORY_RECALL_BUDGET_MS / 1000
+        try:
+            entries = recall.result(timeout=budget)
+        except FutureTimeout:
+            entries = None
+        except Exception:
+            entries = None  # reported by _inject_recall from the future itself
+        self._inject_recall(messages, entries, recall)
+
+        try:
+            final_text = self._action_loop(messages, user_id)
+        except Exception as e:
+            final_text = self._error_reply(e)
+
+        self.memory.add("assistant", final_text)
+        self._persist_pool.submit(self._persist_facts, user_input, user_id)
+        return final_text
+
+    async def athink(self, user_input: str, user_id: str = "") -> str:
+        """Async variant of think() for use inside the API event loop."""
+        self.memory.add("user", user_input)
+
+        recall = self._recall_pool.submit(self._timed_recall, user_input, user_id)
+        messages = self._base_messages()
+
+        budget = settings.MEMORY_RECALL_BUDGET_MS / 1000
+        # asyncio.wait, unlike wait_for, never cancels the recall on timeout
+        wrapped = asyncio.wrap_future(recall)
+        done, _ = await asyncio.wait({wrapped}, timeout=budget)
+        if done and not wrapped.cancelled() and wrapped.exception() is None:
+            entries = wrapped.result()
+        else:
+            entries = None  # reported by _inject_recall from the future itself
+        self._inject_recall(messages, entries, recall)
+
+        try:
+            final_text = await self._async_action_loop(messages, user_id)
+        except Exception as e:
+            final_text = self._error_reply(e)
+
+        self.memory.add("assistant", final_text)
+        self._persist_pool.submit(self._persist_facts, user_input, user_id)
+        return final_text
+
+    def _base_messages(self) -> list[dict]:
         messages = [{"role": "system", "content": self._system_prompt}]
         messages.extend(self.memory.get_messages())
+        return messages
 
-        try:
-            final_text = self._action_loop(messages)
-        except RateLimitError as e:
+    @staticmethod
+    def _error_reply(e: Exception) -> str:
+        """Map an exception from the action loop to a user-facing reply."""
+        if isinstance(e, RateLimitError):
             logger.error("Groq rate limit: %s", e)
-            final_text = "Rate limit reached. Please wait a moment and try again."
-        except AuthenticationError as e:
+            return "Rate limit reached. Please wait a moment and try again."
+        if isinstance(e, AuthenticationError):
             logger.error("Groq auth error: %s", e)
-            final_text = "Invalid GROQ_API_KEY. Check your .env file."
-        except APIConnectionError as e:
+            return "Invalid GROQ_API_KEY. Check your .env file."
+        if isinstance(e, APIConnectionError):
             logger.error("Groq connection error: %s", e)
-            final_text = "Cannot reach Groq API. Check your internet connection."
-        except APIError as e:
+            return "Cannot reach Groq API. Check your internet connection."
+        if isinstance(e, APIError):
             logger.error("Groq API error: %s", e)
-            final_text = f"Sorry, API error: {e}"
+            return f"Sorry, API error: {e}"
+        logger.error("Unexpected error in think(): %s", e, exc_info=True)
+        return f"Sorry, something went wrong: {e}"
+
+    # ── Long-term memory ──
+
+    def long_term(self, user_id: str = "") -> LongTermMemory:
+        """The long-term memory store of one user."""
+        with self._long_term_lock:
+            store = self._long_term.get(user_id)
+            if store is None:
+                store = self._long_term[user_id] = LongTermMemory(user_memory_path(user_id))
+            return store
+
+    def _timed_recall(self, query: str, user_id: str) -> list[dict]:
+        start = time.perf_counter()
+        try:
+            return self.long_term(user_id).recall(query, limit=settings.MEMORY_RECALL_LIMIT)
+        finally:
+            MEMORY_RECALL_LATENCY.observe(time.perf_counter() - start)
+
+    def _inject_recall(self, messages: list[dict], entries: list[dict] | None, recall: Future):
+        """
+        Add recalled facts to the prompt as a second system message.
+        `entries` is None when the recall missed the latency budget or failed.
+        """
+        if entries is None:
+            if recall.done() and not recall.cancelled() and recall.exception() is not None:
+                MEMORY_RECALL_COUNT.labels("error").inc()
+                logger.error("Memory recall failed: %s", recall.exception())
+            else:
+                recall.cancel()  # still queued behind other recalls: nobody will read it
+                MEMORY_RECALL_COUNT.labels("timeout").inc()
+                logger.warning(
+                    "Memory recall exceeded %d ms budget — skipped.",
+                    settings.MEMORY_RECALL_BUDGET_MS,
+                )
+            return
+
+        if not entries:
+            MEMORY_RECALL_COUNT.labels("miss").inc()
+            return
+
+        lines = "\n".join(f"- {e['key']}: {e['value']}" for e in entries)
+        block = f"Things you remember about the user (use only if relevant):\n{lines}"
+        MEMORY_RECALL_COUNT.labels("hit").inc()
+        MEMORY_RECALL_TOKENS.observe(_estimate_tokens(block))
+        messages.insert(1, {"role": "system", "content": block})
+
+    def _persist_facts(self, user_input: str, user_id: str):
+        """Store salient facts from the user's message (runs off the request path)."""
+        try:
+            store = self.long_term(user_id)
+            for key, value in extract_facts(user_input):
+                if store.upsert(key, value, {"source": "conversation"}):
+                    logger.info("Remembered %s", key)
         except Exception as e:
-            logger.error("Unexpected error in think(): %s", e, exc_info=True)
-            final_text = f"Sorry, something went wrong: {e}"
+            logger.error("Failed to persist memory: %s", e)
 
-        self.memory.add("assistant", final_text)
-        return final_text
+    # ── Action loop ──
 
-    def _action_loop(self, messages: list[dict]) -> str:
+    def _action_loop(self, messages: list[dict], user_id: str = "") -> str:
         """
         Call the LLM, parse response for JSON actions, execute, loop.
         Capped at MAX_TOOL_ROUNDS.
@@ -128,24 +273,15 @@ class ZiaBrain:
                 model=self.model,
                 messages=messages,
             )
-
-            content = response.choices[0].message.content or ""
-            messages.append({"role": "assistant", "content": content})
-
-            # Try to parse as a tool action
-            action = self._extract_action(content)
+            action = self._record_reply(messages, response)
 
             # No action detected — this is a plain text reply
             if action is None:
-                return content
+                return messages[-1]["content"]
 
             # Depth limit reached — ask for a text summary
             if round_num >= MAX_TOOL_ROUNDS:
-                logger.warning("Max action rounds (%d) reached.", MAX_TOOL_ROUNDS)
-                messages.append({
-                    "role": "user",
-                    "content": "Action limit reached. Please summarize what you've done so far in plain text.",
-                })
+                self._request_summary(messages)
                 summary = self.client.chat.completions.create(
                     model=self.model,
                     messages=messages,
@@ -154,19 +290,63 @@ class ZiaBrain:
 
             # Execute the action
             tool_name = action["action"]
-            tool_args = action.get("arguments", {})
             logger.info("Action detected [round %d]: %s", round_num, tool_name)
+            result = self.registry.execute(tool_name, action.get("arguments", {}), user_id)
+            self._feed_result(messages, tool_name, result)
 
-            result = self.registry.execute(tool_name, tool_args)
+        return "I wasn't able to complete the request."
+
+    async def _async_action_loop(self, messages: list[dict], user_id: str = "") -> str:
+        """Async twin of _action_loop() — same protocol, non-blocking I/O."""
+        for round_num in range(MAX_TOOL_ROUNDS + 1):
+            logger.debug("Action round %d", round_num)
 
-            # Feed result back to model for a human-readable response
-            messages.append({
-                "role": "user",
-                "content": f"Tool result for {tool_name}: {json.dumps(result)}\n\nNow respond to the user about what happened. Use plain text only.",
-            })
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+            )
+            action = self._record_reply(messages, response)
+
+            if action is None:
+                return messages[-1]["content"]
+
+            if round_num >= MAX_TOOL_ROUNDS:
+                self._request_summary(messages)
+                summary = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                )
+                return summary.choices[0].message.content or ""
+
+            tool_name = action["action"]
+            logger.info("Action detected [round %d]: %s", round_num, tool_name)
+            result = await self.registry.aexecute(tool_name, action.get("arguments", {}), user_id)
+            self._feed_result(messages, tool_name, result)
 
         return "I wasn't able to complete the request."
 
+    def _record_reply(self, messages: list[dict], response) -> dict | None:
+        """Append the model reply to the transcript and parse any tool action."""
+        content = response.choices[0].message.content or ""
+        messages.append({"role": "assistant", "content": content})
+        return self._extract_action(content)
+
+    @staticmethod
+    def _request_summary(messages: list[dict]):
+        logger.warning("Max action rounds (%d) reached.", MAX_TOOL_ROUNDS)
+        messages.append({
+            "role": "user",
+            "content": "Action limit reached. Please summarize what you've done so far in plain text.",
+        })
+
+    @staticmethod
+    def _feed_result(messages: list[dict], tool_name: str, result: dict):
+        """Feed a tool result back to the model for a human-readable response."""
+        messages.append({
+            "role": "user",
+            "content": f"Tool result for {tool_name}: {json.dumps(result)}\n\nNow respond to the user about what happened. Use plain text only.",
+        })
+
     @staticmethod
     def _extract_action(text: str) -> dict | None:
         """
@@ -25,6 +25,24 @@ try:
         SPOTIFY_CLIENT_ID: str = getattr(_app_settings, "SPOTIFY_CLIENT_ID", "")
         SPOTIFY_CLIENT_SECRET: str = getattr(_app_settings, "SPOTIFY_CLIENT_SECRET", "")
         MAX_CONVERSATION_TURNS: int = 20
+        MEMORY_RECALL_BUDGET_MS: int = getattr(_app_settings, "MEMORY_RECALL_BUDGET_MS", 150)
+        MEMORY_RECALL_LIMIT: int = getattr(_app_settings, "MEMORY_RECALL_LIMIT", 3)
+        BROWSER_POOL_SIZE: int = getattr(_app_settings, "BROWSER_POOL_SIZE", 2)
+        BROWSER_HEADLESS: bool = getattr(_app_settings, "BROWSER_HEADLESS", False)
+        BROWSER_MAX_USES: int = getattr(_app_settings, "BROWSER_MAX_USES", 50)
+        BROWSER_HEALTH_INTERVAL: int = getattr(_app_settings, "BROWSER_HEALTH_INTERVAL", 60)
+        BROWSER_STEP_TIMEOUT: int = getattr(_app_settings, "BROWSER_STEP_TIMEOUT", 10)
+        BROWSER_HEARTBEAT_INTERVAL: int = getattr(_app_settings, "BROWSER_HEARTBEAT_INTERVAL", 0)
+        GMAIL_PAGE_SIZE: int = getattr(_app_settings, "GMAIL_PAGE_SIZE", 50)
+        GMAIL_SERVICE_CACHE_SIZE: int = getattr(_app_settings, "GMAIL_SERVICE_CACHE_SIZE", 128)
+        GMAIL_REFRESH_MARGIN: int = getattr(_app_settings, "GMAIL_REFRESH_MARGIN", 300)
+        GMAIL_IO_THREADS: int = getattr(_app_settings, "GMAIL_IO_THREADS", 8)
+        GMAIL_MIRROR_ENABLED: bool = getattr(_app_settings, "GMAIL_MIRROR_ENABLED", True)
+        GMAIL_MIRROR_MAX_MESSAGES: int = getattr(_app_settings, "GMAIL_MIRROR_MAX_MESSAGES", 500)
+        GMAIL_MIRROR_SYNC_INTERVAL: int = getattr(_app_settings, "GMAIL_MIRROR_SYNC_INTERVAL", 30)
+        REDIS_URL: str = getattr(_app_settings, "REDIS_URL", "redis://localhost:6379/0")
+        YOUTUBE_BASE_URL: str = getattr(_app_settings, "YOUTUBE_BASE_URL", "https://www.youtube.com")
+        YOUTUBE_RESOLVE_TTL: int = getattr(_app_settings, "YOUTUBE_RESOLVE_TTL", 3600)
         ALLOWED_DIRECTORIES: list = os.getenv(
             "ALLOWED_DIRECTORIES", r"D:\Zia AI;C:\Users"
         ).split(";")
@@ -73,6 +91,25 @@ except ImportError:
         SPOTIFY_CLIENT_ID: str = os.getenv("SPOTIFY_CLIENT_ID", "")
         SPOTIFY_CLIENT_SECRET: str = os.getenv("SPOTIFY_CLIENT_SECRET", "")
         MAX_CONVERSATION_TURNS: int = int(os.getenv("MAX_CONVERSATION_TURNS", "20"))
+        MEMORY_RECALL_BUDGET_MS: int = int(os.getenv("MEMORY_RECALL_BUDGET_MS", "150"))
+        MEMORY_RECALL_LIMIT: int = int(os.getenv("MEMORY_RECALL_LIMIT", "3"))
+        BROWSER_POOL_SIZE: int = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+        BROWSER_HEADLESS: bool = os.getenv("BROWSER_HEADLESS", "false").lower() == "true"
+        BROWSER_MAX_USES: int = int(os.getenv("BROWSER_MAX_USES", "50"))
+        BROWSER_HEALTH_INTERVAL: int = int(os.getenv("BROWSER_HEALTH_INTERVAL", "60"))
+        BROWSER_STEP_TIMEOUT: int = int(os.getenv("BROWSER_STEP_TIMEOUT", "10"))
+        BROWSER_HEARTBEAT_INTERVAL: int = int(os.getenv("BROWSER_HEARTBEAT_INTERVAL", "0"))
+        GMAIL_PAGE_SIZE: int = int(os.getenv("GMAIL_PAGE_SIZE", "50"))
+        GMAIL_SERVICE_CACHE_SIZE: int = int(os.getenv("GMAIL_SERVICE_CACHE_SIZE", "128"))
+        GMAIL_REFRESH_MARGIN: int = int(os.getenv("GMAIL_REFRESH_MARGIN", "300"))
+        GMAIL_IO_THREADS: int = int(os.getenv("GMAIL_IO_THREADS", "8"))
+        # No Redis in standalone CLI mode — the mirror is off
+        GMAIL_MIRROR_ENABLED: bool = os.getenv("GMAIL_MIRROR_ENABLED", "false").lower() == "true"
+        GMAIL_MIRROR_MAX_MESSAGES: int = int(os.getenv("GMAIL_MIRROR_MAX_MESSAGES", "500"))
+        GMAIL_MIRROR_SYNC_INTERVAL: int = int(os.getenv("GMAIL_MIRROR_SYNC_INTERVAL", "30"))
+        REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        YOUTUBE_BASE_URL: str = os.getenv("YOUTUBE_BASE_URL", "https://www.youtube.com")
+        YOUTUBE_RESOLVE_TTL: int = int(os.getenv("YOUTUBE_RESOLVE_TTL", "3600"))
         ALLOWED_DIRECTORIES: list = os.getenv(
             "ALLOWED_DIRECTORIES", r"D:\Zia AI;C:\Users"
         ).split(";")
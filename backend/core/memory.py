@@ -2,14 +2,70 @@
 Memory system for Zia AI.
 
 ShortTermMemory — rolling conversation buffer for LLM context.
-LongTermMemory  — placeholder for future vector-based retrieval.
+LongTermMemory  — JSON-backed fact store with keyword recall.
 """
 
+import hashlib
 import json
 import os
+import re
+import threading
 from datetime import datetime
 from typing import Optional
 
+# ── Salient fact extraction ──
+# Fact values run to the end of the sentence; dots inside a token
+# (emails, domains, decimals) don't end it.
+_VALUE = r"(?P<value>(?:[^.!?\n]|\.(?=\S)){2,120})"
+
+# (key template, pattern) — an optional "slot" group refines the key
+# (e.g. "my email is ..." → user.email).
+_FACT_PATTERNS = [
+    ("user.{slot}", re.compile(
+        r"\bmy (?P<slot>name|email|phone(?: number)?|birthday|address|"
+        r"favou?rite [a-z]+) is " + _VALUE, re.IGNORECASE)),
+    ("user.location", re.compile(r"\bi live in " + _VALUE, re.IGNORECASE)),
+    ("user.workplace", re.compile(r"\bi work (?:at|for) " + _VALUE, re.IGNORECASE)),
+    ("user.preference", re.compile(
+        r"\bi (?:really )?(?:like|love|prefer) " + _VALUE, re.IGNORECASE)),
+    ("note", re.compile(r"\bremember (?:that )?" + _VALUE, re.IGNORECASE)),
+]
+
+_WORD_RE = re.compile(r"[a-z0-9@.]{3,}")
+_STOPWORDS = {
+    "the", "and", "for", "you", "your", "are", "what", "who", "how", "can",
+    "please", "with", "that", "this", "from", "have", "about", "zia", "tell",
+}
+
+
+def extract_facts(text: str) -> list[tuple[str, str]]:
+    """Return (key, value) pairs worth persisting from a user message."""
+    facts = []
+    for key_template, pattern in _FACT_PATTERNS:
+        for match in pattern.finditer(text):
+            slot = (match.groupdict().get("slot") or "").lower().replace(" ", "_")
+            key = key_template.format(slot=slot) if slot else key_template
+            facts.append((key, match.group("value").strip()))
+    return facts
+
+
+_SAFE_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def user_memory_path(user_id: str, root: str = "~/.zia/memory") -> str:
+    """
+    Storage file for one user's long-term memory.
+    An empty user_id (the local CLI) keeps the original single-user file.
+    """
+    if not user_id:
+        return "~/.zia/memory.json"
+    name = user_id if _SAFE_ID_RE.fullmatch(user_id) else hashlib.sha256(user_id.encode()).hexdigest()
+    return os.path.join(root, f"{name}.json")
+
+
+def _keywords(text: str) -> set[str]:
+    return {w.strip(".") for w in _WORD_RE.findall(text.lower())} - _STOPWORDS
+
 
 class ShortTermMemory:
     """
@@ -44,25 +100,68 @@ class ShortTermMemory:
 
 class LongTermMemory:
     """
-    Placeholder for persistent memory.
-    Currently writes to a JSON file. Will be replaced with a vector DB
-    (ChromaDB/Pinecone) in a future phase.
+    Persistent memory backed by a JSON file.
+    Entries are cached in-process and only re-read when the file changes.
+    Will be replaced with a vector DB (ChromaDB/Pinecone) in a future phase.
     """
 
     def __init__(self, storage_path: str = "~/.zia/memory.json"):
         self._path = os.path.expanduser(storage_path)
         os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._cache: list[dict] = []
+        self._cache_mtime: float | None = None
 
     def store(self, key: str, value: str, metadata: Optional[dict] = None):
         """Store a fact or task result."""
-        entries = self._load()
-        entries.append({
-            "key": key,
-            "value": value,
-            "metadata": metadata or {},
-            "timestamp": datetime.now().isoformat(),
-        })
-        self._save(entries)
+        with self._lock:
+            entries = self._load()
+            entries.append({
+                "key": key,
+                "value": value,
+                "metadata": metadata or {},
+                "timestamp": datetime.now().isoformat(),
+            })
+            self._save(entries)
+
+    def upsert(self, key: str, value: str, metadata: Optional[dict] = None) -> bool:
+        """
+        Store a fact, replacing any previous value under the same key.
+        Returns False when the exact fact is already known (no write).
+        """
+        with self._lock:
+            entries = self._load()
+            for entry in entries:
+                if entry["key"] == key and entry["value"] == value:
+                    return False
+            # Keys like "note" and "user.preference" hold many values
+            if key.startswith("user.") and key != "user.preference":
+                entries = [e for e in entries if e["key"] != key]
+            entries.append({
+                "key": key,
+                "value": value,
+                "metadata": metadata or {},
+                "timestamp": datetime.now().isoformat(),
+            })
+            self._save(entries)
+            return True
+
+    def recall(self, query: str, limit: int = 3) -> list[dict]:
+        """
+        Rank stored entries by keyword overlap with the query.
+        Returns at most `limit` entries, best match first.
+        """
+        terms = _keywords(query)
+        if not terms:
+            return []
+        scored = []
+        for entry in self._load():
+            key_words = entry["key"].replace(".", " ").replace("_", " ")
+            overlap = len(terms & _keywords(f'{key_words} {entry["value"]}'))
+            if overlap:
+                scored.append((overlap, entry["timestamp"], entry))
+        scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        return [entry for _, _, entry in scored[:limit]]
 
     def search(self, query: str, limit: int = 5) -> list[dict]:
         """
@@ -77,11 +176,20 @@ class LongTermMemory:
         return results[-limit:]
 
     def _load(self) -> list[dict]:
-        if not os.path.exists(self._path):
+        try:
+            mtime = os.path.getmtime(self._path)
+        except OSError:
             return []
-        with open(self._path, "r") as f:
-            return json.load(f)
+        if mtime != self._cache_mtime:
+            with open(self._path, "r") as f:
+                self._cache = json.load(f)
+            self._cache_mtime = mtime
+        return list(self._cache)
 
     def _save(self, entries: list[dict]):
-        with open(self._path, "w") as f:
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "w") as f:
             json.dump(entries, f, indent=2)
+        os.replace(tmp_path, self._path)
+        self._cache = list(entries)
+        self._cache_mtime = os.path.getmtime(self._path)
@@ -3,19 +3,53 @@ Base tool and tool registry for Zia AI.
 
 Every tool subclasses BaseTool and provides:
   - name, description, parameters (JSON Schema)
-  - execute(**kwargs) -> dict
+  - execute(**kwargs) -> dict   (plain or `async def`)
+  - timeout, max_concurrency    (execution limits, see below)
+
+Execution: each tool class gets its own bounded thread pool
+(max_concurrency workers), so a stuck Chrome session cannot starve
+Gmail. Tools driving the same resource set a common `pool_key` and share
+one pool, so their calls never interleave. Native async tools run on the event loop behind a per-class
+semaphore. Every call is bounded by the tool's timeout; queued calls
+are cancelled, running threads are abandoned and reported as timed out.
+
+Lazy loading: register_lazy(ToolSpec(...)) advertises a tool from its
+static schema and imports the implementing module on first execution,
+so API workers don't pay for selenium/googleapiclient until needed.
+
+Remote execution: a registry built with a dispatcher (see
+app.core.tool_dispatch) sends aexecute() calls to ARQ workers instead of
+running them in-process; execute() always runs locally.
+
+Caching: pure lookups may declare `cacheable`, `cache_key_args` and
+`cache_ttl`; repeats are served from a ToolResultCache. Tools with side
+effects list the tools they make stale in `invalidates` (e.g. sending an
+email invalidates that user's cached inbox).
+
+Per-user tools set `needs_user`; execute() then also receives `user_id`
+(it is not part of the schema the model sees).
 
 Security: ToolRegistry validates arguments against JSON schemas
-before execution. Malformed inputs are rejected.
+before execution. Malformed inputs are rejected. Each tool's schema is
+checked once at registration and its compiled validator is reused.
 """
 
+import asyncio
+import importlib
+import inspect
 import json
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from typing import Any
 
 import jsonschema
 
+from app.middleware.metrics import TOOL_CALL_COUNT, TOOL_QUEUE_LATENCY, TOOL_RUN_LATENCY
+from tools.result_cache import ToolResultCache
+
 logger = logging.getLogger("zia.tools")
 
 # ── Sensitive fields to redact in logs ──
@@ -43,9 +77,22 @@ class BaseTool(ABC):
     description: str = ""
     parameters: dict = {}  # JSON Schema for the tool's inputs
 
+    timeout: float = 30.0  # seconds before a call is abandoned
+    max_concurrency: int = 2  # parallel calls per tool class (per pool_key when set)
+    pool_key: str = ""  # tools with the same key share one pool / semaphore
+    risk_level: str = "low"  # RiskLevel value; picks the worker queue in remote mode
+
+    # ── Result caching (idempotent lookups only) ──
+    cacheable: bool = False
+    cache_key_args: tuple[str, ...] = ()  # arguments identifying a result; () = all
+    cache_ttl: float = 0.0  # seconds
+    invalidates: tuple[str, ...] = ()  # tool names whose cached results this tool makes stale
+
+    needs_user: bool = False  # execute() also receives the caller's user_id (per-user credentials)
+
     @abstractmethod
     def execute(self, **kwargs) -> dict:
-        """Run the tool and return a result dict."""
+        """Run the tool and return a result dict. May be `async def`."""
         ...
 
     def tool_schema(self) -> dict:
@@ -60,6 +107,40 @@ class BaseTool(ABC):
         }
 
 
+class ToolSpec:
+    """
+    Static description of a tool: import path plus the schema the LLM sees.
+    Importable without the tool's module or its heavy dependencies.
+    """
+
+    def __init__(self, import_path: str, name: str, description: str, parameters: dict,
+                 risk_level: str = "low"):
+        self.import_path = import_path  # "package.module:ClassName"
+        self.name = name
+        self.description = description
+        self.parameters = parameters
+        self.risk_level = risk_level
+
+    def load(self) -> BaseTool:
+        """Import the implementing module and instantiate the tool."""
+        module_name, _, class_name = self.import_path.partition(":")
+        tool = getattr(importlib.import_module(module_name), class_name)()
+        if tool.name != self.name:
+            raise ValueError(f"{self.import_path} provides '{tool.name}', expected '{self.name}'")
+        return tool
+
+    def tool_schema(self) -> dict:
+        """Return the tool schema (OpenAI-compatible format, used by Groq)."""
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.parameters,
+            },
+        }
+
+
 class ToolRegistry:
     """
     Central registry of all available tools.
@@ -67,50 +148,278 @@ class ToolRegistry:
     Validates arguments before execution.
     """
 
-    def __init__(self):
-        self._tools: dict[str, BaseTool] = {}
+    def __init__(self, cache: ToolResultCache | None = None, dispatcher=None):
+        self._tools: dict[str, BaseTool | ToolSpec] = {}
+        self._cache = cache
+        self._dispatcher = dispatcher  # e.g. ArqToolDispatcher; None = run in-process
+        self._validators: dict[str, jsonschema.protocols.Validator] = {}
+        self._pools: dict[type | str, ThreadPoolExecutor] = {}
+        self._semaphores: dict[type | str, asyncio.Semaphore] = {}
+        self._pool_lock = threading.Lock()
+        self._load_lock = threading.Lock()
 
     def register(self, tool: BaseTool):
-        """Register a tool instance."""
+        """Register a tool instance and compile its argument validator."""
         if not tool.name:
             raise ValueError(f"Tool {type(tool).__name__} has no name.")
+        self._validators[tool.name] = self._compile_validator(tool)
         self._tools[tool.name] = tool
         logger.info("Registered tool: %s", tool.name)
 
-    def get_tool(self, name: str) -> BaseTool | None:
-        """Look up a tool by name."""
+    def register_lazy(self, spec: ToolSpec):
+        """Register a tool by spec; its module is imported on first execution."""
+        if not spec.name:
+            raise ValueError(f"ToolSpec {spec.import_path} has no name.")
+        self._validators[spec.name] = self._compile_validator(spec)
+        self._tools[spec.name] = spec
+        logger.info("Registered tool: %s (lazy)", spec.name)
+
+    @staticmethod
+    def _compile_validator(tool: BaseTool | ToolSpec) -> jsonschema.protocols.Validator:
+        """Check the tool's schema once and build a reusable validator."""
+        validator_cls = jsonschema.validators.validator_for(tool.parameters)
+        try:
+            validator_cls.check_schema(tool.parameters)
+        except jsonschema.SchemaError as se:
+            raise ValueError(f"Tool {tool.name} has an invalid schema: {se.message}") from se
+        return validator_cls(tool.parameters)
+
+    def get_tool(self, name: str) -> BaseTool | ToolSpec | None:
+        """
+        Look up a tool by name. Lazily registered tools that have not run
+        yet are returned as their ToolSpec (same name/description/parameters).
+        """
         return self._tools.get(name)
 
+    def is_loaded(self, name: str) -> bool:
+        return isinstance(self._tools.get(name), BaseTool)
+
     def get_tool_schemas(self) -> list[dict]:
         """Return all tool schemas for the LLM tools parameter."""
         return [tool.tool_schema() for tool in self._tools.values()]
 
-    def execute(self, name: str, arguments: dict[str, Any]) -> dict:
+    def execute(self, name: str, arguments: dict[str, Any], user_id: str = "") -> dict:
+        """
+        Validate arguments against the tool's JSON schema, then execute
+        on the tool's pool, waiting at most tool.timeout seconds.
+        Returns a result dict or an error dict.
+        `user_id` scopes cached results and invalidations.
+        """
+        tool, error = self._prepare(name, arguments)
+        if error:
+            return error
+        if isinstance(tool, ToolSpec):
+            tool, error = self._load(name)
+            if error:
+                return error
+
+        cache_key, cached = self._cache_lookup(tool, arguments, user_id)
+        if cached is not None:
+            return cached
+
+        future = self._pool_for(tool).submit(
+            self._run_in_pool, tool, self._call_args(tool, arguments, user_id), time.perf_counter()
+        )
+        try:
+            result = future.result(timeout=tool.timeout)
+        except FutureTimeout:
+            future.cancel()  # only succeeds if the call is still queued
+            return self._timed_out(tool)
+
+        self._after_call(tool, cache_key, result, user_id)
+        return result
+
+    async def aexecute(self, name: str, arguments: dict[str, Any], user_id: str = "") -> dict:
+        """
+        Async variant of execute(): never blocks the event loop.
+        Sync tools run on their class's pool; async tools are awaited
+        directly. Both are cancelled after tool.timeout seconds.
+        """
+        tool, error = self._prepare(name, arguments)
+        if error:
+            return error
+        if self._dispatcher is not None:
+            # Remote mode: the worker loads, caches and runs the tool
+            return await self._dispatcher.dispatch(tool, arguments, user_id)
+        if isinstance(tool, ToolSpec):
+            # First use imports the tool's module — keep that off the loop too
+            tool, error = await asyncio.to_thread(self._load, name)
+            if error:
+                return error
+
+        # A shared (Redis) cache does network I/O — keep it off the loop
+        shared = self._cache is not None and self._cache.shared
+        if shared:
+            cache_key, cached = await asyncio.to_thread(self._cache_lookup, tool, arguments, user_id)
+        else:
+            cache_key, cached = self._cache_lookup(tool, arguments, user_id)
+        if cached is not None:
+            return cached
+
+        submitted = time.perf_counter()
+        call_args = self._call_args(tool, arguments, user_id)
+        if inspect.iscoroutinefunction(tool.execute):
+            call = self._run_native_async(tool, call_args, submitted)
+        else:
+            call = asyncio.get_running_loop().run_in_executor(
+                self._pool_for(tool), self._run_in_pool, tool, call_args, submitted
+            )
+        try:
+            result = await asyncio.wait_for(call, timeout=tool.timeout)
+        except asyncio.TimeoutError:
+            return self._timed_out(tool)
+
+        if shared:
+            await asyncio.to_thread(self._after_call, tool, cache_key, result, user_id)
+        else:
+            self._after_call(tool, cache_key, result, user_id)
+        return result
+
+    def invalidate(self, tool_name: str, user_id: str = ""):
+        """Explicitly drop cached results of a tool for a user."""
+        if self._cache is not None:
+            self._cache.invalidate(tool_name, user_id)
+
+    def _prepare(self, name: str, arguments: dict[str, Any]) -> tuple[BaseTool | ToolSpec | None, dict | None]:
         """
-        Validate arguments against the tool's JSON schema,
-        then execute. Returns a result dict or an error dict.
+        Look up and validate. Returns (tool, None) or (None, error_dict);
+        the tool may still be an unloaded ToolSpec.
         """
         tool = self._tools.get(name)
         if not tool:
-            return {"error": f"Unknown tool: {name}"}
+            return None, {"error": f"Unknown tool: {name}"}
 
         # ── VALIDATION GATE ──
         try:
-            jsonschema.validate(instance=arguments, schema=tool.parameters)
+            self._validators[name].validate(arguments)
         except jsonschema.ValidationError as ve:
             logger.warning("Validation failed for %s: %s", name, ve.message)
-            return {"error": f"Invalid arguments for {name}: {ve.message}"}
+            TOOL_CALL_COUNT.labels(name, "invalid").inc()
+            return None, {"error": f"Invalid arguments for {name}: {ve.message}"}
 
+        return tool, None
+
+    def _load(self, name: str) -> tuple[BaseTool | None, dict | None]:
+        """Import a lazily registered tool (once). Returns (tool, None) or (None, error_dict)."""
+        with self._load_lock:
+            entry = self._tools[name]
+            if isinstance(entry, BaseTool):
+                return entry, None
+            start = time.perf_counter()
+            try:
+                tool = entry.load()
+            except Exception as e:
+                logger.error("Failed to load tool %s from %s: %s", name, entry.import_path, e)
+                TOOL_CALL_COUNT.labels(name, "error").inc()
+                return None, {"error": f"Tool {name} is unavailable: {e}"}
+            self._tools[name] = tool
+            logger.info("Loaded tool %s in %.0f ms", name, (time.perf_counter() - start) * 1000)
+            return tool, None
+
+    def _cache_lookup(self, tool: BaseTool, arguments: dict[str, Any],
+                      user_id: str) -> tuple[str | None, dict | None]:
+        """Returns (cache_key, cached_result); key is None for uncacheable tools."""
+        if self._cache is None or not tool.cacheable:
+            return None, None
+        key = self._cache.key_for(tool.name, arguments, tool.cache_key_args, user_id)
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.info("Tool %s served from cache.", tool.name)
+            TOOL_CALL_COUNT.labels(tool.name, "cached").inc()
+        return key, cached
+
+    def _after_call(self, tool: BaseTool, cache_key: str | None, result: dict, user_id: str):
+        """Cache successful lookups and apply the tool's invalidations."""
+        if not isinstance(result, dict) or "error" in result:
+            return
+        if cache_key is not None:
+            self._cache.set(cache_key, result, tool.cache_ttl)
+        for stale in tool.invalidates:
+            self.invalidate(stale, user_id)
+
+    @staticmethod
+    def _call_args(tool: BaseTool, arguments: dict[str, Any], user_id: str) -> dict[str, Any]:
+        return {**arguments, "user_id": user_id} if tool.needs_user else arguments
+
+    def _pool_for(self, tool: BaseTool) -> ThreadPoolExecutor:
+        """Dedicated bounded pool per tool class (or pool_key), created on first use."""
+        key = tool.pool_key or type(tool)
+        pool = self._pools.get(key)
+        if pool is None:
+            with self._pool_lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    pool = ThreadPoolExecutor(
+                        max_workers=tool.max_concurrency,
+                        thread_name_prefix=f"zia-tool-{tool.pool_key or type(tool).__name__}",
+                    )
+                    self._pools[key] = pool
+        return pool
+
+    def _run_in_pool(self, tool: BaseTool, arguments: dict[str, Any], submitted: float) -> dict:
+        """Worker-thread entry point. Async tools get a private event loop."""
+        TOOL_QUEUE_LATENCY.labels(tool.name).observe(time.perf_counter() - submitted)
+        if inspect.iscoroutinefunction(tool.execute):
+            return asyncio.run(self._invoke_async(tool, arguments))
+        return self._invoke(tool, arguments)
+
+    async def _run_native_async(self, tool: BaseTool, arguments: dict[str, Any], submitted: float) -> dict:
+        key = tool.pool_key or type(tool)
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores[key] = asyncio.Semaphore(tool.max_concurrency)
+        async with semaphore:
+            TOOL_QUEUE_LATENCY.labels(tool.name).observe(time.perf_counter() - submitted)
+            return await self._invoke_async(tool, arguments)
+
+    def _invoke(self, tool: BaseTool, arguments: dict[str, Any]) -> dict:
         # ── EXECUTION ──
+        start = time.perf_counter()
         try:
-            safe_args = _redact_args(arguments)
-            logger.info("Executing tool %s with args: %s", name, safe_args)
+            logger.info("Executing tool %s with args: %s", tool.name, _redact_args(arguments))
             result = tool.execute(**arguments)
-            logger.info("Tool %s completed successfully.", name)
+            logger.info("Tool %s completed successfully.", tool.name)
+            TOOL_CALL_COUNT.labels(tool.name, "ok").inc()
             return result
         except Exception as e:
-            logger.error("Tool %s failed: %s", name, e)
+            logger.error("Tool %s failed: %s", tool.name, e)
+            TOOL_CALL_COUNT.labels(tool.name, "error").inc()
             return {"error": str(e)}
+        finally:
+            TOOL_RUN_LATENCY.labels(tool.name).observe(time.perf_counter() - start)
+
+    async def _invoke_async(self, tool: BaseTool, arguments: dict[str, Any]) -> dict:
+        start = time.perf_counter()
+        try:
+            logger.info("Executing tool %s with args: %s", tool.name, _redact_args(arguments))
+            result = await tool.execute(**arguments)
+            logger.info("Tool %s completed successfully.", tool.name)
+            TOOL_CALL_COUNT.labels(tool.name, "ok").inc()
+            return result
+        except Exception as e:
+            logger.error("Tool %s failed: %s", tool.name, e)
+            TOOL_CALL_COUNT.labels(tool.name, "error").inc()
+            return {"error": str(e)}
+        finally:
+            TOOL_RUN_LATENCY.labels(tool.name).observe(time.perf_counter() - start)
+
+    @staticmethod
+    def _timed_out(tool: BaseTool) -> dict:
+        logger.error("Tool %s exceeded its %gs deadline.", tool.name, tool.timeout)
+        TOOL_CALL_COUNT.labels(tool.name, "timeout").inc()
+        return {"error": f"{tool.name} timed out after {tool.timeout:g}s"}
+
+    async def close(self):
+        """Release the remote dispatcher's connections, if any."""
+        if self._dispatcher is not None:
+            await self._dispatcher.close()
+
+    def shutdown(self):
+        """Release tool pools (running calls are not interrupted)."""
+        with self._pool_lock:
+            for pool in self._pools.values():
+                pool.shutdown(wait=False, cancel_futures=True)
+            self._pools.clear()
 
     @property
     def tool_names(self) -> list[str]:
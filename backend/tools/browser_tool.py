@@ -2,126 +2,165 @@
 Browser tool — YouTube search, playback, and media control via Selenium.
 
 Uses a singleton YouTubeSession so the browser stays alive across tool calls.
+The session holds a long-lived lease on a driver from tools.driver_pool,
+so the window the user is watching is never recycled by the pool.
+PageSession does the same for pages opened by browser.open_url.
 """
 
-import time
 import logging
+import threading
+import time
 
+import urllib3
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    WebDriverException,
+)
 
+from core.config import settings
 from tools.base_tool import BaseTool
+from tools.driver_pool import PooledDriver, get_driver_pool
+from tools.manifest import PLAY_YOUTUBE, YOUTUBE_CONTROL
+from tools.youtube import play_first_result, run_media_command
 
 logger = logging.getLogger("zia.tools.browser")
 
 
-class YouTubeSession:
+class BrowserSession:
     """
-    Singleton browser session for YouTube.
-    One driver instance shared across all tool calls.
+    Singleton user-visible browser session (one per subclass).
+    One pooled driver, leased until it dies, shared across all calls.
+
+    Health is tracked passively: commands go straight to the driver, and a
+    lost-session error from a real call marks the session dead and retries
+    once on a fresh driver. An optional heartbeat thread
+    (BROWSER_HEARTBEAT_INTERVAL) detects a dead browser between calls.
     """
 
-    _instance: "YouTubeSession | None" = None
-    _driver: webdriver.Chrome | None = None
+    _instance: "BrowserSession | None" = None
+    label = "browser"
+
+    def __init__(self):
+        self._lease: PooledDriver | None = None
+        self._lock = threading.RLock()
+        if settings.BROWSER_HEARTBEAT_INTERVAL > 0:
+            threading.Thread(
+                target=self._heartbeat, name=f"zia-{self.label}-heartbeat", daemon=True
+            ).start()
 
     @classmethod
-    def get(cls) -> "YouTubeSession":
-        if cls._instance is None:
+    def get(cls):
+        if cls.__dict__.get("_instance") is None:
             cls._instance = cls()
         return cls._instance
 
     @property
     def driver(self) -> webdriver.Chrome:
-        """Return a healthy driver, creating one if needed."""
-        if not self._is_alive():
-            logger.info("Creating new Chrome session for YouTube.")
-            self._create_driver()
-        return self._driver
-
-    def _is_alive(self) -> bool:
-        """Check if the current driver session is still usable."""
-        if self._driver is None:
-            return False
-        try:
-            _ = self._driver.title
-            return True
-        except WebDriverException:
-            logger.warning("Chrome session died. Will recreate.")
-            self._driver = None
-            return False
-
-    def _create_driver(self):
-        options = webdriver.ChromeOptions()
-        options.add_experimental_option("detach", True)
-        options.add_argument("--disable-search-engine-choice-screen")
-        self._driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=options,
-        )
+        """Return the leased driver, leasing one from the pool if needed."""
+        with self._lock:
+            if self._lease is None:
+                logger.info("Leasing Chrome session for %s.", self.label)
+                self._lease = get_driver_pool().acquire()
+            return self._lease.driver
+
+    def run(self, command):
+        """Run `command(driver)`, retrying once on a fresh driver if the session was lost."""
+        with self._lock:
+            try:
+                return command(self.driver)
+            except Exception as e:
+                if not _session_lost(e):
+                    raise
+                logger.warning("Chrome session lost (%s). Retrying on a fresh driver.", e)
+                self.mark_dead()
+            return command(self.driver)
+
+    def mark_dead(self):
+        """Hand the current driver back to the pool for recycling."""
+        with self._lock:
+            if self._lease is not None:
+                get_driver_pool().release(self._lease, broken=True)
+                self._lease = None
+
+    def _heartbeat(self):
+        while True:
+            time.sleep(settings.BROWSER_HEARTBEAT_INTERVAL)
+            with self._lock:
+                if self._lease is None:
+                    continue
+                try:
+                    _ = self._lease.driver.window_handles
+                except Exception as e:
+                    if _session_lost(e):
+                        logger.warning("Chrome session died (heartbeat). Releasing it.")
+                        self.mark_dead()
+
+
+class YouTubeSession(BrowserSession):
+    """The window YouTube plays in (play_youtube, youtube_control, browser.youtube_play)."""
+
+    label = "youtube"
+
+
+class PageSession(BrowserSession):
+    """The window pages opened for the user live in; each URL gets its own tab."""
+
+    label = "pages"
+
+    def open(self, url: str):
+        def navigate(driver):
+            if driver.current_url not in ("about:blank", "data:,"):
+                driver.switch_to.new_window("tab")
+            driver.get(url)
+
+        self.run(navigate)
+
+
+def _session_lost(error: Exception) -> bool:
+    """True for errors meaning the browser/driver is gone, not a page-level failure."""
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError)):
+        return True
+    # "chrome not reachable", "disconnected", … surface as a bare WebDriverException
+    return type(error) is WebDriverException or isinstance(error, urllib3.exceptions.HTTPError)
 
 
 # ── Tools ──────────────────────────────────────────────
 
 
 class YouTubeTool(BaseTool):
-    name = "play_youtube"
-    description = (
-        "Search and play a video on YouTube. "
-        "Use this when the user asks to play music, a video, or search YouTube."
-    )
-    parameters = {
-        "type": "object",
-        "properties": {
-            "query": {
-                "type": "string",
-                "description": "Search query for YouTube (e.g. 'lofi hip hop radio').",
-            },
-        },
-        "required": ["query"],
-        "additionalProperties": False,
-    }
+    name = PLAY_YOUTUBE.name
+    description = PLAY_YOUTUBE.description
+    parameters = PLAY_YOUTUBE.parameters
+    risk_level = PLAY_YOUTUBE.risk_level
+
+    # One shared Chrome session — calls must not interleave, so play and
+    # control calls queue on one single-worker pool
+    timeout = 45.0
+    max_concurrency = 1
+    pool_key = "youtube-session"
 
     def execute(self, *, query: str) -> dict:
         session = YouTubeSession.get()
-        driver = session.driver
 
         try:
-            search_url = (
-                f"https://www.youtube.com/results?search_query={query.replace(' ', '+')}"
-            )
-            driver.get(search_url)
-            time.sleep(3)
-            first_video = driver.find_element(By.ID, "video-title")
-            first_video.click()
-            return {"status": "playing", "query": query}
+            ready = session.run(lambda driver: play_first_result(driver, query))
+            return {"status": "playing" if ready else "loading", "query": query}
         except Exception as e:
             logger.error("play_youtube failed: %s", e)
             return {"error": str(e)}
 
 
 class YouTubeControlTool(BaseTool):
-    name = "youtube_control"
-    description = (
-        "Control YouTube playback in the current browser session. "
-        "Use this when the user says 'next song', 'skip', 'pause', 'resume', "
-        "'previous', 'next track', or similar media control commands."
-    )
-    parameters = {
-        "type": "object",
-        "properties": {
-            "action": {
-                "type": "string",
-                "enum": ["next", "pause", "resume", "previous"],
-                "description": "The playback action: next, pause, resume, or previous.",
-            },
-        },
-        "required": ["action"],
-        "additionalProperties": False,
-    }
+    name = YOUTUBE_CONTROL.name
+    description = YOUTUBE_CONTROL.description
+    parameters = YOUTUBE_CONTROL.parameters
+    risk_level = YOUTUBE_CONTROL.risk_level
+
+    timeout = 15.0
+    max_concurrency = 1
+    pool_key = "youtube-session"
 
     def execute(self, *, action: str) -> dict:
         action = action.lower().strip()
@@ -130,59 +169,9 @@ class YouTubeControlTool(BaseTool):
             return {"error": f"Unknown action: {action}. Use: next, pause, resume, previous."}
 
         session = YouTubeSession.get()
-        driver = session.driver
 
         try:
-            if "youtube.com" not in driver.current_url:
-                return {"error": "No YouTube session active. Use play_youtube first."}
-
-            if action in ("next", "previous"):
-                return self._send_nav_key(driver, action)
-            else:
-                return self._handle_play_pause(driver, action)
-
+            return session.run(lambda driver: run_media_command(driver, action))
         except Exception as e:
             logger.error("youtube_control(%s) failed: %s", action, e)
             return {"error": str(e)}
-
-    @staticmethod
-    def _send_nav_key(driver, action: str) -> dict:
-        """Next / Previous via keyboard shortcuts."""
-        key = Keys.SHIFT + "n" if action == "next" else Keys.SHIFT + "p"
-        label = "Skipped to next video" if action == "next" else "Went to previous video"
-
-        try:
-            player = driver.find_element(By.ID, "movie_player")
-            player.click()
-            time.sleep(0.3)
-        except Exception:
-            pass
-
-        body = driver.find_element(By.TAG_NAME, "body")
-        body.send_keys(key)
-        return {"status": label}
-
-    @staticmethod
-    def _handle_play_pause(driver, action: str) -> dict:
-        """Pause / Resume using explicit state detection — never toggles."""
-        is_paused = driver.execute_script(
-            "return document.querySelector('video')?.paused"
-        )
-
-        if is_paused is None:
-            return {"error": "No video element found on page."}
-
-        if action == "pause" and is_paused:
-            return {"status": "Already paused"}
-
-        if action == "resume" and not is_paused:
-            return {"status": "Already playing"}
-
-        # Click the play/pause button to change state
-        play_btn = driver.find_element(By.CSS_SELECTOR, "button.ytp-play-button")
-        play_btn.click()
-
-        if action == "pause":
-            return {"status": "Paused playback"}
-        else:
-            return {"status": "Resumed playback"}
@@ -0,0 +1,119 @@
+"""
+Chromedriver resolution with a persistent on-disk cache.
+
+ChromeDriverManager().install() probes the Chrome version and the
+network on every call. resolve_chromedriver() does that at most once:
+the resolved driver path and the Chrome version it was resolved for are
+stored in ~/.zia/chromedriver.json, and reused while
+
+  - the driver binary still exists and is executable, and
+  - the installed Chrome has the same major version (or its version
+    can't be determined, e.g. an unusual install location).
+
+Within a process the result is memoized, so creating a driver costs only
+spawning chromedriver. When the cache is stale and resolution fails
+(offline), the last known driver is used; with no driver at all,
+resolution is left to Selenium Manager.
+"""
+
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger("zia.tools.chromedriver")
+
+_resolved: str | None = None  # "" = resolved to Selenium Manager
+_lock = threading.Lock()
+
+
+def _installed_chrome_version() -> str | None:
+    from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+    try:
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception as e:
+        logger.debug("Chrome version probe failed: %s", e)
+        return None
+
+
+def _major(version: str | None) -> str | None:
+    return version.split(".")[0] if version else None
+
+
+def _load_cache(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache(path: str, entry: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(entry, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _usable(driver_path: str | None) -> bool:
+    return bool(driver_path) and os.path.isfile(driver_path) and os.access(driver_path, os.X_OK)
+
+
+def resolve_chromedriver(cache_path: str = "~/.zia/chromedriver.json") -> str | None:
+    """
+    Return the chromedriver path to use, or None to let Selenium Manager
+    locate one.
+    """
+    global _resolved
+    if _resolved is not None:
+        return _resolved or None
+
+    with _lock:
+        if _resolved is not None:
+            return _resolved or None
+
+        path = os.path.expanduser(cache_path)
+        cached = _load_cache(path)
+        chrome_version = _installed_chrome_version()
+
+        if _usable(cached.get("driver_path")) and (
+            chrome_version is None
+            or _major(chrome_version) == _major(cached.get("chrome_version"))
+        ):
+            logger.info("Using cached chromedriver %s", cached["driver_path"])
+            _resolved = cached["driver_path"]
+            return _resolved
+
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            driver_path = ChromeDriverManager().install()
+        except Exception as e:
+            if _usable(cached.get("driver_path")):
+                logger.warning("chromedriver resolution failed (%s); using last known driver", e)
+                _resolved = cached["driver_path"]
+                return _resolved
+            logger.warning("chromedriver resolution failed (%s); deferring to Selenium Manager", e)
+            _resolved = ""
+            return None
+
+        try:
+            _save_cache(path, {"driver_path": driver_path, "chrome_version": chrome_version})
+        except OSError as e:
+            logger.warning("Could not write chromedriver cache %s: %s", path, e)
+        logger.info("Resolved chromedriver %s for Chrome %s", driver_path, chrome_version or "?")
+        _resolved = driver_path
+        return _resolved
+
+
+def forget_chromedriver(cache_path: str = "~/.zia/chromedriver.json"):
+    """Drop the cached driver, e.g. after it failed to start a session."""
+    global _resolved
+    with _lock:
+        _resolved = None
+        try:
+            os.remove(os.path.expanduser(cache_path))
+        except OSError:
+            pass
@@ -0,0 +1,283 @@
+"""
+Chrome driver pool — pre-warmed Selenium sessions for the user-visible
+browser sessions in tools.browser_tool (YouTubeSession, PageSession).
+Those acquire() a driver and keep it for the life of their window, so
+recycling and health checks never touch a window the user is watching;
+the short lease() context manager is only for headless scraping work.
+
+Launching Chrome costs seconds, so drivers are created once and leased:
+  - pool size, headless mode and recycling are configured via settings
+    (BROWSER_POOL_SIZE, BROWSER_HEADLESS, BROWSER_MAX_USES)
+  - prewarm() starts every session up front (BROWSER_PREWARM)
+  - a background thread health-checks idle drivers and replaces dead ones
+  - a driver is quit and replaced after BROWSER_MAX_USES leases, or as
+    soon as a caller releases it as broken (crash, WebDriverException)
+
+Selenium is imported only when a driver is first created, so importing
+this module is cheap. The chromedriver binary is resolved once and cached
+on disk (tools.chromedriver).
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from app.middleware.metrics import (
+    BROWSER_DRIVERS_RECYCLED,
+    BROWSER_LEASE_WAIT,
+    BROWSER_POOL_DRIVERS,
+    BROWSER_POOL_LEASED,
+)
+from core.config import settings
+from tools.chromedriver import forget_chromedriver, resolve_chromedriver
+
+logger = logging.getLogger("zia.tools.driver_pool")
+
+
+class PooledDriver:
+    """A pooled WebDriver plus its lease bookkeeping."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.monotonic()
+
+
+def _create_chrome(headless: bool):
+    from selenium import webdriver
+    from selenium.common.exceptions import SessionNotCreatedException
+    from selenium.webdriver.chrome.service import Service
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--disable-search-engine-choice-screen")
+    if headless:
+        options.add_argument("--headless=new")
+    driver_path = resolve_chromedriver()
+    try:
+        return webdriver.Chrome(
+            service=Service(driver_path) if driver_path else Service(),
+            options=options,
+        )
+    except SessionNotCreatedException:
+        # Typically a driver/Chrome version mismatch — re-resolve next time
+        forget_chromedriver()
+        raise
+
+
+class DriverPool:
+    """Bounded pool of Chrome sessions with leasing, health checks and recycling."""
+
+    def __init__(
+        self,
+        size: int = 2,
+        headless: bool = False,
+        max_uses: int = 50,
+        health_interval: float = 60.0,
+        driver_factory=None,
+    ):
+        self.size = size
+        self.headless = headless
+        self.max_uses = max_uses
+        self.health_interval = health_interval
+        self._factory = driver_factory or (lambda: _create_chrome(self.headless))
+
+        self._cond = threading.Condition()
+        self._idle: list[PooledDriver] = []
+        self._open = 0  # drivers alive, idle + leased + being created
+        self._leased = 0
+        self._closed = False
+        self._keep_warm = False
+        self._health_thread: threading.Thread | None = None
+
+    # ── Leasing ──
+
+    def acquire(self, timeout: float = 30.0) -> PooledDriver:
+        """
+        Lease a driver, creating one if the pool has room.
+        Raises TimeoutError if none frees up within `timeout` seconds.
+        """
+        start = time.perf_counter()
+        deadline = time.monotonic() + timeout
+        create = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+                if self._idle:
+                    pooled = self._idle.pop()
+                    break
+                if self._open < self.size:
+                    self._open += 1
+                    create = True
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No browser session free within {timeout:g}s")
+                self._cond.wait(remaining)
+            self._leased += 1
+            self._update_gauges()
+
+        if create:
+            try:
+                pooled = PooledDriver(self._factory())
+            except Exception:
+                with self._cond:
+                    self._open -= 1
+                    self._leased -= 1
+                    self._update_gauges()
+                    self._cond.notify()
+                raise
+            logger.info("Started Chrome session (%d/%d)", self._open, self.size)
+
+        pooled.uses += 1
+        BROWSER_LEASE_WAIT.observe(time.perf_counter() - start)
+        return pooled
+
+    def release(self, pooled: PooledDriver, broken: bool = False):
+        """Return a leased driver. Broken or worn-out drivers are quit."""
+        reason = "broken" if broken else "max_uses" if pooled.uses >= self.max_uses else None
+        with self._cond:
+            self._leased -= 1
+            if reason is None and not self._closed:
+                self._idle.append(pooled)
+            else:
+                self._open -= 1
+            self._update_gauges()
+            self._cond.notify()
+
+        if reason is not None or self._closed:
+            if reason:
+                BROWSER_DRIVERS_RECYCLED.labels(reason).inc()
+                logger.info("Recycling Chrome session (%s, %d uses)", reason, pooled.uses)
+            self._quit(pooled)
+
+    @contextmanager
+    def lease(self, timeout: float = 30.0):
+        """Context manager around acquire()/release(); a WebDriverException marks the driver broken."""
+        from selenium.common.exceptions import WebDriverException
+
+        pooled = self.acquire(timeout)
+        broken = False
+        try:
+            yield pooled.driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(pooled, broken=broken)
+
+    # ── Warm-up & health ──
+
+    def prewarm(self):
+        """Start sessions until the pool is full, then keep it topped up."""
+        self._keep_warm = True
+        leased = []
+        try:
+            while True:
+                with self._cond:
+                    if self._open >= self.size:
+                        break
+                leased.append(self.acquire(timeout=0))
+        except Exception as e:
+            logger.error("Browser pool pre-warm stopped: %s", e)
+        finally:
+            for pooled in leased:
+                pooled.uses -= 1  # warm-up doesn't count as a use
+                self.release(pooled)
+        logger.info("Browser pool warm: %d/%d sessions", len(self._idle), self.size)
+        self.start_health_checks()
+
+    def start_health_checks(self):
+        if self._health_thread is None and self.health_interval > 0:
+            self._health_thread = threading.Thread(
+                target=self._health_loop, name="zia-driver-health", daemon=True
+            )
+            self._health_thread.start()
+
+    def _health_loop(self):
+        while not self._closed:
+            time.sleep(self.health_interval)
+            self.check_idle()
+            if self._keep_warm and not self._closed:
+                self.prewarm_missing()
+
+    def check_idle(self):
+        """Probe every idle driver; dead ones are recycled."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._leased += len(idle)  # held by the checker while probing
+        for pooled in idle:
+            self.release(pooled, broken=not self._is_healthy(pooled.driver))
+
+    def prewarm_missing(self):
+        with self._cond:
+            missing = self.size - self._open
+        if missing > 0:
+            self.prewarm()
+
+    @staticmethod
+    def _is_healthy(driver) -> bool:
+        try:
+            _ = driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    # ── Shutdown ──
+
+    def close(self):
+        """Quit all idle drivers; leased ones are quit when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._update_gauges()
+            self._cond.notify_all()
+        for pooled in idle:
+            self._quit(pooled)
+
+    @staticmethod
+    def _quit(pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+    def _update_gauges(self):
+        BROWSER_POOL_DRIVERS.set(self._open)
+        BROWSER_POOL_LEASED.set(self._leased)
+
+    @property
+    def utilization(self) -> float:
+        return self._leased / self.size if self.size else 0.0
+
+
+# ── Process-wide pool ──
+
+_pool: DriverPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    """Return the process-wide pool, creating it from settings on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = DriverPool(
+                    size=settings.BROWSER_POOL_SIZE,
+                    headless=settings.BROWSER_HEADLESS,
+                    max_uses=settings.BROWSER_MAX_USES,
+                    health_interval=settings.BROWSER_HEALTH_INTERVAL,
+                )
+    return _pool
+
+
+def shutdown_driver_pool():
+    """Close the process-wide pool if one was created."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
@@ -1,89 +1,60 @@
 """
-Email tool — send emails via Gmail API.
+Email tools — send and list emails via Gmail API.
 Migrated from the original executor.py compose_email().
+Both tools act for the calling user, with credentials from the database
+(see tools.gmail_service.get_user_gmail_service).
 """
 
-import os
 import base64
 from email.mime.text import MIMEText
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-
 from tools.base_tool import BaseTool
-
-GMAIL_SCOPES = ["https://www.googleapis.com/auth/gmail.send"]
+from tools.gmail_mirror import read_inbox_cached
+from tools.gmail_service import get_user_gmail_service, run_gmail_io
+from tools.manifest import SEND_EMAIL, READ_INBOX
 
 
 class EmailTool(BaseTool):
-    name = "send_email"
-    description = (
-        "Send an email using Gmail. Use this when the user wants to email someone."
-    )
-    parameters = {
-        "type": "object",
-        "properties": {
-            "recipient": {
-                "type": "string",
-                "description": "Email address of the recipient.",
-            },
-            "subject": {
-                "type": "string",
-                "description": "Email subject line.",
-            },
-            "body": {
-                "type": "string",
-                "description": "Full email body text.",
-            },
-        },
-        "required": ["recipient", "subject", "body"],
-        "additionalProperties": False,
-    }
+    name = SEND_EMAIL.name
+    description = SEND_EMAIL.description
+    parameters = SEND_EMAIL.parameters
+    risk_level = SEND_EMAIL.risk_level
+
+    timeout = 30.0
+    max_concurrency = 4
+    invalidates = ("read_inbox",)
 
-    def execute(self, *, recipient: str, subject: str, body: str) -> dict:
-        service = self._get_gmail_service()
+    needs_user = True
+
+    async def execute(self, *, recipient: str, subject: str, body: str, user_id: str = "") -> dict:
+        service = await get_user_gmail_service(user_id)
 
         message = MIMEText(body)
         message["to"] = recipient
         message["subject"] = subject
         raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
 
-        service.users().messages().send(
-            userId="me", body={"raw": raw}
-        ).execute()
+        await run_gmail_io(service.users().messages().send(userId="me", body={"raw": raw}).execute)
 
         return {"status": "sent", "to": recipient, "subject": subject}
 
-    # ── Gmail OAuth2 (reused from original executor.py) ──
-
-    @staticmethod
-    def _get_gmail_service():
-        creds = None
-
-        if os.path.exists("token.json"):
-            creds = Credentials.from_authorized_user_file("token.json", GMAIL_SCOPES)
 
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                try:
-                    creds.refresh(Request())
-                except Exception:
-                    creds = None
+class ReadInboxTool(BaseTool):
+    name = READ_INBOX.name
+    description = READ_INBOX.description
+    parameters = READ_INBOX.parameters
+    risk_level = READ_INBOX.risk_level
 
-            if not creds:
-                if not os.path.exists("client_secret.json"):
-                    raise FileNotFoundError(
-                        "Missing 'client_secret.json'. "
-                        "Download it from Google Cloud Console."
-                    )
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    "client_secret.json", GMAIL_SCOPES
-                )
-                creds = flow.run_local_server(port=0)
+    timeout = 30.0
+    max_concurrency = 4
+    # Pure lookup — users often repeat "check my mail" within seconds
+    cacheable = True
+    cache_key_args = ("query", "limit")
+    cache_ttl = 30.0
 
-            with open("token.json", "w") as token:
-                token.write(creds.to_json())
+    needs_user = True
 
-        return build("gmail", "v1", credentials=creds)
+    async def execute(self, *, query: str = "", limit: int = 10, user_id: str = "") -> dict:
+        service = await get_user_gmail_service(user_id)
+        emails = await run_gmail_io(read_inbox_cached, service, user_id, query, limit)
+        return {"status": "inbox_read", "count": len(emails), "emails": emails}
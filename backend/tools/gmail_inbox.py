@@ -0,0 +1,78 @@
+"""
+Gmail inbox listing shared by tools.email_tool.ReadInboxTool and
+app.executors.gmail.GmailExecutor.
+
+Each page costs two HTTPS round trips regardless of its size: one
+messages.list call for the ids, then one batch request carrying a
+messages.get(format=metadata) per id, so only the From/Subject/Date
+headers are transferred.
+"""
+
+import logging
+
+logger = logging.getLogger("zia.tools.gmail_inbox")
+
+INBOX_HEADERS = ["From", "Subject", "Date"]
+MAX_BATCH_SIZE = 100  # Gmail API limit per batch request
+
+
+def fetch_metadata(service, message_ids: list[str]) -> dict[str, dict]:
+    """
+    Fetch format=metadata messages for `message_ids`, batching up to
+    MAX_BATCH_SIZE per request. Messages that fail (e.g. deleted) are skipped.
+    """
+    results: dict[str, dict] = {}
+
+    def _collect(request_id, response, exception):
+        if exception is not None:
+            logger.warning("Gmail metadata fetch for %s failed: %s", request_id, exception)
+            return
+        results[request_id] = response
+
+    for start in range(0, len(message_ids), MAX_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_collect)
+        for message_id in message_ids[start:start + MAX_BATCH_SIZE]:
+            batch.add(
+                service.users().messages().get(
+                    userId="me", id=message_id, format="metadata", metadataHeaders=INBOX_HEADERS,
+                ),
+                request_id=message_id,
+            )
+        batch.execute()
+    return results
+
+
+def headers_of(message: dict) -> dict:
+    return {h["name"]: h["value"] for h in message.get("payload", {}).get("headers", [])}
+
+
+def fetch_headers(service, message_ids: list[str]) -> list[dict]:
+    """Fetch metadata headers for `message_ids` in one batch request, keeping order."""
+    messages = fetch_metadata(service, message_ids)
+    return [headers_of(messages[m]) for m in message_ids if m in messages]
+
+
+def read_inbox(service, query: str = "", limit: int = 10, page_size: int = 50) -> list[dict]:
+    """
+    Return up to `limit` messages as {header: value} dicts, in inbox
+    order, listing `page_size` ids per round trip.
+    """
+    page_size = max(1, min(page_size, MAX_BATCH_SIZE))
+    emails: list[dict] = []
+    page_token = None
+
+    while len(emails) < limit:
+        remaining = limit - len(emails)
+        listing = (
+            service.users().messages()
+            .list(userId="me", q=query, maxResults=min(page_size, remaining), pageToken=page_token)
+            .execute()
+        )
+        ids = [m["id"] for m in listing.get("messages", [])][:remaining]
+        if not ids:
+            break
+        emails.extend(fetch_headers(service, ids))
+        page_token = listing.get("nextPageToken")
+        if not page_token:
+            break
+    return emails
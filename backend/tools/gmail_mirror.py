@@ -0,0 +1,302 @@
+"""
+Per-user Gmail inbox mirror in Redis, advanced with the history API.
+
+Instead of listing and re-fetching messages on every read, the mirror
+keeps each user's recent message headers (From/Subject/Date + labels) in
+Redis together with the Gmail historyId they are current as of:
+
+  - the first read does a full sync (getProfile for the historyId, then
+    list + batched metadata fetches of the newest GMAIL_MIRROR_MAX_MESSAGES)
+  - later reads replay history.list from the stored historyId: added or
+    relabelled messages are re-fetched in one batch, deleted ones dropped;
+    with no changes that is a single round trip
+  - reads within GMAIL_MIRROR_SYNC_INTERVAL seconds of the last sync skip
+    Gmail entirely and are answered from Redis
+  - an expired historyId (HTTP 404) triggers a full resync
+
+Queries are answered locally when they are only ANDed from:/subject:/
+label:/is:/in: operators (or empty); label names are resolved to label
+ids with labels.list. Anything else (bare words, which Gmail also
+matches against message bodies, OR/AND, grouping, negation, spam/trash)
+returns None and callers fall back to the Gmail API (tools.gmail_inbox).
+Like messages.list, the mirror leaves out SPAM and TRASH. So does a query with fewer than `limit` local hits
+while the mirror doesn't hold the whole mailbox, since older matching
+mail may exist beyond the newest GMAIL_MIRROR_MAX_MESSAGES.
+
+Keys (namespace zia:inbox):
+  {ns}:{user}:meta     hash   history_id, synced_at, complete
+  {ns}:{user}:order    zset   message id → internalDate (ms)
+  {ns}:{user}:headers  hash   message id → JSON {From, Subject, Date, labels}
+  {ns}:{user}:labels   hash   lowercased label name → label id
+"""
+
+import json
+import logging
+import re
+import shlex
+import time
+
+import redis
+from googleapiclient.errors import HttpError
+
+from core.config import settings
+from tools.gmail_inbox import INBOX_HEADERS, fetch_metadata, headers_of, read_inbox
+
+logger = logging.getLogger("zia.tools.gmail_mirror")
+
+_HISTORY_TYPES = ["messageAdded", "messageDeleted", "labelAdded", "labelRemoved"]
+_IS_LABELS = {"unread": "UNREAD", "starred": "STARRED", "important": "IMPORTANT"}
+_HIDDEN_LABELS = {"SPAM", "TRASH"}  # excluded by messages.list, so never mirrored
+
+
+class InboxMirror:
+    """Redis-backed header cache of a user's mailbox, synced incrementally."""
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        max_messages: int = 500,
+        sync_interval: float = 30.0,
+        namespace: str = "zia:inbox",
+    ):
+        self.redis = redis_client
+        self.max_messages = max_messages
+        self.sync_interval = sync_interval
+        self.namespace = namespace
+
+    def _key(self, user_id: str, part: str) -> str:
+        return f"{self.namespace}:{user_id or '-'}:{part}"
+
+    # ── Reads ──
+
+    def read(self, service, user_id: str, query: str = "", limit: int = 10) -> list[dict] | None:
+        """
+        Return up to `limit` newest matching emails ({From, Subject, Date}),
+        syncing first if the mirror is stale. None if the query can't be
+        answered locally, or may match older mail than the mirror holds.
+        """
+        matcher = _compile_query(query, lambda name: self._label_id(service, user_id, name))
+        if matcher is None:
+            return None
+        self.sync(service, user_id)
+
+        ids = self.redis.zrevrange(self._key(user_id, "order"), 0, -1)
+        headers_key = self._key(user_id, "headers")
+        emails = []
+        # Scan newest first in chunks, stopping once `limit` matches are found
+        for start in range(0, len(ids), 100):
+            chunk = [m for m in self.redis.hmget(headers_key, ids[start:start + 100]) if m]
+            for raw in chunk:
+                entry = json.loads(raw)
+                if matcher(entry):
+                    emails.append({h: entry[h] for h in INBOX_HEADERS if h in entry})
+                    if len(emails) >= limit:
+                        return emails
+        if self.redis.hget(self._key(user_id, "meta"), "complete") != "1":
+            return None
+        return emails
+
+    def _label_id(self, service, user_id: str, name: str) -> str | None:
+        """Label id for a label:/in: operand, listing labels again once if it is unknown."""
+        labels_key = self._key(user_id, "labels")
+        label_id = self.redis.hget(labels_key, name)
+        if label_id is None:
+            names = {}
+            for label in service.users().labels().list(userId="me").execute().get("labels", []):
+                for alias in (label["id"], label["name"], re.sub(r"[\s/]", "-", label["name"])):
+                    names[alias.lower()] = label["id"]
+            pipe = self.redis.pipeline()
+            pipe.delete(labels_key)
+            if names:
+                pipe.hset(labels_key, mapping=names)
+            pipe.execute()
+            label_id = names.get(name)
+        return label_id
+
+    # ── Sync ──
+
+    def sync(self, service, user_id: str, force: bool = False):
+        """Bring the mirror up to date (full sync, history replay, or nothing if fresh)."""
+        meta = self.redis.hgetall(self._key(user_id, "meta"))
+        history_id = meta.get("history_id")
+        if not force and history_id and time.time() - float(meta.get("synced_at", 0)) < self.sync_interval:
+            return
+        if not history_id:
+            self.full_sync(service, user_id)
+            return
+        try:
+            self._replay_history(service, user_id, history_id)
+        except HttpError as e:
+            if e.resp.status != 404:
+                raise
+            logger.info("Gmail historyId %s expired for user=%s; full resync", history_id, user_id or "-")
+            self.full_sync(service, user_id)
+
+    def full_sync(self, service, user_id: str):
+        # Take the historyId first so changes made while listing are replayed later
+        history_id = service.users().getProfile(userId="me").execute()["historyId"]
+
+        ids: list[str] = []
+        page_token = None
+        complete = False
+        while len(ids) < self.max_messages:
+            listing = (
+                service.users().messages()
+                .list(userId="me", maxResults=min(500, self.max_messages - len(ids)), pageToken=page_token)
+                .execute()
+            )
+            ids.extend(m["id"] for m in listing.get("messages", []))
+            page_token = listing.get("nextPageToken")
+            if not page_token:
+                complete = True
+                break
+
+        messages = fetch_metadata(service, ids[:self.max_messages])
+        pipe = self.redis.pipeline()
+        pipe.delete(self._key(user_id, "order"), self._key(user_id, "headers"), self._key(user_id, "labels"))
+        self._store(pipe, user_id, messages.values())
+        self._mark_synced(pipe, user_id, history_id)
+        # The mirror holds the whole mailbox until it is first trimmed
+        pipe.hset(self._key(user_id, "meta"), "complete", int(complete and len(messages) == len(ids)))
+        pipe.execute()
+        logger.info("Full Gmail sync for user=%s: %d messages", user_id or "-", len(messages))
+
+    def _replay_history(self, service, user_id: str, history_id: str):
+        changed: set[str] = set()
+        deleted: set[str] = set()
+        page_token = None
+        latest = history_id
+        while True:
+            response = (
+                service.users().history()
+                .list(userId="me", startHistoryId=history_id, historyTypes=_HISTORY_TYPES,
+                      pageToken=page_token)
+                .execute()
+            )
+            for record in response.get("history", []):
+                for item in record.get("messagesAdded", []) + record.get("labelsAdded", []) \
+                        + record.get("labelsRemoved", []):
+                    changed.add(item["message"]["id"])
+                for item in record.get("messagesDeleted", []):
+                    deleted.add(item["message"]["id"])
+            latest = response.get("historyId", latest)
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+        changed -= deleted
+        messages = fetch_metadata(service, sorted(changed)) if changed else {}
+        pipe = self.redis.pipeline()
+        if deleted:
+            pipe.zrem(self._key(user_id, "order"), *deleted)
+            pipe.hdel(self._key(user_id, "headers"), *deleted)
+        self._store(pipe, user_id, messages.values())
+        self._mark_synced(pipe, user_id, latest)
+        pipe.execute()
+        self._trim(user_id)
+        if changed or deleted:
+            logger.info("Gmail history replay for user=%s: %d changed, %d deleted",
+                        user_id or "-", len(messages), len(deleted))
+
+    # ── Storage ──
+
+    def _store(self, pipe, user_id: str, messages):
+        order, headers, hidden = {}, {}, []
+        for message in messages:
+            if _HIDDEN_LABELS.intersection(message.get("labelIds", [])):
+                hidden.append(message["id"])  # e.g. moved to trash since it was mirrored
+                continue
+            entry = headers_of(message)
+            entry["labels"] = message.get("labelIds", [])
+            order[message["id"]] = int(message.get("internalDate", 0))
+            headers[message["id"]] = json.dumps(entry)
+        if order:
+            pipe.zadd(self._key(user_id, "order"), order)
+            pipe.hset(self._key(user_id, "headers"), mapping=headers)
+        if hidden:
+            pipe.zrem(self._key(user_id, "order"), *hidden)
+            pipe.hdel(self._key(user_id, "headers"), *hidden)
+
+    def _trim(self, user_id: str):
+        """Drop the oldest entries beyond max_messages."""
+        order_key = self._key(user_id, "order")
+        stale = self.redis.zrange(order_key, 0, -(self.max_messages + 1))
+        if stale:
+            pipe = self.redis.pipeline()
+            pipe.zrem(order_key, *stale)
+            pipe.hdel(self._key(user_id, "headers"), *stale)
+            pipe.hset(self._key(user_id, "meta"), "complete", 0)
+            pipe.execute()
+
+    def _mark_synced(self, pipe, user_id: str, history_id: str):
+        pipe.hset(self._key(user_id, "meta"), mapping={
+            "history_id": str(history_id), "synced_at": str(time.time()),
+        })
+
+    def clear(self, user_id: str):
+        self.redis.delete(*(self._key(user_id, p) for p in ("meta", "order", "headers", "labels")))
+
+
+def _compile_query(query: str, label_id):
+    """
+    Turn a Gmail search query made only of ANDed operators into a
+    predicate, or None if it can't be answered from the mirror.
+    label_id(name) maps a label:/in: operand to a label id (None if unknown).
+    """
+    if any(c in query for c in "(){}"):
+        return None
+    try:
+        tokens = shlex.split(query)
+    except ValueError:
+        return None
+
+    checks = []
+    for token in tokens:
+        op, sep, value = token.partition(":")
+        op, value = op.lower(), value.lower()
+        if not sep or not value:
+            return None  # bare words (From/Subject/body), OR, AND
+        if op == "from":
+            checks.append(lambda e, v=value: v in e.get("From", "").lower())
+        elif op == "subject":
+            checks.append(lambda e, v=value: v in e.get("Subject", "").lower())
+        elif op in ("label", "in"):
+            resolved = label_id(value)
+            if resolved is None or resolved in _HIDDEN_LABELS:
+                return None
+            checks.append(lambda e, v=resolved: v in e["labels"])
+        elif op == "is" and value in _IS_LABELS:
+            checks.append(lambda e, v=_IS_LABELS[value]: v in e["labels"])
+        elif op == "is" and value == "read":
+            checks.append(lambda e: "UNREAD" not in e["labels"])
+        else:
+            return None
+    return lambda entry: all(check(entry) for check in checks)
+
+
+_mirror: InboxMirror | None = None
+
+
+def get_inbox_mirror() -> InboxMirror | None:
+    """Return the process-wide mirror, or None if GMAIL_MIRROR_ENABLED is off."""
+    global _mirror
+    if _mirror is None and settings.GMAIL_MIRROR_ENABLED:
+        _mirror = InboxMirror(
+            redis.Redis.from_url(settings.REDIS_URL, decode_responses=True),
+            max_messages=settings.GMAIL_MIRROR_MAX_MESSAGES,
+            sync_interval=settings.GMAIL_MIRROR_SYNC_INTERVAL,
+        )
+    return _mirror
+
+
+def read_inbox_cached(service, user_id: str, query: str = "", limit: int = 10) -> list[dict]:
+    """Serve an inbox read from the mirror, falling back to the Gmail API."""
+    mirror = get_inbox_mirror()
+    if mirror is not None and limit <= mirror.max_messages:
+        try:
+            emails = mirror.read(service, user_id, query, limit)
+            if emails is not None:
+                return emails
+        except redis.RedisError as e:
+            logger.warning("Inbox mirror unavailable, reading Gmail directly: %s", e)
+    return read_inbox(service, query, limit, settings.GMAIL_PAGE_SIZE)
@@ -0,0 +1,214 @@
+"""
+Gmail API clients shared by tools.email_tool and app.executors.gmail.
+
+googleapiclient's build() parses the large Gmail discovery document, and
+the old callers also re-read token.json, on every action. Here:
+
+  - the bundled (static) discovery document is parsed once per process
+  - services are cached per user in an LRU keyed on (user id, credential
+    version), so a re-authorized user gets a fresh service
+  - credentials are refreshed proactively when they are within
+    GMAIL_REFRESH_MARGIN seconds of expiry, before a call can fail;
+    per-user tokens come from the database (get_user_gmail_service);
+    token.json serves the CLI and users who have no stored Gmail tokens
+  - every request gets its own AuthorizedHttp (requestBuilder), because
+    httplib2.Http is not thread-safe and services are shared by threads
+  - blocking googleapiclient calls run on a bounded pool (run_gmail_io,
+    GMAIL_IO_THREADS) so they never stall an event loop
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from datetime import datetime, timedelta
+
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+from core.config import settings
+
+logger = logging.getLogger("zia.tools.gmail_service")
+
+GMAIL_SCOPES = ["https://www.googleapis.com/auth/gmail.send",
+                "https://www.googleapis.com/auth/gmail.readonly"]
+
+_discovery_doc: dict | None = None
+_doc_lock = threading.Lock()
+
+
+def _gmail_discovery_doc() -> dict:
+    global _discovery_doc
+    if _discovery_doc is None:
+        with _doc_lock:
+            if _discovery_doc is None:
+                from googleapiclient import discovery_cache
+
+                _discovery_doc = json.loads(discovery_cache.get_static_doc("gmail", "v1"))
+    return _discovery_doc
+
+
+def needs_refresh(creds: Credentials, margin: float) -> bool:
+    """True if `creds` are invalid or expire within `margin` seconds."""
+    if not creds.valid:
+        return True
+    # google-auth keeps expiry as naive UTC
+    return creds.expiry is not None and creds.expiry - datetime.utcnow() < timedelta(seconds=margin)
+
+
+def build_gmail_service(creds: Credentials):
+    """Build a Gmail service from the cached discovery document."""
+    import google_auth_httplib2
+    import httplib2
+    from googleapiclient.discovery import build_from_document
+    from googleapiclient.http import HttpRequest
+
+    def request_builder(http, *args, **kwargs):
+        # Fresh transport per request — services are shared across threads
+        return HttpRequest(
+            google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http()), *args, **kwargs
+        )
+
+    return build_from_document(
+        _gmail_discovery_doc(),
+        http=google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http()),
+        requestBuilder=request_builder,
+    )
+
+
+class GmailServiceCache:
+    """LRU of Gmail services keyed on (user id, credential version)."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._services: OrderedDict[tuple[str, str], object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str, creds: Credentials, version: str):
+        key = (user_id, version)
+        with self._lock:
+            service = self._services.get(key)
+            if service is not None:
+                self._services.move_to_end(key)
+                return service
+
+        service = build_gmail_service(creds)
+        with self._lock:
+            # Older credential versions of this user are dead weight
+            for stale in [k for k in self._services if k[0] == user_id]:
+                del self._services[stale]
+            self._services[key] = service
+            while len(self._services) > self.max_entries:
+                self._services.popitem(last=False)
+        return service
+
+    def clear(self):
+        with self._lock:
+            self._services.clear()
+
+
+class LocalTokenStore:
+    """
+    token.json credentials for local development.
+    The parsed file is kept in memory and only re-read when its mtime
+    changes; refreshed tokens are written back.
+    """
+
+    def __init__(self, token_path: str = "token.json", client_secret_path: str = "client_secret.json"):
+        self.token_path = token_path
+        self.client_secret_path = client_secret_path
+        self._creds: Credentials | None = None
+        self._version = ""
+        self._lock = threading.Lock()
+
+    def credentials(self, refresh_margin: float) -> tuple[Credentials, str]:
+        """Return (credentials, version), refreshing them if they are about to expire."""
+        with self._lock:
+            version = self._file_version()
+            if self._creds is None or version != self._version:
+                self._creds = (
+                    Credentials.from_authorized_user_file(self.token_path, GMAIL_SCOPES)
+                    if version else None
+                )
+                self._version = version
+
+            if self._creds is None:
+                self._creds = self._authorize()
+                self._save()
+            elif needs_refresh(self._creds, refresh_margin):
+                if self._creds.refresh_token:
+                    try:
+                        self._creds.refresh(Request())
+                        logger.info("Refreshed Gmail token (expires %s)", self._creds.expiry)
+                    except Exception as e:
+                        logger.warning("Gmail token refresh failed: %s", e)
+                        self._creds = self._authorize()
+                else:
+                    self._creds = self._authorize()
+                self._save()
+            return self._creds, self._version
+
+    def _file_version(self) -> str:
+        try:
+            return str(os.stat(self.token_path).st_mtime_ns)
+        except OSError:
+            return ""
+
+    def _authorize(self) -> Credentials:
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
+        if not os.path.exists(self.client_secret_path):
+            raise FileNotFoundError(
+                f"Missing '{self.client_secret_path}'. "
+                "Download it from Google Cloud Console."
+            )
+        flow = InstalledAppFlow.from_client_secrets_file(self.client_secret_path, GMAIL_SCOPES)
+        return flow.run_local_server(port=0)
+
+    def _save(self):
+        with open(self.token_path, "w") as f:
+            f.write(self._creds.to_json())
+        # Our own write must not look like a re-authorization
+        self._version = self._file_version()
+
+
+_service_cache = GmailServiceCache(max_entries=settings.GMAIL_SERVICE_CACHE_SIZE)
+_token_store = LocalTokenStore()
+_io_pool = ThreadPoolExecutor(max_workers=settings.GMAIL_IO_THREADS, thread_name_prefix="zia-gmail")
+
+
+async def run_gmail_io(fn, *args, **kwargs):
+    """Run a blocking Gmail call (e.g. `request.execute`) on the Gmail I/O pool."""
+    return await asyncio.get_running_loop().run_in_executor(_io_pool, partial(fn, *args, **kwargs))
+
+
+def get_gmail_service(user_id: str = ""):
+    """Return a cached Gmail service authorized from the local token.json."""
+    creds, version = _token_store.credentials(settings.GMAIL_REFRESH_MARGIN)
+    return _service_cache.get(user_id, creds, version)
+
+
+async def get_user_gmail_service(user_id: str = ""):
+    """
+    Return a cached Gmail service for `user_id`, authorized with the
+    user's stored OAuth tokens (app.services.credential_provider).
+    Without a user (CLI, local development), or while the user has no
+    stored Gmail tokens and a token.json exists, token.json is used instead.
+    """
+    if not user_id:
+        return await run_gmail_io(get_gmail_service)
+
+    from app.services.credential_provider import NotConnectedError, credential_provider
+
+    try:
+        creds, version = await credential_provider.google_credentials(user_id, "gmail")
+    except NotConnectedError:
+        # No connect flow stores Gmail tokens yet — keep serving token.json
+        if not os.path.exists(_token_store.token_path):
+            raise
+        return await run_gmail_io(get_gmail_service, user_id)
+    return _service_cache.get(user_id, creds, version)
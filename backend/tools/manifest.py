@@ -0,0 +1,155 @@
+"""
+Tool manifest — static schemas and import paths for every brain tool.
+
+This module must stay free of heavy imports (selenium, googleapiclient,
+…): the API builds its system prompt and validates arguments from these
+specs, and only imports a tool's module when the tool first runs.
+Tool classes read their name/description/parameters from here, so the
+schema is defined exactly once.
+"""
+
+from tools.base_tool import ToolSpec
+
+SEND_EMAIL = ToolSpec(
+    "tools.email_tool:EmailTool",
+    name="send_email",
+    description="Send an email using Gmail. Use this when the user wants to email someone.",
+    parameters={
+        "type": "object",
+        "properties": {
+            "recipient": {
+                "type": "string",
+                "description": "Email address of the recipient.",
+            },
+            "subject": {
+                "type": "string",
+                "description": "Email subject line.",
+            },
+            "body": {
+                "type": "string",
+                "description": "Full email body text.",
+            },
+        },
+        "required": ["recipient", "subject", "body"],
+        "additionalProperties": False,
+    },
+    risk_level="high",
+)
+
+READ_INBOX = ToolSpec(
+    "tools.email_tool:ReadInboxTool",
+    name="read_inbox",
+    description=(
+        "List recent emails (sender, subject, date) from the user's Gmail inbox. "
+        "Use this when the user asks to check mail or find an email."
+    ),
+    parameters={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Optional Gmail search query (e.g. 'from:alice is:unread').",
+            },
+            "limit": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": 25,
+                "description": "Maximum number of emails to return (default 10).",
+            },
+        },
+        "additionalProperties": False,
+    },
+)
+
+OPEN_FILE = ToolSpec(
+    "tools.os_tool:OpenFileTool",
+    name="open_file",
+    description=(
+        "Open a file or folder on the user's computer. "
+        "Use this when the user asks to open a directory, document, or application."
+    ),
+    parameters={
+        "type": "object",
+        "properties": {
+            "path": {
+                "type": "string",
+                "description": "Absolute path to the file or folder to open.",
+            },
+        },
+        "required": ["path"],
+        "additionalProperties": False,
+    },
+)
+
+LAUNCH_APP = ToolSpec(
+    "tools.os_tool:LaunchAppTool",
+    name="launch_app",
+    description=(
+        "Launch a Windows application by name. "
+        "Use this when the user asks to open an app like Notepad, Calculator, etc."
+    ),
+    parameters={
+        "type": "object",
+        "properties": {
+            "app_name": {
+                "type": "string",
+                "description": "Name of the application to launch (e.g. 'notepad', 'calc', 'explorer').",
+            },
+        },
+        "required": ["app_name"],
+        "additionalProperties": False,
+    },
+    risk_level="medium",
+)
+
+PLAY_YOUTUBE = ToolSpec(
+    "tools.browser_tool:YouTubeTool",
+    name="play_youtube",
+    description=(
+        "Search and play a video on YouTube. "
+        "Use this when the user asks to play music, a video, or search YouTube."
+    ),
+    parameters={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query for YouTube (e.g. 'lofi hip hop radio').",
+            },
+        },
+        "required": ["query"],
+        "additionalProperties": False,
+    },
+)
+
+YOUTUBE_CONTROL = ToolSpec(
+    "tools.browser_tool:YouTubeControlTool",
+    name="youtube_control",
+    description=(
+        "Control YouTube playback in the current browser session. "
+        "Use this when the user says 'next song', 'skip', 'pause', 'resume', "
+        "'previous', 'next track', or similar media control commands."
+    ),
+    parameters={
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": ["next", "pause", "resume", "previous"],
+                "description": "The playback action: next, pause, resume, or previous.",
+            },
+        },
+        "required": ["action"],
+        "additionalProperties": False,
+    },
+)
+
+# Registration order = order in the system prompt
+BRAIN_TOOLS: list[ToolSpec] = [
+    SEND_EMAIL,
+    READ_INBOX,
+    OPEN_FILE,
+    LAUNCH_APP,
+    PLAY_YOUTUBE,
+    YOUTUBE_CONTROL,
+]
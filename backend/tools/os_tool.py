@@ -8,26 +8,17 @@ import subprocess
 from pathlib import Path
 
 from tools.base_tool import BaseTool
+from tools.manifest import OPEN_FILE, LAUNCH_APP
 from core.config import settings
 
 
 class OpenFileTool(BaseTool):
-    name = "open_file"
-    description = (
-        "Open a file or folder on the user's computer. "
-        "Use this when the user asks to open a directory, document, or application."
-    )
-    parameters = {
-        "type": "object",
-        "properties": {
-            "path": {
-                "type": "string",
-                "description": "Absolute path to the file or folder to open.",
-            },
-        },
-        "required": ["path"],
-        "additionalProperties": False,
-    }
+    name = OPEN_FILE.name
+    description = OPEN_FILE.description
+    parameters = OPEN_FILE.parameters
+    risk_level = OPEN_FILE.risk_level
+
+    timeout = 10.0
 
     def execute(self, *, path: str) -> dict:
         resolved = Path(path).resolve()
@@ -51,22 +42,12 @@ class OpenFileTool(BaseTool):
 
 
 class LaunchAppTool(BaseTool):
-    name = "launch_app"
-    description = (
-        "Launch a Windows application by name. "
-        "Use this when the user asks to open an app like Notepad, Calculator, etc."
-    )
-    parameters = {
-        "type": "object",
-        "properties": {
-            "app_name": {
-                "type": "string",
-                "description": "Name of the application to launch (e.g. 'notepad', 'calc', 'explorer').",
-            },
-        },
-        "required": ["app_name"],
-        "additionalProperties": False,
-    }
+    name = LAUNCH_APP.name
+    description = LAUNCH_APP.description
+    parameters = LAUNCH_APP.parameters
+    risk_level = LAUNCH_APP.risk_level
+
+    timeout = 10.0
 
     # Allowed executables — SAFE GUI APPS ONLY.
     # No shells, terminals, or command interpreters.
@@ -0,0 +1,131 @@
+"""
+Tool result cache for Zia AI.
+
+Tools opt in by declaring `cacheable`, `cache_key_args` and `cache_ttl`
+(see BaseTool). Results are kept in an in-process LRU and, when a Redis
+URL is given, shared across API workers.
+
+Invalidation is generation-based: every (user, tool) pair has a counter
+that is part of the cache key. Bumping it makes all older entries for
+that pair unreachable at once, without scanning keys. With Redis the
+counter lives in Redis so an invalidation in one worker is seen by all.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import redis
+
+logger = logging.getLogger("zia.tools.cache")
+
+
+class ToolResultCache:
+    """In-process LRU with optional Redis sharing and per-user invalidation."""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        redis_url: str | None = None,
+        namespace: str = "zia:toolcache",
+    ):
+        self.max_entries = max_entries
+        self.namespace = namespace
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._generations: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._redis = redis.Redis.from_url(redis_url, decode_responses=True) if redis_url else None
+
+    @property
+    def shared(self) -> bool:
+        """True when lookups may touch Redis (i.e. perform network I/O)."""
+        return self._redis is not None
+
+    # ── Keys ──
+
+    def key_for(self, tool_name: str, arguments: dict[str, Any], key_args: tuple[str, ...],
+                user_id: str) -> str:
+        """Build the cache key for a call; `key_args=()` means all arguments."""
+        relevant = {k: arguments.get(k) for k in key_args} if key_args else arguments
+        digest = hashlib.sha256(
+            json.dumps(relevant, sort_keys=True, default=str).encode()
+        ).hexdigest()[:32]
+        generation = self._generation(tool_name, user_id)
+        return f"{self.namespace}:{user_id or '-'}:{tool_name}:{generation}:{digest}"
+
+    def _generation(self, tool_name: str, user_id: str) -> int:
+        if self._redis is not None:
+            try:
+                return int(self._redis.get(self._gen_key(tool_name, user_id)) or 0)
+            except redis.RedisError as e:
+                logger.warning("Tool cache: Redis unavailable, using local state: %s", e)
+        return self._generations.get((user_id, tool_name), 0)
+
+    def _gen_key(self, tool_name: str, user_id: str) -> str:
+        return f"{self.namespace}:gen:{user_id or '-'}:{tool_name}"
+
+    # ── Get / Set ──
+
+    def get(self, key: str) -> dict | None:
+        """Return a cached result or None."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > now:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+        if self._redis is not None:
+            try:
+                # Value and remaining TTL in one round trip
+                raw, ttl = self._redis.pipeline().get(key).pttl(key).execute()
+            except redis.RedisError as e:
+                logger.warning("Tool cache: Redis get failed: %s", e)
+                return None
+            if raw is not None:
+                value = json.loads(raw)
+                if ttl and ttl > 0:
+                    self._store_local(key, value, ttl / 1000)
+                return value
+        return None
+
+    def set(self, key: str, value: dict, ttl: float):
+        """Cache a result for `ttl` seconds."""
+        self._store_local(key, value, ttl)
+        if self._redis is not None:
+            try:
+                self._redis.set(key, json.dumps(value, default=str), px=int(ttl * 1000))
+            except redis.RedisError as e:
+                logger.warning("Tool cache: Redis set failed: %s", e)
+
+    def _store_local(self, key: str, value: dict, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # ── Invalidation ──
+
+    def invalidate(self, tool_name: str, user_id: str = ""):
+        """Drop every cached result of `tool_name` for `user_id`."""
+        with self._lock:
+            pair = (user_id, tool_name)
+            self._generations[pair] = self._generations.get(pair, 0) + 1
+        if self._redis is not None:
+            try:
+                self._redis.incr(self._gen_key(tool_name, user_id))
+            except redis.RedisError as e:
+                logger.warning("Tool cache: Redis invalidate failed: %s", e)
+        logger.info("Invalidated cached %s results (user=%s)", tool_name, user_id or "-")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,129 @@
+"""
+YouTube page helpers shared by tools.browser_tool and BrowserExecutor.
+
+Playing a query resolves the video id over HTTP (tools.youtube_resolver)
+and loads the watch page directly; the search page is only rendered if
+resolution fails. Every interaction waits on a condition (element
+clickable, <video> readyState) with a per-step deadline instead of
+sleeping a fixed amount, and media commands run as a single in-page
+script. Each step's duration is recorded in BROWSER_STEP_LATENCY so real
+page latency is visible.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from app.middleware.metrics import BROWSER_STEP_LATENCY
+from core.config import settings
+from tools.youtube_resolver import get_youtube_resolver
+
+logger = logging.getLogger("zia.tools.youtube")
+
+# HTMLMediaElement.readyState: 2 = HAVE_CURRENT_DATA (a frame is ready to play)
+_VIDEO_READY_JS = "const v = document.querySelector('video'); return !!v && v.readyState >= 2;"
+
+# arguments[0] = next | previous | pause | resume. Uses the player API
+# (movie_player.nextVideo/previousVideo) and falls back to YouTube's
+# Shift+N / Shift+P shortcuts. Pause/resume never toggle blindly.
+_MEDIA_COMMAND_JS = """
+const action = arguments[0];
+if (!location.hostname.endsWith('youtube.com')) {
+  return {error: 'No YouTube session active. Use play_youtube first.'};
+}
+const video = document.querySelector('video');
+if (!video) return {error: 'No video element found on page.'};
+const player = document.getElementById('movie_player');
+let status;
+if (action === 'pause' || action === 'resume') {
+  const wantPaused = action === 'pause';
+  if (video.paused === wantPaused) {
+    status = wantPaused ? 'Already paused' : 'Already playing';
+  } else {
+    if (wantPaused) { video.pause(); } else { video.play().catch(() => {}); }
+    status = wantPaused ? 'Paused playback' : 'Resumed playback';
+  }
+} else {
+  const next = action === 'next';
+  const api = next ? 'nextVideo' : 'previousVideo';
+  if (player && typeof player[api] === 'function') {
+    player[api]();
+  } else {
+    const key = next ? 'N' : 'P';
+    document.dispatchEvent(new KeyboardEvent('keydown', {
+      key: key, code: 'Key' + key, shiftKey: true, bubbles: true,
+    }));
+  }
+  status = next ? 'Skipped to next video' : 'Went to previous video';
+}
+return {status: status, paused: video.paused, title: document.title.replace(/ - YouTube$/, '')};
+"""
+
+
+@contextmanager
+def timed_step(step: str):
+    """Record how long a browser step took and whether it met its deadline."""
+    start = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except TimeoutException:
+        outcome = "timeout"
+        raise
+    except Exception:
+        outcome = "error"
+        raise
+    finally:
+        BROWSER_STEP_LATENCY.labels(step, outcome).observe(time.perf_counter() - start)
+
+
+def wait_for(driver, condition, step: str, timeout: float | None = None):
+    """Wait until `condition(driver)` is truthy, within the step deadline."""
+    with timed_step(step):
+        return WebDriverWait(driver, timeout or settings.BROWSER_STEP_TIMEOUT).until(condition)
+
+
+def play_first_result(driver, query: str) -> bool:
+    """
+    Play the first YouTube result for `query`.
+    Returns True once the video has data to play, False if it is still
+    loading at the deadline. Raises TimeoutException if the search page
+    fallback shows no result.
+    """
+    resolver = get_youtube_resolver()
+    with timed_step("resolve"):
+        video_id = resolver.resolve(query)
+
+    if video_id is not None:
+        with timed_step("watch_load"):
+            driver.get(resolver.watch_url(video_id))
+    else:
+        with timed_step("search_load"):
+            driver.get(resolver.search_url(query))
+        first_video = wait_for(
+            driver, EC.element_to_be_clickable((By.ID, "video-title")), "first_result"
+        )
+        first_video.click()
+
+    try:
+        wait_for(driver, lambda d: d.execute_script(_VIDEO_READY_JS), "video_ready")
+        return True
+    except TimeoutException:
+        logger.warning("Video for %r not ready within %ss", query, settings.BROWSER_STEP_TIMEOUT)
+        return False
+
+
+def run_media_command(driver, action: str) -> dict:
+    """
+    Run a playback command (next, previous, pause, resume) in one
+    execute_script round trip: the script checks the page, reads the
+    player state, acts, and returns the new state.
+    """
+    with timed_step("media_command"):
+        result = driver.execute_script(_MEDIA_COMMAND_JS, action)
+    return result or {"error": "Media command returned no result."}
@@ -0,0 +1,104 @@
+"""
+YouTube query → video id resolution over plain HTTP.
+
+Fetching the search results HTML with a pooled httpx client and pulling
+the first "videoId" out of it is far cheaper than rendering the results
+page in Chrome and clicking. Results are cached per query for
+YOUTUBE_RESOLVE_TTL seconds. The base URL is configurable
+(YOUTUBE_BASE_URL) so the resolver can run against a local stub server.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import quote_plus
+
+import httpx
+
+from core.config import settings
+
+logger = logging.getLogger("zia.tools.youtube_resolver")
+
+# First video renderer in ytInitialData; falls back to plain watch links
+_VIDEO_ID_RE = re.compile(r'"videoId":"([A-Za-z0-9_-]{11})"|/watch\?v=([A-Za-z0-9_-]{11})')
+
+
+class YouTubeResolver:
+    """Resolve search queries to video ids with a pooled client and a TTL cache."""
+
+    def __init__(
+        self,
+        base_url: str = "https://www.youtube.com",
+        ttl: float = 3600.0,
+        timeout: float = 5.0,
+        max_entries: int = 256,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._client = httpx.Client(
+            timeout=timeout,
+            follow_redirects=True,
+            headers={"Accept-Language": "en-US,en;q=0.9", "User-Agent": "Mozilla/5.0"},
+            cookies={"CONSENT": "YES+1"},  # skip the EU consent interstitial
+        )
+        self._cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def search_url(self, query: str) -> str:
+        return f"{self.base_url}/results?search_query={quote_plus(query)}"
+
+    def watch_url(self, video_id: str) -> str:
+        return f"{self.base_url}/watch?v={video_id}"
+
+    def resolve(self, query: str) -> str | None:
+        """Return the first result's video id, or None if it can't be resolved."""
+        key = query.strip().lower()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._cache.move_to_end(key)
+                return entry[1]
+
+        try:
+            response = self._client.get(self.search_url(query))
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning("YouTube search for %r failed: %s", query, e)
+            return None
+
+        match = _VIDEO_ID_RE.search(response.text)
+        if match is None:
+            logger.warning("No video id in YouTube results for %r", query)
+            return None
+        video_id = match.group(1) or match.group(2)
+
+        with self._lock:
+            self._cache[key] = (now + self.ttl, video_id)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return video_id
+
+    def close(self):
+        self._client.close()
+
+
+_resolver: YouTubeResolver | None = None
+_resolver_lock = threading.Lock()
+
+
+def get_youtube_resolver() -> YouTubeResolver:
+    """Return the process-wide resolver, created from settings on first use."""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = YouTubeResolver(
+                    base_url=settings.YOUTUBE_BASE_URL,
+                    ttl=settings.YOUTUBE_RESOLVE_TTL,
+                )
+    return _resolver